@@ -16,7 +16,17 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
-"""Main Module."""
+"""Main Module.
+
+Usage:
+    python -m mlops_lab [rebuild | compact]
+
+    rebuild: Resets and rebuilds the databases. This is the default.
+    compact: Reclaims space held by superseded and deleted objects in the object database and
+        reports the space saved by column deduplication.
+"""
+import argparse
+
 from dependency_injector.wiring import Provide, inject
 from dependency_injector.providers import Factory
 
@@ -119,6 +129,23 @@ def build_object_db(odb: Factory[ODBA] = Provide[mlops_lab.dba.object]) -> None:
     assert odb.exists()
 
 
+# ------------------------------------------------------------------------------------------------ #
+@inject
+def compact_odb(odb: ODBA = Provide[mlops_lab.dba.object]) -> dict:
+    report = odb.compact()
+    print(
+        f"Compacted {report['entities']:,} objects in {report['duration']} seconds. "
+        f"Reclaimed {report['reclaimed']:,} of {report['size_before']:,} bytes, "
+        f"including {report['blocks_collected']:,} unreferenced column blocks."
+    )
+    dedup = odb.dedup_report()
+    print(
+        f"{dedup['references']:,} column references share {dedup['blocks']:,} blocks. "
+        f"Deduplication saves {dedup['saved_bytes']:,} of {dedup['logical_bytes']:,} bytes."
+    )
+    return report
+
+
 # ------------------------------------------------------------------------------------------------ #
 def reset():
     reset_edb()
@@ -142,16 +169,23 @@ def rebuild():
 
 # ------------------------------------------------------------------------------------------------ #
 def wireup():
-    mlops_lab = mlops_lab()
-    mlops_lab.core.init_resources()
-    mlops_lab.wire(modules=[__name__])
+    container = mlops_lab()
+    container.core.init_resources()
+    container.wire(modules=[__name__])
 
 
 # ------------------------------------------------------------------------------------------------ #
 def main():
+    parser = argparse.ArgumentParser(prog="mlops_lab")
+    parser.add_argument("command", nargs="?", default="rebuild", choices=["rebuild", "compact"])
+    args = parser.parse_args()
+
     wireup()
-    reset()
-    rebuild()
+    if args.command == "compact":
+        compact_odb()
+    else:
+        reset()
+        rebuild()
 
 
 # ------------------------------------------------------------------------------------------------ #
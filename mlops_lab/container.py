@@ -43,10 +43,20 @@ class mlops_lab(containers.DeclarativeContainer):
         ConnectionContainer,
         mlops_lab_database=config.databases.mlops_lab,
         events_database=config.databases.events,
+        rdb_backend=config.relational_database.backend,
+        rdb_location=config.relational_database.location,
+        odb_backend=config.object_database.backend,
+        odb_persistent=config.object_database.persistent,
+        odb_codec=config.object_database.codec,
+        odb_shards=config.object_database.shards,
+        odb_dedup=config.object_database.dedup,
+        pool=config.connection_pool,
     )
 
     database = providers.Container(
         DatabaseContainer,
+        odb_cache_capacity=config.object_database.cache.capacity,
+        odb_write_behind=config.object_database.write_behind,
         dbms_connection=connection.dbms_connection,
         rdb_connection=connection.rdb_connection,
         edb_connection=connection.edb_connection,
@@ -59,7 +69,12 @@ class mlops_lab(containers.DeclarativeContainer):
 
     dal = providers.Container(DALContainer, rdb=database.rdb, edb=database.edb, odb=database.odb)
 
-    context = providers.Container(ContextContainer, dal=dal)
+    context = providers.Container(
+        ContextContainer,
+        dal=dal,
+        dto_cache_capacity=config.dto_cache.capacity,
+        dto_cache_ttl=config.dto_cache.ttl,
+    )
 
     entities = providers.Container(EntityRepoContainer, context=context)
 
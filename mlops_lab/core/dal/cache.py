@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/dal/cache.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 08:03:17 pm                                              #
+# Modified   : Saturday October 17th 2026 08:03:17 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Read Cache for Data Transfer Objects."""
+import copy
+import time
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Union
+
+from mlops_lab.core.dal.dto import DTO
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          DTO CACHE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class DTOCache:
+    """Least recently used cache of the data transfer objects read by data access objects.
+
+    DTOs are keyed by table and id, and may be looked up by table and name. Entries expire after
+    the time to live, bounding the staleness of rows changed other than through the data access
+    objects sharing the cache. Data access objects invalidate the entries of the rows they
+    write. DTOs are copied into and out of the cache, so changes to a DTO read are not visible to
+    other readers.
+
+    Args:
+        capacity (int): Maximum number of DTOs cached. Zero disables the cache.
+        ttl (float): Seconds for which a DTO is served from the cache. None for no expiry.
+    """
+
+    __caches = weakref.WeakSet()
+
+    def __init__(self, capacity: int = 10000, ttl: float = 60.0) -> None:
+        self._capacity = capacity
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._names = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        DTOCache.__caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def stats(self) -> dict:
+        """Returns the cache counters, hit rate, and current occupancy."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "capacity": self._capacity,
+                "ttl": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def get(self, table: str, id: int = None, name: str = None) -> Union[DTO, None]:
+        """Returns a copy of the cached DTO with the designated id or name, or None."""
+        with self._lock:
+            if id is None:
+                id = self._names.get((table, name))
+            entry = self._entries.get((table, id))
+            if entry is None:
+                self._misses += 1
+                return None
+            dto, expires = entry
+            if expires is not None and time.monotonic() > expires:
+                self._remove((table, id))
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end((table, id))
+            self._hits += 1
+            return copy.copy(dto)
+
+    def put(self, table: str, dto: DTO) -> None:
+        """Caches a copy of the DTO, evicting least recently used DTOs as required."""
+        if self._capacity <= 0 or dto.id is None:
+            return
+        expires = None if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._remove((table, dto.id))
+            self._entries[(table, dto.id)] = (copy.copy(dto), expires)
+            self._names[(table, dto.name)] = dto.id
+            while len(self._entries) > self._capacity:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, table: str, id: int = None, name: str = None) -> None:
+        """Removes the DTO with the designated id, and any DTO cached under the name."""
+        with self._lock:
+            if name is not None:
+                named = self._names.pop((table, name), None)
+                if named is not None and self._remove((table, named)):
+                    self._invalidations += 1
+            if id is not None and self._remove((table, id)):
+                self._invalidations += 1
+
+    def clear(self, table: str = None) -> None:
+        """Removes the DTOs of the designated table, or all DTOs."""
+        with self._lock:
+            keys = [key for key in self._entries if table is None or key[0] == table]
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+        msg = f"Cleared {len(keys)} DTOs from the cache."
+        self._logger.debug(msg)
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Removes the DTOs of every cache in the process, e.g. once tables are dropped, after
+        which ids are reused."""
+        for cache in list(cls.__caches):
+            cache.clear()
+
+    def _remove(self, key: tuple) -> bool:
+        """Removes an entry and its name. Called holding the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        name_key = (key[0], entry[0].name)
+        if self._names.get(name_key) == key[1]:
+            del self._names[name_key]
+        return True
@@ -19,10 +19,15 @@
 """Data Layer Services associated with Database construction."""
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Iterator, Union
+import time
 import logging
 
+import pandas as pd
+import pymysql
+
 from mlops_lab.core.database.relational import Database
+from mlops_lab.core.database.stream import RowStream
 from mlops_lab.core.dal.dto import (
     DTO,
     DataFrameDTO,
@@ -36,6 +41,7 @@ from mlops_lab.core.dal.dto import (
     EventDTO,
 )
 from mlops_lab.core.dal.sql.base import DML
+from mlops_lab.core.dal.cache import DTOCache
 from mlops_lab.core.entity.base import Entity
 
 
@@ -50,12 +56,16 @@ class DAO(ABC):
     Args:
         database (Database): Relational database object.
         dml (DML, database: Database): The Data Manipulation Language for the database.
+        cache (DTOCache): Optional read-through cache of the DTOs read by id and name. DTOs read
+            while a transaction is in progress are not cached, as they may not be committed.
     """
 
-    def __init__(self, dml: DML, database: Database) -> None:
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
         self._dml = dml
         self._entity = dml.entity
         self._database = database
+        self._cache = cache
+        self._table = self._entity.__name__.lower()
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
@@ -72,10 +82,33 @@ class DAO(ABC):
         """
         cmd = self._dml.insert(dto)
         dto.id = self._database.insert(cmd.sql, cmd.args)
+        self._invalidate(name=dto.name)
         msg = f"{self.__class__.__name__} inserted {self._entity.__name__}.{dto.id} - {dto.name} into database at {id(self._database)}."
         self._logger.debug(msg)
         return dto
 
+    def create_many(self, dtos: List[DTO], batch_size: int = 1000) -> List[DTO]:
+        """Adds entities in the form of data transfer objects to the database, inserting up to
+        batch_size rows per statement.
+
+        Args:
+            dtos (List[DTO]): Entity data transfer objects.
+            batch_size (int): Maximum number of rows inserted per statement. Default is 1000.
+
+        Returns: the dtos with the assigned ids, in order.
+        """
+        dtos = list(dtos)
+        for i in range(0, len(dtos), batch_size):
+            batch = dtos[i : i + batch_size]
+            cmd = self._dml.insert_many([self._dml.insert(dto) for dto in batch])
+            ids = self._database.insert_many(cmd.sql, cmd.args)
+            for dto, rowid in zip(batch, ids):
+                dto.id = rowid
+                self._invalidate(name=dto.name)
+        msg = f"{self.__class__.__name__} inserted {len(dtos)} {self._entity.__name__} rows into database at {id(self._database)}."
+        self._logger.debug(msg)
+        return dtos
+
     def read(self, id: int) -> Entity:
         """Obtains an entity DTO with the designated id.
 
@@ -84,11 +117,15 @@ class DAO(ABC):
 
         Returns a DTO
         """
+        result = self._cache.get(self._table, id=id) if self._cache is not None else None
+        if result is not None:
+            return result
         result = []
         cmd = self._dml.select(id)
         row = self._database.select(cmd.sql, cmd.args)
         if row is not None:
             result = self._row_to_dto(row)
+            self._put(result)
         return result
 
     def read_by_name(self, name: str) -> DTO:
@@ -97,11 +134,15 @@ class DAO(ABC):
             name (str): The name assigned to the entity.
         Returns a Data Transfer Object (DTO)
         """
+        result = self._cache.get(self._table, name=name) if self._cache is not None else None
+        if result is not None:
+            return result
         result = []
         cmd = self._dml.select_by_name(name)
         row = self._database.select(cmd.sql, cmd.args)
         if row is not None:
             result = self._row_to_dto(row)
+            self._put(result)
         return result
 
     def read_all(self) -> Dict[int, DTO]:
@@ -113,6 +154,33 @@ class DAO(ABC):
             result = self._rows_to_dict(rows)
         return result
 
+    def iter_all(self, batch_size: int = 1000, keyset: bool = True) -> Iterator[DTO]:
+        """Yields the entity data transfer objects in the database, in constant memory.
+
+        Args:
+            batch_size (int): Number of rows read from the database at a time. Default is 1000.
+            keyset (bool): If True, the default, rows are read in pages of batch_size rows, each
+                selecting the rows with ids after the last id of the previous page, so the
+                connection is free for other queries between pages. Otherwise, rows are streamed
+                from a single query through an unbuffered cursor, holding the connection until
+                the iteration completes.
+        """
+        if not keyset:
+            cmd = self._dml.select_all()
+            for row in self._database.select_stream(cmd.sql, cmd.args, batch_size=batch_size):
+                yield self._row_to_dto(row)
+            return
+
+        last_id = 0
+        while True:
+            cmd = self._dml.select_page(self._dml.select_all(), last_id=last_id, limit=batch_size)
+            rows = self._database.select_all(cmd.sql, cmd.args)
+            for row in rows:
+                yield self._row_to_dto(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
     def read_by_parent_oid(self, parent_oid: str) -> Dict[int, DTO]:
         """Returns a dictionary of entity data transfer objects with the designated parent id.
 
@@ -134,22 +202,38 @@ class DAO(ABC):
     def update(self, dto: DTO) -> int:
         """Performs an update to an existing entity DTO
 
+        The update is conditional on the entity's id in a single statement. An entity is not found
+        if no row matched.
+
         Args:
             dto (DTO): Data Transfer Object
 
         Returns number of rows effected.
         """
-        rows_affected = None
-        if self.exists(dto.id):
-            cmd = self._dml.update(dto)
-            rows_affected = self._database.update(cmd.sql, cmd.args)
-
-        else:
+        cmd = self._dml.update(dto)
+        rows_affected = self._database.update(cmd.sql, cmd.args)
+        self._invalidate(id=dto.id, name=dto.name)
+        if not rows_affected:
             msg = f"{self.__class__.__name__} was unable to update {self._entity.__name__}.{dto.id}. Not found in {self._database.database}. Try insert instead."
             self._logger.error(msg)
             raise FileNotFoundError(msg)
         return rows_affected
 
+    def upsert(self, dto: DTO) -> DTO:
+        """Adds an entity, or updates the existing entity of the same name, in one statement.
+
+        Args:
+            dto (DTO): An entity data transfer object.
+
+        Returns: the dto with the id of the row inserted or updated.
+        """
+        cmd = self._dml.upsert(self._dml.insert(dto))
+        dto.id = self._database.upsert(cmd.sql, cmd.args)
+        self._invalidate(id=dto.id, name=dto.name)
+        msg = f"{self.__class__.__name__} upserted {self._entity.__name__}.{dto.id} - {dto.name} into database at {id(self._database)}."
+        self._logger.debug(msg)
+        return dto
+
     def exists(self, id: int) -> bool:
         """Returns True if the entity with id exists in the database.
 
@@ -160,16 +244,42 @@ class DAO(ABC):
         result = self._database.exists(cmd.sql, cmd.args)
         return result
 
+    def exists_many(self, ids: list) -> list:
+        """Returns the ids of those designated that exist in the database, in a single query.
+
+        Args:
+            ids (list): ids for the entities
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        cmd = self._dml.exists_many(self._dml.select_all(), ids=ids)
+        existing = set(self._database.exists_many(cmd.sql, cmd.args))
+        return [id for id in ids if id in existing]
+
+    def count(self, **filters) -> int:
+        """Returns the number of entities in the database, counted by the database.
+
+        Args:
+            **filters: Column values the entities counted must hold, e.g. stage='raw'.
+        """
+        cmd = self._dml.count(self._dml.select_all(), filters=filters)
+        return self._database.count(cmd.sql, cmd.args)
+
     def delete(self, id: int, persist=True) -> None:
         """Deletes a Entity from the registry, given an id.
+
+        The delete is conditional on the id in a single statement. An entity is not found if no
+        row was deleted.
+
         Args:
             id (int): The id for the entity to delete.
 
         """
-        if self.exists(id):
-            cmd = self._dml.delete(id)
-            self._database.delete(cmd.sql, cmd.args)
-        else:
+        cmd = self._dml.delete(id)
+        deleted = self._database.delete(cmd.sql, cmd.args)
+        self._invalidate(id=id)
+        if not deleted:
             msg = f"{self.__class__.__name__}  was unable to delete {self._entity.__name__}.{id}. Not found in {self._database.database}."
             self._logger.error(msg)
             raise FileNotFoundError(msg)
@@ -182,6 +292,110 @@ class DAO(ABC):
         """
         cmd = self._dml.load(filepath)
         self._database.load(cmd.sql, cmd.args)
+        if self._cache is not None:
+            self._cache.clear(self._table)
+
+    def bulk_load(
+        self, data: Union[List[DTO], pd.DataFrame], batch_size: int = 1000, threshold: int = 10000
+    ) -> dict:
+        """Inserts the rows of DTOs or a DataFrame without writing a file.
+
+        Loads of fewer than threshold rows are inserted batch_size rows per statement with
+        multi-row INSERTs, and DTOs are assigned their ids. Larger loads are streamed to the
+        server by LOAD DATA through an in-memory buffer, which is faster for large volumes, but
+        does not assign ids.
+
+        Either way, the load fails if a row collides with an existing row on a unique key. The
+        load is made in a transaction, which is rolled back if the load fails, so no row is
+        loaded. If a transaction is in progress, the load is made in it, and the caller rolls
+        it back.
+
+        Args:
+            data (Union[List[DTO], pd.DataFrame]): DTOs, or a DataFrame with a column for each
+                column of the entity's insert command. NaN, NaT and None are NULL.
+            batch_size (int): Rows per multi-row INSERT. Default is 1000.
+            threshold (int): Rows from which LOAD DATA is used. Default is 10000.
+
+        Returns: a dictionary of the method, i.e. 'insert' or 'load', the rows loaded, the seconds
+            taken, and the rows loaded per second.
+
+        Raises:
+            ValueError if the DataFrame lacks a column of the entity's insert command.
+            IntegrityError if a row collides with an existing row on a unique key.
+        """
+        started = time.perf_counter()
+        if isinstance(data, pd.DataFrame):
+            rows, dtos = self._get_rows(data), None
+        else:
+            dtos = list(data)
+            rows = (self._dml.insert(dto).args for dto in dtos)
+        n = len(data) if dtos is None else len(dtos)
+        method = "insert" if n < threshold else "load"
+
+        transaction = not self._database.in_transaction
+        if transaction:
+            self._database.begin()
+        try:
+            if method == "insert" and dtos is not None:
+                self.create_many(dtos, batch_size=batch_size)
+            elif method == "insert":
+                rows = list(rows)
+                for i in range(0, n, batch_size):
+                    batch = rows[i : i + batch_size]
+                    cmd = self._dml.insert_rows(command=self._dml.insert, rows=batch)
+                    self._database.insert_many(cmd.sql, cmd.args)
+            else:
+                stream = RowStream(rows)
+                cmd = self._dml.load_rows(command=self._dml.insert, filename=stream.filepath)
+                # LOAD DATA LOCAL skips rows colliding with existing rows rather than failing.
+                skipped = n - self._database.load_stream(cmd.sql, stream, cmd.args)
+                if skipped:
+                    msg = f"{self.__class__.__name__} was unable to bulk load {self._entity.__name__} rows. {skipped} rows collide with existing rows."  # noqa 501
+                    self._logger.error(msg)
+                    raise pymysql.err.IntegrityError(1062, msg)
+            if transaction:
+                self._database.save()
+        except BaseException:
+            if transaction:
+                self._database.rollback()
+                for dto in dtos or []:
+                    dto.id = None
+            raise
+        finally:
+            if self._cache is not None and (dtos is None or method == "load"):
+                self._cache.clear(self._table)
+
+        seconds = time.perf_counter() - started
+        report = {
+            "method": method,
+            "rows": n,
+            "seconds": seconds,
+            "rows_per_sec": n / seconds if seconds else 0.0,
+        }
+        msg = f"{self.__class__.__name__} bulk loaded {n} {self._entity.__name__} rows by {method} in {round(seconds, 3)} seconds ({round(report['rows_per_sec']):,} rows/sec)."  # noqa 501
+        self._logger.info(msg)
+        return report
+
+    def _get_rows(self, data: pd.DataFrame) -> Iterator[tuple]:
+        """Returns the rows of a DataFrame in the column order of the insert command, with NULLs
+        as None."""
+        statement = self._dml.insert.sql.strip().split(" VALUES ", 1)[0]
+        columns = [column.strip() for column in statement.split("(", 1)[1].rstrip(") ").split(",")]
+        missing = [column for column in columns if column not in data.columns]
+        if missing:
+            msg = f"DataFrame lacks columns {missing} of the {self._entity.__name__} table."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        data = data[columns].astype(object)
+        return data.where(data.notna(), None).itertuples(index=False, name=None)
+
+    def _put(self, dto: DTO) -> None:
+        if self._cache is not None and not self._database.in_transaction:
+            self._cache.put(self._table, dto)
+
+    def _invalidate(self, id: int = None, name: str = None) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(self._table, id=id, name=name)
 
     def _rows_to_dict(self, results: List) -> Dict:
         """Converts the results to a dictionary of DTO objects."""
@@ -200,8 +414,8 @@ class DAO(ABC):
 #                                 DATAFRAME DATA ACCESS OBJECT                                     #
 # ------------------------------------------------------------------------------------------------ #
 class DataFrameDAO(DAO):
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> DataFrameDTO:
         try:
@@ -235,8 +449,8 @@ class DataFrameDAO(DAO):
 #                                 DATASET DATA ACCESS OBJECT                                       #
 # ------------------------------------------------------------------------------------------------ #
 class DatasetDAO(DAO):
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> DataFrameDTO:
         try:
@@ -268,8 +482,8 @@ class DatasetDAO(DAO):
 class ProfileDAO(DAO):
     """Profile for Tasks"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> ProfileDTO:
         try:
@@ -319,8 +533,8 @@ class ProfileDAO(DAO):
 class TaskDAO(DAO):
     """Task Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> TaskDTO:
         try:
@@ -351,8 +565,8 @@ class TaskDAO(DAO):
 class DAGDAO(DAO):
     """DAG Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> DAGDTO:
         try:
@@ -382,8 +596,8 @@ class DAGDAO(DAO):
 class FileDAO(DAO):
     """File Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> FileDTO:
         try:
@@ -417,8 +631,8 @@ class FileDAO(DAO):
 class DataSourceDAO(DAO):
     """File Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> FileDTO:
         try:
@@ -448,8 +662,8 @@ class DataSourceDAO(DAO):
 class DataSourceURLDAO(DAO):
     """File Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> FileDTO:
         try:
@@ -480,8 +694,8 @@ class DataSourceURLDAO(DAO):
 class EventDAO(DAO):
     """File Data Access Object"""
 
-    def __init__(self, dml: DML, database: Database) -> None:
-        super().__init__(dml=dml, database=database)
+    def __init__(self, dml: DML, database: Database, cache: DTOCache = None) -> None:
+        super().__init__(dml=dml, database=database, cache=cache)
 
     def _row_to_dto(self, row: Tuple) -> EventDTO:
         try:
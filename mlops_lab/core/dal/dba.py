@@ -23,6 +23,7 @@ import logging
 from mlops_lab.core.database.relational import Database
 from mlops_lab.core.database.object import ObjectDB
 from mlops_lab.core.dal.sql.base import DDL, ODL
+from mlops_lab.core.dal.cache import DTOCache
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -61,36 +62,92 @@ class DBA(AbstractDBA):
         super().__init__(ddl=ddl, database=database)
 
     def create(self) -> None:
-        """Creates a database or table."""
-        self._database.connect()
+        """Creates a database or table, and the table's indexes.
 
-        self._database.create(sql=self._ddl.create.sql, args=self._ddl.create.args)
-        msg = self._ddl.create.description
-        self._logger.info(msg)
+        Indexes that do not exist are created, and the existence of all of the table's indexes
+        is verified.
 
-        self._database.save()
-        self._database.close()
+        Raises: RuntimeError if an index does not exist once created.
+        """
+        self._database.connect()
+        try:
+            self._database.create(sql=self._ddl.create.sql, args=self._ddl.create.args)
+            msg = self._ddl.create.description
+            self._logger.info(msg)
+
+            for index in self._ddl.indexes:
+                if not self._database.exists(sql=index.exists.sql, args=index.exists.args):
+                    self._database.create(sql=index.sql, args=index.args)
+                    self._logger.info(index.description)
+
+            self._database.save()
+            missing = self._get_missing_indexes()
+        finally:
+            self._database.close()
+
+        if missing:
+            msg = f"Indexes {missing} were not created."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+
+    def explain(self) -> list:
+        """Checks the query plans of the table's hot lookups for use of an index.
+
+        Lookups that scan the table, or the whole of an index, are flagged as unindexed and
+        logged as warnings.
+
+        Returns a list of dictionaries, one per lookup and table accessed, containing the
+        statement, the table, the access type, the key used, the estimated rows examined, and
+        whether the lookup is indexed.
+        """
+        report = []
+        self._database.connect()
+        try:
+            for query in self._ddl.queries:
+                for plan in self._database.explain(sql=query.sql, args=query.args):
+                    access, key = plan.get("type"), plan.get("key")
+                    # A NULL access type denotes a lookup resolved without reading the table.
+                    indexed = access not in ("ALL", "index") and (key is not None or access is None)
+                    report.append(
+                        {
+                            "sql": query.sql,
+                            "table": plan.get("table"),
+                            "type": access,
+                            "key": key,
+                            "rows": plan.get("rows"),
+                            "indexed": indexed,
+                        }
+                    )
+                    if not indexed:
+                        msg = f"Query {query.sql} is unindexed. Access type: {access}, key: {key}."
+                        self._logger.warning(msg)
+        finally:
+            self._database.close()
+        return report
 
     def drop(self) -> None:
-        """Drops a database or table."""
+        """Drops a database or table, and clears the DTO caches, as the ids of the rows dropped
+        are reused once the table is created again."""
         self._database.connect()
+        try:
+            self._database.drop(sql=self._ddl.drop.sql, args=self._ddl.drop.args)
+            msg = self._ddl.drop.description
+            self._logger.info(msg)
 
-        self._database.drop(sql=self._ddl.drop.sql, args=self._ddl.drop.args)
-        msg = self._ddl.drop.description
-        self._logger.info(msg)
-
-        self._database.save()
-        self._database.close()
+            self._database.save()
+        finally:
+            self._database.close()
+            DTOCache.clear_all()
 
     def exists(self) -> None:
         """Checks existence of a database."""
         self._database.connect()
-
-        result = self._database.exists(sql=self._ddl.exists.sql, args=self._ddl.exists.args)
-        msg = self._ddl.exists.description
-        self._logger.info(msg)
-
-        self._database.close()
+        try:
+            result = self._database.exists(sql=self._ddl.exists.sql, args=self._ddl.exists.args)
+            msg = self._ddl.exists.description
+            self._logger.info(msg)
+        finally:
+            self._database.close()
 
         return result
 
@@ -98,6 +155,14 @@ class DBA(AbstractDBA):
         self.drop()
         self.create()
 
+    def _get_missing_indexes(self) -> list:
+        """Returns the names of the table's indexes that do not exist."""
+        return [
+            index.name
+            for index in self._ddl.indexes
+            if not self._database.exists(sql=index.exists.sql, args=index.exists.args)
+        ]
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                       OBJECT DB ADMIN                                            #
@@ -120,6 +185,14 @@ class ODBA(AbstractDBA):
         """Checks existence of a database."""
         return self._database.database_exists()
 
+    def compact(self) -> dict:
+        """Reclaims space held by superseded and deleted objects. Returns a compaction report."""
+        return self._database.compact()
+
+    def dedup_report(self) -> dict:
+        """Returns the bytes saved by storing identical DataFrame columns once."""
+        return self._database.dedup_report()
+
     def reset(self) -> None:
         self.drop()
         self.create()
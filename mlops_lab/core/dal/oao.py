@@ -73,6 +73,17 @@ class OAO:
         self._database.insert(entity)
         return entity
 
+    def create_many(self, entities: list) -> list:
+        """Adds entities to the object database in a single batch.
+
+        Args:
+            entities (list): A list of entities.
+
+        Returns: the list of entities
+        """
+        self._database.insert_many(entities)
+        return entities
+
     def read(self, oid: int) -> Entity:
         """Obtains an entity Entity with the designated id.
 
@@ -83,17 +94,35 @@ class OAO:
         """
         return self._database.select(oid)
 
-    def read_by_name(self, name: str) -> Entity:
-        """Obtains an entity Entity with the designated name.
+    def read_many(self, oids: list) -> dict:
+        """Obtains the entities with the designated oids in a single batch.
+
+        Args:
+            oids (list): The oids of the entities.
+
+        Returns a dictionary of entities keyed by oid. Entities that do not exist are omitted.
+        """
+        return self._database.select_many(oids)
+
+    def read_by_name(self, name: str, entity: str) -> Entity:
+        """Obtains an entity Entity with the designated name, resolved by the object index.
         Args:
             name (str): The name assigned to the entity.
+            entity (str): The entity type, e.g. 'dataset'.
+
+        Returns an Entity, or an empty list if the entity does not exist.
+        """
+        return self._database.select_by_name(entity=entity, name=name)
+
+    def read_where(self, entity: str = None, **attributes) -> dict:
+        """Obtains the entities holding the designated values of indexed attributes.
+        Args:
+            entity (str): The entity type, e.g. 'dataset'. If None, entities of all types.
+            **attributes: Values of indexed attributes, e.g. stage='extract'.
 
-        Returns a Data Transfer Object (Entity)
+        Returns a dictionary of entities keyed by oid.
         """
-        result = []
-        ocl = self._oml.select_by_name(name)
-        result = self._database.select(ocl.oid)
-        return result
+        return self._database.select_where(entity, **attributes)
 
     def update(self, entity: Entity) -> None:
         """Updates an existing entity.
@@ -119,3 +148,11 @@ class OAO:
 
         """
         self._database.delete(oid)
+
+    def delete_many(self, oids: list) -> None:
+        """Deletes the entities with the designated oids in a single batch.
+        Args:
+            oids (list): The oids of the entities to delete.
+
+        """
+        self._database.delete_many(oids)
@@ -31,16 +31,241 @@ class SQL(ABC):  # pragma: no cover
     """Base class for SQL Command Objects."""
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                    MULTI-ROW INSERT                                              #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class InsertMany(SQL):
+    """Multi-row INSERT built from an entity's single-row insert commands.
+
+    The commands' arguments are inserted as the rows of an InsertRows of the first command, so
+    the rows are inserted in one statement.
+    """
+
+    commands: list
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        cmd = InsertRows(command=self.commands[0], rows=[command.args for command in self.commands])
+        self.sql, self.args = cmd.sql, cmd.args
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class InsertRows(SQL):
+    """Multi-row INSERT of argument tuples, in the column order of an entity's insert command.
+
+    The command may be the insert command class, as the rows carry the arguments.
+    """
+
+    command: type[SQL]
+    rows: list
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        statement, row = self.command.sql.strip().rstrip(";").split(" VALUES ", 1)
+        self.sql = f"{statement} VALUES {', '.join([row.strip()] * len(self.rows))};"
+        self.args = tuple(arg for row in self.rows for arg in row)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        LOAD ROWS                                                 #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class LoadRows(SQL):
+    """LOAD DATA of rows in the column order of an entity's insert command, from a file in the
+    MySQL text format, i.e. tab separated fields and newline terminated lines, with NULL written
+    as \\N, and tabs, newlines and backslashes within values escaped with a backslash.
+
+    The command may be the insert command class. Its columns are those loaded.
+    """
+
+    command: type[SQL]
+    filename: str
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        statement = self.command.sql.strip().split(" VALUES ", 1)[0]
+        table, columns = statement.split("INTO", 1)[1].split("(", 1)
+        columns = ", ".join([column.strip() for column in columns.rstrip(") ").split(",")])
+        self.sql = f"""LOAD DATA LOCAL INFILE '{self.filename}' INTO TABLE {table.strip()} CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({columns});"""  # noqa 501
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          UPSERT                                                  #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Upsert(SQL):
+    """Insert or update in one statement, built from an entity's single-row insert command.
+
+    If the row collides with an existing row on a unique key, e.g. the entity's name, the existing
+    row is updated with the inserted values instead. The existing row's id is passed to
+    LAST_INSERT_ID, so the id of the row inserted or updated is returned as the last row id.
+    """
+
+    command: SQL
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        insert = self.command.sql.strip().rstrip(";")
+        statement = insert.split(" VALUES ", 1)[0]
+        columns = [column.strip() for column in statement.split("(", 1)[1].rstrip(")").split(",")]
+        updates = ", ".join(["id = LAST_INSERT_ID(id)"] + [f"{c} = VALUES({c})" for c in columns])
+        self.sql = f"{insert} ON DUPLICATE KEY UPDATE {updates};"
+        self.args = self.command.args
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SELECT PAGE                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SelectPage(SQL):
+    """Keyset page of an entity's rows, built from its select all command.
+
+    Selects up to limit rows with ids greater than last_id, in id order. The next page starts
+    after the id of the last row of the page, so each page is read from the primary key index
+    without scanning the rows of the pages before it, as an OFFSET would.
+    """
+
+    command: SQL
+    last_id: int = 0
+    limit: int = 1000
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        statement = self.command.sql.strip().rstrip(";")
+        self.sql = f"{statement} WHERE id > %s ORDER BY id LIMIT %s;"
+        self.args = (self.last_id, self.limit)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          COUNT                                                   #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Count(SQL):
+    """Count of an entity's rows, optionally filtered on column values, built from its select
+    all command. Filters on None match NULL."""
+
+    command: SQL
+    filters: dict = None
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        table = self.command.sql.strip().rstrip(";").split(" FROM ", 1)[1]
+        conditions, args = [], []
+        for column, value in (self.filters or {}).items():
+            if not column.isidentifier():
+                msg = f"Invalid column name {column}."
+                raise ValueError(msg)
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            else:
+                conditions.append(f"{column} = %s")
+                args.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.sql = f"SELECT COUNT(*) FROM {table}{where};"
+        self.args = tuple(args)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       EXISTS MANY                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class ExistsMany(SQL):
+    """Selects which of the designated ids exist, built from an entity's select all command."""
+
+    command: SQL
+    ids: list = None
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        table = self.command.sql.strip().rstrip(";").split(" FROM ", 1)[1]
+        placeholders = ", ".join(["%s"] * len(self.ids))
+        self.sql = f"SELECT id FROM {table} WHERE id IN ({placeholders});"
+        self.args = tuple(self.ids)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          INDEX                                                   #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class IndexExists(SQL):
+    """Checks existence of an index on a table of the connected database."""
+
+    table: str
+    name: str
+    sql: str = """SELECT EXISTS(SELECT 1 FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1);"""  # noqa 501
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.args = (self.table, self.name)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Index(SQL):
+    """Secondary index on the designated columns of a table. Named ix_<table>_<columns> unless a
+    name is designated."""
+
+    table: str
+    columns: tuple
+    name: str = None
+    unique: bool = False
+    sql: str = None
+    args: tuple = ()
+    description: str = None
+
+    def __post_init__(self) -> None:
+        self.name = self.name or f"ix_{self.table}_{'_'.join(self.columns)}"
+        unique = "UNIQUE " if self.unique else ""
+        columns = ", ".join(self.columns)
+        self.sql = f"CREATE {unique}INDEX {self.name} ON {self.table} ({columns});"
+        self.description = f"Created index {self.name} on {self.table} ({columns})."
+
+    @property
+    def exists(self) -> IndexExists:
+        return IndexExists(table=self.table, name=self.name)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Lookup(SQL):
+    """Select of the rows of a table matching a column value. Declares a hot lookup, whose query
+    plan is checked for use of an index."""
+
+    table: str
+    column: str
+    sql: str = None
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        self.sql = f"SELECT * FROM {self.table} WHERE {self.column} = %s;"
+        self.args = ("",)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                             DDL AGGREGATION BASE CLASS                                           #
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class DDL(ABC):  # pragma: no cover
-    """Base class for entity Data Definition Language (DDL)."""
+    """Base class for entity Data Definition Language (DDL).
+
+    Tables declare the secondary indexes created with the table, and the hot lookups expected to
+    use an index rather than scan the table.
+    """
 
     create: SQL
     drop: SQL
     exists: SQL
+    indexes: tuple = ()
+    queries: tuple = ()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -51,6 +276,13 @@ class DML(ABC):  # pragma: no cover
     """Base class for entity Data Manipulation Language (DML)."""
 
     insert: type[SQL] = None
+    insert_many: type[SQL] = InsertMany
+    insert_rows: type[SQL] = InsertRows
+    load_rows: type[SQL] = LoadRows
+    upsert: type[SQL] = Upsert
+    select_page: type[SQL] = SelectPage
+    count: type[SQL] = Count
+    exists_many: type[SQL] = ExistsMany
     update: type[SQL] = None
     select: type[SQL] = None
     select_all: type[SQL] = None
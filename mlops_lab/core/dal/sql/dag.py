@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.dag import DAG
@@ -73,6 +73,13 @@ class DAGDDL(DDL):
     create: SQL = CreateDAGTable()
     drop: SQL = DropDAGTable()
     exists: SQL = DAGTableExists()
+    indexes: tuple = (
+        Index(table="dag", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="dag", column="oid"),
+        Lookup(table="dag", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.dataset import DataFrame
@@ -73,6 +73,15 @@ class DataFrameDDL(DDL):
     create: SQL = CreateDataFrameTable()
     drop: SQL = DropDataFrameTable()
     exists: SQL = DataFrameTableExists()
+    indexes: tuple = (
+        Index(table="dataframe", columns=("dataset_oid",)),
+        Index(table="dataframe", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="dataframe", column="dataset_oid"),
+        Lookup(table="dataframe", column="oid"),
+        Lookup(table="dataframe", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
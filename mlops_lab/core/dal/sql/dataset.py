@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.dataset import Dataset
@@ -73,6 +73,14 @@ class DatasetDDL(DDL):
     create: SQL = CreateDatasetTable()
     drop: SQL = DropDatasetTable()
     exists: SQL = DatasetTableExists()
+    indexes: tuple = (
+        Index(table="dataset", columns=("datasource_oid",)),
+        Index(table="dataset", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="dataset", column="oid"),
+        Lookup(table="dataset", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
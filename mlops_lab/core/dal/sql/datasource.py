@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.datasource import DataSource
@@ -73,6 +73,13 @@ class DataSourceDDL(DDL):
     create: SQL = CreateDataSourceTable()
     drop: SQL = DropDataSourceTable()
     exists: SQL = DataSourceTableExists()
+    indexes: tuple = (
+        Index(table="datasource", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="datasource", column="oid"),
+        Lookup(table="datasource", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.datasource import DataSourceURL
@@ -73,6 +73,15 @@ class DataSourceURLDDL(DDL):
     create: SQL = CreateDataSourceURLTable()
     drop: SQL = DropDataSourceURLTable()
     exists: SQL = DataSourceURLTableExists()
+    indexes: tuple = (
+        Index(table="datasource_url", columns=("datasource_oid",)),
+        Index(table="datasource_url", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="datasource_url", column="datasource_oid"),
+        Lookup(table="datasource_url", column="oid"),
+        Lookup(table="datasource_url", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.event import Event
@@ -73,6 +73,18 @@ class EventDDL(DDL):
     create: SQL = CreateEventTable()
     drop: SQL = DropEventTable()
     exists: SQL = EventTableExists()
+    indexes: tuple = (
+        Index(table="event", columns=("process_oid",)),
+        Index(table="event", columns=("parent_oid",)),
+        Index(table="event", columns=("oid",)),
+        Index(table="event", columns=("name",)),
+    )
+    queries: tuple = (
+        Lookup(table="event", column="process_oid"),
+        Lookup(table="event", column="parent_oid"),
+        Lookup(table="event", column="oid"),
+        Lookup(table="event", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 from dataclasses import dataclass
 
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.entity.file import File
@@ -73,6 +73,13 @@ class FileDDL(DDL):
     create: SQL = CreateFileTable()
     drop: SQL = DropFileTable()
     exists: SQL = FileTableExists()
+    indexes: tuple = (
+        Index(table="file", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="file", column="oid"),
+        Lookup(table="file", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.profile import Profile
@@ -73,6 +73,15 @@ class ProfileDDL(DDL):
     create: SQL = CreateProfileTable()
     drop: SQL = DropProfileTable()
     exists: SQL = ProfileTableExists()
+    indexes: tuple = (
+        Index(table="profile", columns=("task_oid",)),
+        Index(table="profile", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="profile", column="task_oid"),
+        Lookup(table="profile", column="oid"),
+        Lookup(table="profile", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -20,7 +20,7 @@ import os
 import dotenv
 
 from dataclasses import dataclass
-from mlops_lab.core.dal.sql.base import SQL, DDL, DML
+from mlops_lab.core.dal.sql.base import SQL, DDL, DML, Index, Lookup
 from mlops_lab.core.dal.dto import DTO
 from mlops_lab.core.entity.base import Entity
 from mlops_lab.core.workflow.dag import Task
@@ -73,6 +73,15 @@ class TaskDDL(DDL):
     create: SQL = CreateTaskTable()
     drop: SQL = DropTaskTable()
     exists: SQL = TaskTableExists()
+    indexes: tuple = (
+        Index(table="task", columns=("dag_oid",)),
+        Index(table="task", columns=("oid",)),
+    )
+    queries: tuple = (
+        Lookup(table="task", column="dag_oid"),
+        Lookup(table="task", column="oid"),
+        Lookup(table="task", column="name"),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
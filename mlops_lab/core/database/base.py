@@ -23,6 +23,8 @@ import mysql.connector
 import pymysql
 import logging
 
+from .pool import ConnectionPool
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                        CONNECTION                                                #
@@ -31,22 +33,36 @@ class Connection(ABC):
     """MySQL Database."""
 
     def __init__(
-        self, connector: pymysql.connect = None, autocommit: bool = False, autoclose: bool = False
+        self,
+        connector: pymysql.connect = None,
+        autocommit: bool = False,
+        autoclose: bool = False,
+        pool: ConnectionPool = None,
     ) -> None:
         self._autocommit = autocommit
         self._autoclose = autoclose
         self._connector = connector
+        self._pool = pool
         self._is_open = False
         self._in_transaction = False
         self._connection = None
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
+        if pool is not None and pool.autocommit != autocommit:
+            msg = f"Connection autocommit={autocommit} does not match pool autocommit={pool.autocommit}."  # noqa 501
+            self._logger.error(msg)
+            raise ValueError(msg)
 
     @property
     def database(self) -> str:
         return self._database
 
+    @property
+    def pool(self) -> ConnectionPool:
+        """Returns the pool from which connections are borrowed, or None if not pooled."""
+        return self._pool
+
     @property
     def autocommit(self) -> str:
         return self._autocommit
@@ -69,7 +85,17 @@ class Connection(ABC):
     def cursor(self) -> pymysql.connections.Connection.cursor:
         """Returns a cursor from the connection."""
         try:
-            return self._connection.cursor()
+            return self._session.cursor()
+        except mysql.connector.Error as err:  # pragma: no cover
+            self._logger.error(err)
+            raise mysql.connector.Error()
+
+    @property
+    def unbuffered_cursor(self) -> pymysql.cursors.SSCursor:
+        """Returns an unbuffered cursor, which reads rows from the server as they are fetched,
+        rather than reading the entire result on execution."""
+        try:
+            return self._session.cursor(pymysql.cursors.SSCursor)
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             raise mysql.connector.Error()
@@ -77,7 +103,7 @@ class Connection(ABC):
     def begin(self) -> None:
         """Start a transaction on the connection."""
         try:
-            self._connection.begin()
+            self._session.begin()
             self._in_transaction = True
             self._logger.debug(
                 f"{self.__class__.__name__}  transaction started on {self._database}."
@@ -91,9 +117,14 @@ class Connection(ABC):
         """Opens a database connection."""
 
     def close(self) -> None:
-        """Closes the connection."""
+        """Closes the connection, or returns it to the pool if pooled."""
         try:
-            self._connection.close()
+            if self._pool is not None:
+                if self._connection is not None:
+                    self._pool.release(self._connection)
+                self._connection = None
+            else:
+                self._connection.close()
             self._is_open = False
             self._in_transaction = False
             self._logger.debug(f"{self.__class__.__name__}  {self._database} is closed.")
@@ -104,7 +135,7 @@ class Connection(ABC):
     def commit(self) -> None:
         """Commits the connection"""
         try:
-            self._connection.commit()
+            self._session.commit()
             self._in_transaction = False
             self._logger.debug(f"{self.__class__.__name__} {self._database} is committed.")
         except mysql.connector.Error as err:  # pragma: no cover
@@ -114,13 +145,30 @@ class Connection(ABC):
     def rollback(self) -> None:
         """Rolls back the database to the last commit."""
         try:
-            self._connection.rollback()
+            self._session.rollback()
             self._in_transaction = False
             self._logger.debug(f"{self.__class__.__name__} {self._database} is rolled back.")
         except mysql.connector.Error as err:  # pragma: no cover
             self._logger.error(err)
             raise mysql.connector.Error()
 
+    def _borrow(self) -> None:
+        """Borrows a connection from the pool, unless one is held already, e.g. as the connection
+        was opened twice, in which case the connection held is kept."""
+        if self._connection is not None:
+            return
+        self._connection = self._pool.borrow()
+        self._is_open = True
+        self._logger.debug(f"{self.__class__.__name__} borrowed a connection to {self._database}.")
+
+    @property
+    def _session(self) -> pymysql.connections.Connection:
+        """Returns the underlying connection. A pooled connection is relinquished on close, after
+        which the connection is unusable, as a closed connection would be."""
+        if self._connection is None and self._pool is not None:
+            raise pymysql.err.InterfaceError(0, "Connection has been returned to the pool.")
+        return self._connection
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                        DATABASE                                                  #
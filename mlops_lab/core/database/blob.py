@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/blob.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 01:24:52 pm                                              #
+# Modified   : Saturday October 17th 2026 01:24:52 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Zero-Copy Pickle Blobs
+
+Objects are pickled with protocol 5, and buffers exposed out-of-band, e.g. the numpy arrays
+backing a pandas DataFrame, are written to the blob file at page-aligned offsets after the pickle
+stream. On load, the file is memory mapped and the buffers are passed to the unpickler as views
+of the mapping, so the arrays are backed by the page cache rather than copied into the heap.
+
+Layout:
+    magic (8 bytes) | pickle length (8) | buffer count (8) | (offset, length) per buffer (16 each)
+    | pickle stream | padding | buffer | padding | buffer ...
+"""
+import os
+import mmap
+import struct
+import pickle
+from typing import Any
+
+MAGIC = b"ODBBLOB5"
+PAGESIZE = mmap.PAGESIZE
+_HEADER = struct.Struct("<8sQQ")
+_ENTRY = struct.Struct("<QQ")
+
+
+# ------------------------------------------------------------------------------------------------ #
+def dump(obj: Any, filepath: str) -> None:
+    """Writes the object to a blob file, replacing any existing file atomically."""
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    buffers = [buffer.raw() for buffer in buffers]
+
+    offset = _HEADER.size + _ENTRY.size * len(buffers) + len(data)
+    entries = []
+    for buffer in buffers:
+        offset = _align(offset)
+        entries.append((offset, buffer.nbytes))
+        offset += buffer.nbytes
+
+    tempfile = filepath + ".tmp"
+    with open(tempfile, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, len(data), len(buffers)))
+        for entry in entries:
+            file.write(_ENTRY.pack(*entry))
+        file.write(data)
+        for (offset, _), buffer in zip(entries, buffers):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(buffer)
+    os.replace(tempfile, filepath)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def load(filepath: str) -> Any:
+    """Reads an object from a blob file, backing its out-of-band buffers with a memory map.
+
+    The file is mapped copy-on-write, so the buffers are writable without modifying the file.
+    """
+    with open(filepath, "rb") as file:
+        view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+
+    magic, length, count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        msg = f"{filepath} is not a blob file."
+        raise ValueError(msg)
+    buffers = []
+    for i in range(count):
+        offset, nbytes = _ENTRY.unpack_from(view, _HEADER.size + i * _ENTRY.size)
+        buffers.append(view[offset : offset + nbytes])
+    start = _HEADER.size + count * _ENTRY.size
+    return pickle.loads(view[start : start + length], buffers=buffers)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _align(offset: int) -> int:
+    return -(-offset // PAGESIZE) * PAGESIZE
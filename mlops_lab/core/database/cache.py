@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/cache.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:06:44 pm                                              #
+# Modified   : Saturday October 17th 2026 12:06:44 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Read Cache for the Object Database."""
+import sys
+import logging
+from collections import OrderedDict
+from typing import Union
+
+from mlops_lab.core.database.frame import payload_size
+from mlops_lab.core.entity.base import Entity
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         READ CACHE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class ReadCache:
+    """Least recently used cache of entities read from the object database.
+
+    The cache is bounded by the total size of the entities it holds. Entities are sized by the
+    memory usage of their DataFrames, as computed when the DataFrame data were set, whether or
+    not the payloads have been loaded. Once the capacity is exceeded, the least recently used
+    entities are evicted.
+
+    Cached entities are shared by all readers. Changes to an entity are visible to other readers
+    before the entity is updated in the object database.
+
+    Args:
+        capacity (int): Maximum total size in bytes of the cached entities. Entities larger than
+            the capacity are not cached.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._entities = OrderedDict()
+        self._sizes = {}
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, oid: str) -> bool:
+        return oid in self._entities
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Total size in bytes of the cached entities."""
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def stats(self) -> dict:
+        """Returns the cache counters and current occupancy."""
+        return {
+            "entities": len(self._entities),
+            "nbytes": self._nbytes,
+            "capacity": self._capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def get(self, oid: str) -> Union[Entity, None]:
+        """Returns the cached entity, or None if the entity is not cached."""
+        try:
+            entity = self._entities[oid]
+        except KeyError:
+            self._misses += 1
+            return None
+        self._entities.move_to_end(oid)
+        self._hits += 1
+        return entity
+
+    def put(self, entity: Entity) -> None:
+        """Adds an entity to the cache, evicting least recently used entities as required."""
+        self.invalidate(entity.oid)
+        size = sys.getsizeof(entity) + payload_size(entity, loaded_only=False)
+        if size > self._capacity:
+            msg = f"Entity {entity.oid} of {size} bytes exceeds the cache capacity and will not be cached."
+            self._logger.debug(msg)
+            return
+        self._entities[entity.oid] = entity
+        self._sizes[entity.oid] = size
+        self._nbytes += size
+        while self._nbytes > self._capacity:
+            oid, _ = self._entities.popitem(last=False)
+            self._nbytes -= self._sizes.pop(oid)
+            self._evictions += 1
+            msg = f"Evicted entity {oid} from the cache."
+            self._logger.debug(msg)
+
+    def invalidate(self, oid: str) -> None:
+        """Removes the entity from the cache, if cached."""
+        if oid in self._entities:
+            del self._entities[oid]
+            self._nbytes -= self._sizes.pop(oid)
+
+    def clear(self) -> None:
+        """Removes all entities from the cache. Counters are retained."""
+        self._entities.clear()
+        self._sizes = {}
+        self._nbytes = 0
+        msg = "Cache is cleared."
+        self._logger.debug(msg)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/codec.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:31:09 pm                                              #
+# Modified   : Saturday October 17th 2026 12:31:09 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Compression Codecs for Object Store Payloads."""
+import zlib
+import pickle
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import lz4.frame
+except ImportError:  # pragma: no cover
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                           CODEC                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Codec(ABC):
+    """Base class for object store compression codecs.
+
+    Objects are pickled, compressed, and prefixed with a header identifying the codec, so objects
+    are decoded with the codec that encoded them, regardless of the codec currently configured.
+
+    Args:
+        level (int): Compression level. If None, the codec's default level is used.
+    """
+
+    id = None
+    name = None
+    default_level = None
+
+    __magic = b"\x93ODB"
+
+    def __init__(self, level: int = None) -> None:
+        self._level = self.default_level if level is None else level
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @classmethod
+    def available(cls) -> bool:
+        """Returns True if the codec's library is installed."""
+        return True
+
+    def encode(self, obj: Any) -> bytes:
+        """Pickles and compresses an object."""
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        return self.__magic + bytes([self.id]) + self.compress(data)
+
+    @classmethod
+    def decode(cls, data: Any) -> Any:
+        """Decompresses and unpickles an encoded object. Objects not encoded are returned as is."""
+        if not cls.is_encoded(data):
+            return data
+        codec = get_codec(id=data[len(cls.__magic)])
+        return pickle.loads(codec.decompress(data[len(cls.__magic) + 1 :]))
+
+    @classmethod
+    def is_encoded(cls, data: Any) -> bool:
+        return isinstance(data, bytes) and data.startswith(cls.__magic)
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses the data."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompresses the data."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class NoCodec(Codec):
+    """Pickles objects without compression."""
+
+    id = 0
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ZlibCodec(Codec):
+    """Compresses objects with zlib from the standard library. Levels range from 0 to 9."""
+
+    id = 1
+    name = "zlib"
+    default_level = 6
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class LZ4Codec(Codec):
+    """Compresses objects with the LZ4 frame format. Requires the lz4 package.
+
+    Levels range from 0 to 16, where levels below 3 use the fast compressor.
+    """
+
+    id = 2
+    name = "lz4"
+    default_level = 0
+
+    @classmethod
+    def available(cls) -> bool:
+        return lz4 is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4.frame.compress(data, compression_level=self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4.frame.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ZstdCodec(Codec):
+    """Compresses objects with Zstandard. Requires the zstandard package. Levels range from 1 to 22."""
+
+    id = 3
+    name = "zstd"
+    default_level = 3
+
+    @classmethod
+    def available(cls) -> bool:
+        return zstandard is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self._level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+CODECS = {codec.name: codec for codec in (NoCodec, ZlibCodec, LZ4Codec, ZstdCodec)}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def get_codec(name: str = None, level: int = None, id: int = None) -> Codec:
+    """Returns a codec by name or header id.
+
+    Codecs whose library is not installed are substituted with zlib.
+
+    Args:
+        name (str): One of 'none', 'zlib', 'lz4', or 'zstd'. None is equivalent to 'none'.
+        level (int): Compression level. If None, the codec's default level is used.
+        id (int): The codec id from an encoded object's header. Takes precedence over name.
+    """
+    logger = logging.getLogger(f"{__name__}.get_codec")
+    if id is not None:
+        try:
+            codec = next(codec for codec in CODECS.values() if codec.id == id)
+        except StopIteration:
+            msg = f"Unable to decode object. Codec id {id} is not recognized."
+            logger.error(msg)
+            raise ValueError(msg)
+        if not codec.available():
+            msg = f"Unable to decode object. The {codec.name} codec is not installed."
+            logger.error(msg)
+            raise ImportError(msg)
+        return codec()
+
+    name = "none" if name is None else name.lower()
+    try:
+        codec = CODECS[name]
+    except KeyError:
+        msg = f"Codec {name} is not supported. Valid codecs are {list(CODECS.keys())}."
+        logger.error(msg)
+        raise ValueError(msg)
+    if not codec.available():
+        msg = f"The {name} codec is not installed. Objects will be compressed with zlib."
+        logger.warning(msg)
+        return ZlibCodec()
+    return codec(level=level)
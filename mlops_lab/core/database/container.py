@@ -18,11 +18,20 @@
 # ================================================================================================ #
 """Database Container Module"""
 import pymysql
+from pymysql.constants import CLIENT
 
 from dependency_injector import containers, providers  # pragma: no cover
 
-from mlops_lab.core.database.relational import Database, MySQLConnection, DatabaseConnection
+from mlops_lab.core.database.relational import (
+    Database,
+    MySQLConnection,
+    DatabaseConnection,
+    SQLiteConnection,
+)
+from mlops_lab.core.database.pool import ConnectionPool
 from mlops_lab.core.database.object import ObjectDBConnection, ObjectDB
+from mlops_lab.core.database.embedded import SQLiteObjectDBConnection
+from mlops_lab.core.database.cache import ReadCache
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -30,35 +39,134 @@ class ConnectionContainer(containers.DeclarativeContainer):
 
     mlops_lab_database = providers.Configuration()
     events_database = providers.Configuration()
-
-    dbms_connection = providers.Factory(
-        MySQLConnection, connector=pymysql.connect, autocommit=False, autoclose=False
+    rdb_backend = providers.Configuration()
+    rdb_location = providers.Configuration()
+    odb_backend = providers.Configuration()
+    odb_persistent = providers.Configuration()
+    odb_codec = providers.Configuration()
+    odb_shards = providers.Configuration()
+    odb_dedup = providers.Configuration()
+    pool = providers.Configuration()
+
+    dbms_pool = providers.Singleton(
+        ConnectionPool,
+        connector=pymysql.connect,
+        prefix="DBMS",
+        min_size=pool.min_size,
+        max_size=pool.max_size,
+        idle_timeout=pool.idle_timeout,
+        timeout=pool.timeout,
+        autocommit=False,
     )
 
-    rdb_connection = providers.Factory(
-        DatabaseConnection,
+    rdb_pool = providers.Singleton(
+        ConnectionPool,
         connector=pymysql.connect,
+        prefix="DATABASE",
+        min_size=pool.min_size,
+        max_size=pool.max_size,
+        idle_timeout=pool.idle_timeout,
+        timeout=pool.timeout,
         database=mlops_lab_database,
         autocommit=False,
-        autoclose=False,
+        local_infile=True,
+        client_flag=CLIENT.FOUND_ROWS,
     )
 
-    edb_connection = providers.Factory(
-        DatabaseConnection,
+    edb_pool = providers.Singleton(
+        ConnectionPool,
         connector=pymysql.connect,
+        prefix="DATABASE",
+        min_size=pool.min_size,
+        max_size=pool.max_size,
+        idle_timeout=pool.idle_timeout,
+        timeout=pool.timeout,
         database=events_database,
         autocommit=True,
-        autoclose=False,
+        local_infile=True,
+        client_flag=CLIENT.FOUND_ROWS,
+    )
+
+    dbms_connection = providers.Selector(
+        rdb_backend,
+        mysql=providers.Factory(
+            MySQLConnection,
+            connector=pymysql.connect,
+            autocommit=False,
+            autoclose=False,
+            pool=dbms_pool,
+        ),
+        sqlite=providers.Factory(
+            SQLiteConnection,
+            location=rdb_location,
+            autocommit=False,
+            autoclose=False,
+        ),
+    )
+
+    rdb_connection = providers.Selector(
+        rdb_backend,
+        mysql=providers.Factory(
+            DatabaseConnection,
+            connector=pymysql.connect,
+            database=mlops_lab_database,
+            autocommit=False,
+            autoclose=False,
+            pool=rdb_pool,
+        ),
+        sqlite=providers.Factory(
+            SQLiteConnection,
+            location=rdb_location,
+            database=mlops_lab_database,
+            autocommit=False,
+            autoclose=False,
+        ),
+    )
+
+    edb_connection = providers.Selector(
+        rdb_backend,
+        mysql=providers.Factory(
+            DatabaseConnection,
+            connector=pymysql.connect,
+            database=events_database,
+            autocommit=True,
+            autoclose=False,
+            pool=edb_pool,
+        ),
+        sqlite=providers.Factory(
+            SQLiteConnection,
+            location=rdb_location,
+            database=events_database,
+            autocommit=True,
+            autoclose=False,
+        ),
     )
 
-    odb_connection = providers.Factory(
-        ObjectDBConnection,
+    odb_connection = providers.Selector(
+        odb_backend,
+        shelve=providers.Factory(
+            ObjectDBConnection,
+            persistent=odb_persistent,
+            codec=odb_codec.name,
+            level=odb_codec.level,
+            shards=odb_shards,
+            dedup=odb_dedup,
+        ),
+        sqlite=providers.Factory(
+            SQLiteObjectDBConnection,
+            codec=odb_codec.name,
+            level=odb_codec.level,
+            dedup=odb_dedup,
+        ),
     )
 
 
 # ------------------------------------------------------------------------------------------------ #
 class DatabaseContainer(containers.DeclarativeContainer):
 
+    odb_cache_capacity = providers.Configuration()
+    odb_write_behind = providers.Configuration()
+
     dbms_connection = providers.Dependency()
     rdb_connection = providers.Dependency()
     edb_connection = providers.Dependency()
@@ -70,4 +178,8 @@ class DatabaseContainer(containers.DeclarativeContainer):
 
     edb = providers.Singleton(Database, connection=edb_connection)
 
-    odb = providers.Singleton(ObjectDB, connection=odb_connection)
+    odb_cache = providers.Singleton(ReadCache, capacity=odb_cache_capacity)
+
+    odb = providers.Singleton(
+        ObjectDB, connection=odb_connection, cache=odb_cache, write_behind=odb_write_behind
+    )
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/dialect.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:26:51 pm                                              #
+# Modified   : Saturday October 17th 2026 09:26:51 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""SQL Dialect Translation Module."""
+import re
+import csv
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Union
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SQLITE DIALECT                                              #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteDialect:
+    """Translates the MySQL statements of the data access layer into SQLite.
+
+    Statements are translated as follows:
+        - %s placeholders become ? placeholders.
+        - Integer primary keys declared AUTO_INCREMENT become INTEGER PRIMARY KEY AUTOINCREMENT.
+        - Columns declared ON UPDATE CURRENT_TIMESTAMP are maintained by an AFTER UPDATE trigger,
+          created with the table.
+        - Table and index existence checks against information_schema query sqlite_master.
+        - ON DUPLICATE KEY UPDATE becomes ON CONFLICT DO UPDATE, returning the id of the row
+          inserted or updated.
+        - EXPLAIN becomes EXPLAIN QUERY PLAN.
+        - The session's auto_increment_increment is 1.
+
+    Database level statements, i.e. CREATE DATABASE, DROP DATABASE, and existence checks against
+    information_schema.SCHEMATA, and LOAD DATA statements, are parsed rather than translated, and
+    executed by the cursor.
+    """
+
+    __translations = [
+        (re.compile(r"SELECT\s+@@SESSION\.auto_increment_increment", re.I), "SELECT 1"),
+        (
+            re.compile(r"\b(?:TINY|SMALL|MEDIUM|BIG)?INT(?:EGER)?(?:\(\d+\))?\s+PRIMARY\s+KEY\s+AUTO_INCREMENT\b", re.I),  # noqa 501
+            "INTEGER PRIMARY KEY AUTOINCREMENT",
+        ),
+        (re.compile(r"\s+AUTO_INCREMENT\b(?:\s*=\s*\d+)?", re.I), ""),
+        (re.compile(r"\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b", re.I), ""),
+        (re.compile(r"COUNT\(TABLE_NAME\)", re.I), "COUNT(name)"),
+        (
+            re.compile(r"information_schema\.TABLES\s+WHERE\s+TABLE_SCHEMA\s+(?:LIKE|=)\s+(?:'[^']*'|DATABASE\(\))\s+AND\s+TABLE_NAME\s*=", re.I),  # noqa 501
+            "sqlite_master WHERE type = 'table' AND name =",
+        ),
+        (
+            re.compile(r"information_schema\.STATISTICS\s+WHERE\s+TABLE_SCHEMA\s*=\s*(?:'[^']*'|DATABASE\(\))\s+AND\s+TABLE_NAME\s*=\s*(%s|'[^']*')\s+AND\s+INDEX_NAME\s*=", re.I),  # noqa 501
+            r"sqlite_master WHERE type = 'index' AND tbl_name = \1 AND name =",
+        ),
+        (re.compile(r"^\s*EXPLAIN\s+", re.I), "EXPLAIN QUERY PLAN "),
+    ]
+    __upsert = re.compile(r"\s+ON\s+DUPLICATE\s+KEY\s+UPDATE\s+(.*)$", re.I | re.S)
+    __values = re.compile(r"\bVALUES\(\s*(\w+)\s*\)", re.I)
+    __last_insert_id = re.compile(r"^\s*(\w+)\s*=\s*LAST_INSERT_ID\(\s*\1\s*\)\s*$", re.I)
+    __on_update = re.compile(r"(\w+)\s+(?:DATETIME|TIMESTAMP)\b[^,]*?\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b", re.I)  # noqa 501
+    __create_table = re.compile(r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.I)
+    __database = re.compile(
+        r"^\s*(CREATE|DROP)\s+(?:DATABASE|SCHEMA)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(\w+)", re.I
+    )
+    __database_exists = re.compile(
+        r"INFORMATION_SCHEMA\.SCHEMATA\s+WHERE\s+SCHEMA_NAME\s*=\s*'(\w+)'", re.I
+    )
+    __load = re.compile(
+        r"^\s*LOAD\s+DATA\s+(?P<local>LOCAL\s+)?INFILE\s+'(?P<filename>[^']+)'\s+(?:(?P<handling>REPLACE|IGNORE)\s+)?INTO\s+TABLE\s+(?P<table>\w+)(?P<options>.*?)(?:\((?P<columns>[\w\s,]+)\))?\s*$",  # noqa 501
+        re.I | re.S,
+    )
+
+    def translate(self, sql: str, args: tuple = None) -> list:
+        """Returns the SQLite statements, in order of execution, implementing a MySQL statement."""
+        statement = sql.strip().rstrip(";")
+        statements = []
+        table = self.__create_table.match(statement)
+        if table is not None:
+            for column in self.__on_update.findall(statement):
+                statements.append(self._on_update_trigger(table=table.group(1), column=column))
+        upsert = self.__upsert.search(statement)
+        if upsert is not None:
+            statement = statement[: upsert.start()] + self._on_conflict(upsert.group(1))
+        for pattern, replacement in self.__translations:
+            statement = pattern.sub(replacement, statement)
+        statement = statement.replace("%s", "?")
+        if args is not None:
+            statement = statement.replace("%%", "%")
+        return [statement] + statements
+
+    def database_command(self, sql: str) -> Union[tuple, None]:
+        """Returns the command, i.e. 'create', 'drop', or 'exists', and database name of a
+        database level statement, or None if the statement is not database level."""
+        match = self.__database.match(sql)
+        if match is not None:
+            return (match.group(1).lower(), match.group(2))
+        match = self.__database_exists.search(sql)
+        if match is not None:
+            return ("exists", match.group(1))
+        return None
+
+    def load_command(self, sql: str) -> Union[dict, None]:
+        """Returns the file, table, columns and CSV format of a LOAD DATA statement, or None."""
+        match = self.__load.match(sql.strip().rstrip(";"))
+        if match is None:
+            return None
+        options = match.group("options")
+        delimiter = re.search(r"FIELDS\s+TERMINATED\s+BY\s+'([^']*)'", options, re.I)
+        quotechar = re.search(r"ENCLOSED\s+BY\s+'([^']*)'", options, re.I)
+        escape = re.search(r"ESCAPED\s+BY\s+'([^']*)'", options, re.I)
+        terminator = re.search(r"LINES\s+TERMINATED\s+BY\s+'([^']*)'", options, re.I)
+        ignore = re.search(r"IGNORE\s+(\d+)\s+(?:ROWS|LINES)", options, re.I)
+        columns = match.group("columns")
+        handling = (match.group("handling") or "").upper()
+        if not handling and match.group("local"):
+            # Rows of a local file colliding with existing rows are skipped, as if IGNORE.
+            handling = "IGNORE"
+        return {
+            "filename": match.group("filename"),
+            "table": match.group("table"),
+            "handling": handling or None,
+            "columns": None if columns is None else [c.strip() for c in columns.split(",")],
+            "delimiter": self._unescape(delimiter.group(1)) if delimiter else "\t",
+            "quotechar": self._unescape(quotechar.group(1)) if quotechar else None,
+            "escape": self._unescape(escape.group(1)) if escape else None,
+            "terminator": self._unescape(terminator.group(1)) if terminator else "\n",
+            "ignore": int(ignore.group(1)) if ignore else 0,
+        }
+
+    def plan(self, rows: list) -> list:
+        """Maps the rows of an EXPLAIN QUERY PLAN to rows of the EXPLAIN columns returned by
+        MySQL, one per table accessed. Full table scans are of type ALL, full index scans of type
+        index, and index lookups of type ref, or range for inequalities."""
+        plan = []
+        for row in rows:
+            detail = row[-1]
+            match = re.match(
+                r"^(SCAN|SEARCH)\s+(?:TABLE\s+)?(\w+)(?:\s+AS\s+\w+)?(?:\s+USING\s+(COVERING\s+INDEX|INDEX|INTEGER\s+PRIMARY\s+KEY)\s*(\w*)\s*(\(.*\))?)?",  # noqa 501
+                detail,
+            )
+            if match is None:
+                continue
+            operation, table, using, index, condition = match.groups()
+            key = None
+            if using is not None:
+                key = "PRIMARY" if using.upper().startswith("INTEGER") else index
+            if operation == "SCAN":
+                access = "ALL" if key is None else "index"
+            elif condition is not None and ("<" in condition or ">" in condition):
+                access = "range"
+            elif key == "PRIMARY":
+                access = "const"
+            else:
+                access = "ref"
+            plan.append((row[0], "SIMPLE", table, access, key, key, None, detail))
+        return plan
+
+    def _on_conflict(self, assignments: str) -> str:
+        """Returns the ON CONFLICT clause equivalent to the ON DUPLICATE KEY UPDATE assignments.
+        Assignments of LAST_INSERT_ID are replaced by returning the id of the row."""
+        updates = [
+            self.__values.sub(r"excluded.\1", assignment.strip())
+            for assignment in self._split(assignments)
+            if not self.__last_insert_id.match(assignment)
+        ]
+        return f" ON CONFLICT DO UPDATE SET {', '.join(updates)} RETURNING id"
+
+    def _on_update_trigger(self, table: str, column: str) -> str:
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_{column}_on_update AFTER UPDATE ON {table} "
+            f"FOR EACH ROW WHEN NEW.{column} IS OLD.{column} "
+            f"BEGIN UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid; END"
+        )
+
+    def _split(self, assignments: str) -> list:
+        """Splits assignments on the commas outside parentheses."""
+        parts, depth, current = [], 0, ""
+        for char in assignments:
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            if char == "," and depth == 0:
+                parts.append(current)
+                current = ""
+            else:
+                current += char
+        return parts + [current] if current.strip() else parts
+
+    def _unescape(self, value: str) -> str:
+        return value.encode("latin-1", "backslashreplace").decode("unicode_escape")
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      DIALECT CURSOR                                              #
+# ------------------------------------------------------------------------------------------------ #
+class DialectCursor:
+    """Cursor executing MySQL statements on a SQLite connection.
+
+    Statements are translated by the dialect, and the results reported as a MySQL cursor would
+    report them. In particular, the last row id of a multi-row INSERT is the id of the first row
+    inserted, and that of an upsert is the id of the row inserted or updated.
+
+    Args:
+        cursor (sqlite3.Cursor): The SQLite cursor on which statements are executed.
+        connection (SQLiteConnection): The connection, on which database level statements are
+            executed.
+        dialect (SQLiteDialect): The translator of MySQL statements.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, connection, dialect: SQLiteDialect) -> None:
+        self._connection = connection
+        self._dialect = dialect
+        self._cursor = cursor
+        self._rows = None
+        self._description = None
+        self._rowcount = -1
+        self._lastrowid = None
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def description(self) -> tuple:
+        return self._description if self._rows is not None else self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._rowcount
+
+    @property
+    def lastrowid(self) -> int:
+        return self._lastrowid
+
+    def execute(self, sql: str, args: tuple = None) -> None:
+        """Executes a MySQL statement."""
+        self._rows, self._description = None, None
+        command = self._dialect.database_command(sql)
+        if command is not None:
+            return self._execute_database_command(*command)
+        load = self._dialect.load_command(sql)
+        if load is not None:
+            return self._load(**load)
+
+        statements = self._dialect.translate(sql, args)
+        params = () if args is None else tuple(args)
+        self._cursor.execute(statements[0], params)
+        for statement in statements[1:]:
+            self._cursor.execute(statement)
+        self._rowcount = self._cursor.rowcount
+        self._lastrowid = self._cursor.lastrowid
+
+        head = statements[0].lstrip().upper()
+        if head.startswith("EXPLAIN QUERY PLAN"):
+            self._set_result(
+                rows=self._dialect.plan(self._cursor.fetchall()),
+                columns=("id", "select_type", "table", "type", "possible_keys", "key", "rows", "Extra"),  # noqa 501
+            )
+        elif head.startswith("INSERT") and statements[0].rstrip().upper().endswith("RETURNING ID"):
+            row = self._cursor.fetchone()
+            self._cursor.fetchall()
+            self._lastrowid = None if row is None else row[0]
+            self._rowcount = 1
+        elif head.startswith("INSERT") and self._rowcount > 1:
+            # SQLite reports the rowid of the last row. MySQL reports that of the first.
+            self._lastrowid = self._lastrowid - self._rowcount + 1
+
+    def fetchone(self) -> Union[tuple, None]:
+        if self._rows is None:
+            return self._cursor.fetchone()
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size: int = 1) -> list:
+        if self._rows is None:
+            return self._cursor.fetchmany(size)
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self) -> list:
+        if self._rows is None:
+            return self._cursor.fetchall()
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        self._cursor.close()
+
+    def _unescape_field(self, field: str, escape: str) -> Union[str, None]:
+        if field == f"{escape}N":
+            return None
+        if escape not in field:
+            return field
+        escapes = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+        return re.sub(
+            re.escape(escape) + r"(.)",
+            lambda match: escapes.get(match.group(1), match.group(1)),
+            field,
+        )
+
+    def _set_result(self, rows: list, columns: tuple) -> None:
+        self._rows = list(rows)
+        self._description = tuple((column,) + (None,) * 6 for column in columns)
+        self._rowcount = len(self._rows)
+
+    def _execute_database_command(self, command: str, name: str) -> None:
+        if command == "create":
+            self._rowcount = self._connection.create_database(name)
+        elif command == "drop":
+            self._rowcount = self._connection.drop_database(name)
+        else:
+            self._set_result(rows=[(int(self._connection.database_exists(name)),)], columns=("COUNT(*)",))  # noqa 501
+
+    def _load(
+        self,
+        filename: str,
+        table: str,
+        handling: str,
+        columns: list,
+        delimiter: str,
+        quotechar: str,
+        escape: str,
+        terminator: str,
+        ignore: int,
+    ) -> None:
+        """Inserts the rows of a delimited file. Fields of \\N are NULL. Rows colliding with
+        existing rows on a unique key are skipped or replaced, as designated by handling.
+
+        Files with quoted fields are read as CSV. Files with escaped rather than quoted fields
+        are read in the MySQL text format, in which delimiters, terminators and escapes within
+        values are escaped.
+        """
+        with open(filename, newline="", encoding="utf-8") as file:
+            if quotechar is None and escape:
+                lines = file.read().split(terminator)
+                rows = [
+                    [self._unescape_field(field, escape) for field in line.split(delimiter)]
+                    for line in lines[ignore:]
+                    if line
+                ]
+            else:
+                reader = csv.reader(
+                    file,
+                    delimiter=delimiter,
+                    quotechar=quotechar or '"',
+                    quoting=csv.QUOTE_MINIMAL if quotechar else csv.QUOTE_NONE,
+                )
+                for _ in range(ignore):
+                    next(reader, None)
+                rows = [[None if value == "\\N" else value for value in row] for row in reader if row]  # noqa 501
+        self._rowcount = 0
+        if rows:
+            target = table if columns is None else f"{table} ({', '.join(columns)})"
+            placeholders = ", ".join(["?"] * len(rows[0]))
+            conflict = f" OR {handling}" if handling else ""
+            self._cursor.executemany(
+                f"INSERT{conflict} INTO {target} VALUES ({placeholders})", rows
+            )
+            self._rowcount = self._cursor.rowcount
+        msg = f"Loaded {self._rowcount} rows from {filename} into {table}."
+        self._logger.debug(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  DATETIME CONVERSION                                             #
+# ------------------------------------------------------------------------------------------------ #
+# DATETIME columns are stored as ISO 8601 text and returned as datetimes, as they are by MySQL.
+def _convert_datetime(value: bytes) -> Union[datetime, str]:
+    try:
+        return datetime.fromisoformat(value.decode())
+    except ValueError:
+        return value.decode()
+
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATETIME", _convert_datetime)
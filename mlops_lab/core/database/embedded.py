@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/embedded.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 02:12:37 pm                                              #
+# Modified   : Saturday October 17th 2026 02:12:37 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Embedded Transactional Object Store Module"""
+import os
+import logging
+import sqlite3
+import threading
+from glob import glob
+from contextlib import contextmanager
+from typing import Union
+
+import dotenv
+
+from mlops_lab.core.database.base import Connection
+from mlops_lab.core.database.codec import Codec, NoCodec, get_codec
+from mlops_lab.core.database.frame import FrameStore
+from mlops_lab.core.database.snapshot import Generations, Snapshot
+from mlops_lab.core.entity.base import Entity
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        SQLITE CURSOR                                             #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteCursor:
+    """Object storage in a SQLite table of pickled entities keyed by oid.
+
+    The database is opened in write-ahead logging mode, so readers do not block the writer, and
+    transactions are native SQLite transactions. DataFrame payloads are stored in a versioned
+    FrameStore, so payloads written in a transaction that is rolled back do not replace the
+    committed payloads. Payload files no longer referenced are purged once the transaction ends,
+    or, while a snapshot is held, once no snapshot is held.
+
+    Args:
+        location (str): The path of the database, without extension.
+        codec (Codec): Codec with which entities are compressed. If None, entities are pickled
+            without compression.
+        dedup (bool): Whether identical DataFrame columns are stored once. Default is False.
+    """
+
+    __table = "objects"
+    __chunksize = 500
+
+    def __init__(self, location: str, codec: Codec = None, dedup: bool = False) -> None:
+        self._location = location
+        self._filepath = location + ".sqlite3"
+        self._codec = codec or NoCodec()
+        self._frames = FrameStore(
+            location=os.path.join(
+                os.path.dirname(location), "frames", os.path.basename(location)
+            ),
+            codec=codec,
+            versioned=True,
+            dedup=dedup,
+        )
+        self._connection = None
+        self._in_transaction = False
+        self._written = {}
+        self._deferred = set()
+        self._generations = Generations(location)
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def frames(self) -> FrameStore:
+        return self._frames
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._in_transaction
+
+    @property
+    def generations(self) -> Generations:
+        return self._generations
+
+    def snapshot(self) -> "SQLiteSnapshot":
+        """Returns a snapshot of the object store as of the last commit."""
+        self.open()
+        return SQLiteSnapshot(storage=self, generations=self._generations)
+
+    def open(self) -> None:
+        """Opens the database, creating the object table if it does not exist."""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+            self._connection = sqlite3.connect(
+                self._filepath, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.__table} (oid TEXT PRIMARY KEY, entity BLOB NOT NULL)"
+            )
+            msg = f"Object storage opened at {self._filepath}"
+            self._logger.debug(msg)
+
+    def close(self) -> None:
+        """Closes the database, rolling back any open transaction."""
+        if self._connection is not None:
+            if self._in_transaction:
+                self.rollback()
+            self._connection.close()
+            self._connection = None
+            msg = f"Object storage at {self._filepath} is closed."
+            self._logger.debug(msg)
+
+    def flush(self) -> None:
+        """Changes are durable on commit. Nothing to flush."""
+
+    def drop(self) -> None:
+        """Deletes the database and DataFrame payloads."""
+        self.close()
+        for filepath in glob(self._filepath + "*"):
+            os.remove(filepath)
+        self._frames.drop()
+        self._generations.drop()
+        self._deferred = set()
+        msg = f"Dropped object store at {self._filepath}."
+        self._logger.info(msg)
+
+    def compact(self, prune: bool = True) -> list:
+        """Rebuilds the database file without free pages and truncates the write-ahead log.
+
+        Args:
+            prune (bool): Whether to remove DataFrame payloads of entities not in the store.
+
+        Returns the oids of the live entities.
+        """
+        with self._lock:
+            if self._in_transaction:
+                msg = "Unable to compact object storage while a transaction is in progress."
+                self._logger.error(msg)
+                raise RuntimeError(msg)
+            self.open()
+            oids = [row[0] for row in self._connection.execute(f"SELECT oid FROM {self.__table}")]
+            self._connection.execute("VACUUM")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._purge([])
+        if prune and self._generations.oldest() is None:
+            self._frames.prune(oids)
+        return oids
+
+    def begin(self) -> None:
+        """Starts a transaction, acquiring the write lock on the database."""
+        with self._lock:
+            self.open()
+            if not self._in_transaction:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._in_transaction = True
+                self._written = {}
+
+    def commit(self) -> None:
+        """Commits the transaction and purges payload files superseded in the transaction."""
+        with self._lock:
+            if self._in_transaction:
+                self._connection.execute("COMMIT")
+                self._in_transaction = False
+                self._purge(self._written.keys())
+                self._written = {}
+
+    def rollback(self) -> None:
+        """Rolls back the transaction and purges payload files written in the transaction."""
+        with self._lock:
+            if self._in_transaction:
+                self._connection.execute("ROLLBACK")
+                self._in_transaction = False
+                self._purge(self._written.keys())
+                self._written = {}
+
+    def select(self, oid: str) -> Union[Entity, list]:
+        """Returns the entity, or an empty list if the entity does not exist."""
+        entity = self._get(oid)
+        return [] if entity is None else entity
+
+    def insert(self, entity: Entity) -> None:
+        """Inserts an entity into object storage."""
+        with self._lock:
+            if self.exists(entity.oid):
+                msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+            self._put(entity, sql=f"INSERT INTO {self.__table} (entity, oid) VALUES (?, ?)")
+            msg = f"Inserted entity oid: {entity.oid}."
+            self._logger.info(msg)
+
+    def update(self, entity: Entity) -> None:
+        """Updates an existing entity in object storage."""
+        with self._lock:
+            if not self.exists(entity.oid):
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            self._put(entity, sql=f"UPDATE {self.__table} SET entity = ? WHERE oid = ?")
+            msg = f"Updated entity oid: {entity.oid}."
+            self._logger.info(msg)
+
+    def delete(self, oid: str) -> None:
+        """Deletes an entity from object storage."""
+        with self._lock:
+            self.open()
+            cursor = self._connection.execute(f"DELETE FROM {self.__table} WHERE oid = ?", (oid,))
+            if cursor.rowcount == 0:
+                msg = f"Unable to delete entity oid: {oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            self._track(oid, None)
+            msg = f"Deleted object with oid = {oid} from object storage."
+            self._logger.info(msg)
+
+    def exists(self, oid: str) -> bool:
+        """Checks existence of an object in the storage"""
+        with self._lock:
+            self.open()
+            row = self._connection.execute(
+                f"SELECT 1 FROM {self.__table} WHERE oid = ?", (oid,)
+            ).fetchone()
+        return row is not None
+
+    def select_many(self, oids: list) -> dict:
+        """Selects the entities with the designated oids, keyed by oid, in the order designated."""
+        rows = dict(self._query_many("SELECT oid, entity", oids))
+        return {oid: Codec.decode(rows[oid]) for oid in oids if oid in rows}
+
+    def insert_many(self, entities: list) -> None:
+        """Inserts entities in a single transaction. No entity is inserted if any already exists."""
+        with self._lock:
+            existing = self.exists_many([entity.oid for entity in entities])
+            if existing:
+                msg = f"Unable to insert entities. Entities {existing} already exist."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+            with self._batch():
+                for entity in entities:
+                    self._put(entity, sql=f"INSERT INTO {self.__table} (entity, oid) VALUES (?, ?)")
+            msg = f"Inserted {len(entities)} entities."
+            self._logger.info(msg)
+
+    def delete_many(self, oids: list) -> None:
+        """Deletes entities in a single transaction. No entity is deleted if any does not exist."""
+        with self._lock:
+            existing = self.exists_many(oids)
+            missing = [oid for oid in oids if oid not in existing]
+            if missing:
+                msg = f"Unable to delete entities. Entities {missing} do not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            with self._batch():
+                for oid in oids:
+                    self._connection.execute(f"DELETE FROM {self.__table} WHERE oid = ?", (oid,))
+                    self._track(oid, None)
+            msg = f"Deleted {len(oids)} entities from object storage."
+            self._logger.info(msg)
+
+    def exists_many(self, oids: list) -> list:
+        """Returns the oids of the entities that exist."""
+        existing = {row[0] for row in self._query_many("SELECT oid", oids)}
+        return [oid for oid in oids if oid in existing]
+
+    def oids(self) -> list:
+        """Returns the oids of the entities that exist."""
+        with self._lock:
+            self.open()
+            return [row[0] for row in self._connection.execute(f"SELECT oid FROM {self.__table}")]
+
+    @contextmanager
+    def _batch(self):
+        """Runs the statements in a transaction, unless one is already in progress."""
+        if self._in_transaction:
+            yield
+            return
+        self.begin()
+        try:
+            yield
+        except Exception:
+            self.rollback()
+            raise
+        self.commit()
+
+    def _query_many(
+        self, select: str, oids: list, connection: sqlite3.Connection = None
+    ) -> list:
+        """Runs the select for the designated oids, in chunks within SQLite's variable limit.
+
+        Args:
+            select (str): The select clause.
+            oids (list): The oids of the entities to select.
+            connection (sqlite3.Connection): The connection on which to run the select, e.g.
+                a snapshot's read connection. If None, the cursor's connection is used.
+        """
+        rows = []
+        oids = list(dict.fromkeys(oids))
+        with self._lock:
+            if connection is None:
+                self.open()
+                connection = self._connection
+            for i in range(0, len(oids), self.__chunksize):
+                chunk = oids[i : i + self.__chunksize]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(
+                    connection.execute(
+                        f"{select} FROM {self.__table} WHERE oid IN ({placeholders})", chunk
+                    )
+                )
+        return rows
+
+    def _get(self, oid: str) -> Union[Entity, None]:
+        with self._lock:
+            self.open()
+            row = self._connection.execute(
+                f"SELECT entity FROM {self.__table} WHERE oid = ?", (oid,)
+            ).fetchone()
+        return None if row is None else Codec.decode(row[0])
+
+    def _put(self, entity: Entity, sql: str) -> None:
+        clone = self._frames.detach(entity, purge=False)
+        self._connection.execute(sql, (self._codec.encode(clone), entity.oid))
+        self._track(entity.oid, clone)
+
+    def _track(self, oid: str, entity: Union[Entity, None]) -> None:
+        """Records the persisted entity for purging at the end of the transaction, or purges the
+        superseded payload files immediately if not in a transaction."""
+        if self._in_transaction:
+            self._written[oid] = entity
+        else:
+            self._purge([oid])
+
+    def _purge(self, oids) -> None:
+        """Purges the payload files of the entities not referenced by their committed versions.
+
+        While a snapshot is held, payload files it may read are kept, and the purge is deferred
+        until the next commit after all snapshots are released.
+        """
+        self._deferred.update(oids)
+        if self._generations.oldest() is not None:
+            return
+        for oid in self._deferred:
+            self._frames.purge(oid, self._get(oid))
+        self._deferred = set()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SQLITE SNAPSHOT                                            #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteSnapshot(Snapshot):
+    """Read-only view of a SQLite object store as of the last commit.
+
+    The snapshot holds a read transaction open on a connection of its own. In write-ahead
+    logging mode, the transaction reads the database as of its first read, regardless of commits
+    made since, and readers never wait for the writer. The snapshot's pin defers the purge of
+    DataFrame payloads superseded while it is held.
+
+    Args:
+        storage (SQLiteCursor): The object storage.
+        generations (Generations): The store's reader registry.
+    """
+
+    def __init__(self, storage: SQLiteCursor, generations: Generations) -> None:
+        super().__init__(storage=storage, generations=generations)
+        self._connection = sqlite3.connect(
+            storage._filepath, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("BEGIN")
+        # The read transaction's snapshot is established by its first read.
+        self._connection.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+    def select(self, oid: str) -> Union[Entity, list]:
+        """Returns the entity as of the snapshot, or an empty list if it did not exist."""
+        return self.select_many([oid]).get(oid, [])
+
+    def select_many(self, oids: list) -> dict:
+        """Returns the entities that existed as of the snapshot, keyed by oid."""
+        self._check()
+        rows = dict(self._storage._query_many("SELECT oid, entity", oids, self._connection))
+        return {oid: Codec.decode(rows[oid]) for oid in oids if oid in rows}
+
+    def exists(self, oid: str) -> bool:
+        """Returns True if the entity existed as of the snapshot."""
+        self._check()
+        return bool(self._storage._query_many("SELECT oid", [oid], self._connection))
+
+    def release(self) -> None:
+        """Ends the read transaction and releases the snapshot's pin."""
+        if self._pin is not None:
+            self._connection.execute("ROLLBACK")
+            self._connection.close()
+        super().release()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 SQLITE OBJECT DATABASE CONNECTION                                #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteObjectDBConnection(Connection):
+    """Connection to an object store held in an embedded SQLite database.
+
+    Unlike the shelve based ObjectDBConnection, changes made in a transaction are not staged in
+    a cache. Transactions are begun, committed and rolled back in the database itself, hence the
+    cache is None.
+
+    Args:
+        codec (str): Compression codec for stored entities and DataFrame payloads. One of 'none',
+            'zlib', 'lz4', or 'zstd'. Default is None, i.e. no compression.
+        level (int): Compression level. If None, the codec's default level is used.
+        dedup (bool): Whether DataFrame columns are stored as content addressed blocks, so
+            identical columns across Datasets are stored once. Default is False.
+    """
+
+    def __init__(
+        self, codec: str = None, level: int = None, dedup: bool = False, *args, **kwargs
+    ) -> None:
+        super().__init__()
+        self._codec = None if codec is None else get_codec(name=codec, level=level)
+        self._location = self._set_location()
+        self._storage = SQLiteCursor(self._location, codec=self._codec, dedup=dedup)
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def persistent(self) -> bool:
+        return True
+
+    @property
+    def storage(self) -> SQLiteCursor:
+        return self._storage
+
+    @property
+    def cache(self) -> None:
+        return None
+
+    def open(self) -> None:
+        """Opens a database connection."""
+        self._storage.open()
+        self._is_open = True
+        self._logger.debug("connection is open.")
+
+    def begin(self) -> None:
+        """Starts a transaction."""
+        self._storage.begin()
+        self._is_open = True
+        self._in_transaction = True
+
+    def close(self) -> None:
+        """Closes the connection. Changes not committed are rolled back."""
+        self._storage.close()
+        self._is_open = False
+        self._in_transaction = False
+        self._logger.debug("is closed.")
+
+    def flush(self) -> None:
+        """Changes are written to disk on commit."""
+        self._storage.flush()
+
+    def commit(self) -> None:
+        """Commits the transaction."""
+        self._storage.commit()
+        self._in_transaction = False
+
+    def rollback(self) -> None:
+        """Rolls back changes made to the database since the transaction began."""
+        self._storage.rollback()
+        self._in_transaction = False
+
+    def drop(self) -> None:
+        self._storage.drop()
+        self._is_open = False
+        self._in_transaction = False
+
+    def _set_location(self) -> str:
+        """Obtains the database location based upon the current mode environment variable."""
+        dotenv.load_dotenv()
+        mode = os.getenv("MODE")
+        location = os.getenv("ODB_LOCATION")
+        name = os.getenv("ODB_NAME")
+        return os.path.join(location, mode, name)
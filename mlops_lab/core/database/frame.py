@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/frame.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 10:02:18 am                                              #
+# Modified   : Saturday October 17th 2026 11:40:05 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Columnar side-car storage for DataFrame payloads in the object database."""
+import os
+import copy
+import time
+import uuid
+import pickle
+import shutil
+import struct
+import hashlib
+import logging
+from glob import glob
+from collections import Counter
+from contextlib import contextmanager
+import pandas as pd
+
+from mlops_lab.core.database import blob
+from mlops_lab.core.database.codec import Codec
+from mlops_lab.core.entity.base import Entity
+from mlops_lab.core.entity.dataset import DataFrame, DataLoader
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+BLOCKS = ".blocks"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      FRAME REFERENCE                                             #
+# ------------------------------------------------------------------------------------------------ #
+class FrameRef(DataLoader):
+    """Reference to a DataFrame payload persisted in Arrow IPC format.
+
+    The reference is pickled with the entity in place of the payload, and the payload is
+    loaded when the DataFrame's data are first accessed.
+
+    Args:
+        filepath (str): Path to the Arrow IPC file containing the payload.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+
+    def __repr__(self) -> str:
+        return f"FrameRef({self._filepath})"
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def load(self) -> pd.DataFrame:
+        """Reads the payload by memory mapping the Arrow IPC file."""
+        with pa.memory_map(self._filepath, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        return to_pandas(table)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class BlobRef(FrameRef):
+    """Reference to a DataFrame payload persisted as a pickle protocol 5 blob.
+
+    The payload's numpy buffers are backed by a memory map of the blob file, rather than copied
+    from a pickle byte string.
+
+    Args:
+        filepath (str): Path to the blob file containing the payload.
+    """
+
+    def __repr__(self) -> str:
+        return f"BlobRef({self._filepath})"
+
+    def load(self) -> pd.DataFrame:
+        """Reads the payload by memory mapping the blob file."""
+        return blob.load(self._filepath)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class BlockRef(FrameRef):
+    """Reference to a DataFrame payload persisted as content addressed column blocks.
+
+    The referenced file is a manifest holding the payload's Arrow schema and the digest of each
+    column. Columns are stored in <location>/.blocks as Arrow IPC files named by digest, and are
+    shared by every payload containing an identical column.
+
+    Args:
+        filepath (str): Path to the manifest.
+    """
+
+    def __repr__(self) -> str:
+        return f"BlockRef({self._filepath})"
+
+    def load(self) -> pd.DataFrame:
+        """Reads the payload by memory mapping its column blocks."""
+        with open(self._filepath, "rb") as file:
+            manifest = pickle.load(file)
+        location = os.path.dirname(os.path.dirname(self._filepath))
+        columns = []
+        for digest in manifest["blocks"]:
+            with pa.memory_map(get_block_filepath(location, digest), "r") as source:
+                columns.append(pa.ipc.open_file(source).read_all().column(0))
+        schema = pa.ipc.read_schema(pa.py_buffer(manifest["schema"]))
+        return to_pandas(pa.Table.from_arrays(columns, schema=schema))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       FRAME STORE                                                #
+# ------------------------------------------------------------------------------------------------ #
+class FrameStore:
+    """Persists DataFrame payloads as Arrow IPC files next to the object store.
+
+    Entities are detached from their payloads before pickling, i.e. each pd.DataFrame is written
+    to <location>/<entity oid>/<dataframe oid>.arrow and replaced with a FrameRef in a
+    shallow copy of the entity. Entities read from the object store retain the references, so
+    payloads are read from memory mapped files only for the DataFrames whose data are accessed.
+
+    Each DataFrame's payload is persisted independently of the Dataset record. Datasets track
+    the DataFrames added or replaced since they were last persisted, and the payloads of the
+    other DataFrames are not rewritten, even if loaded, provided the files they were loaded
+    from, or last written to, remain in place. Hence, an update rewrites only the changed
+    payloads and the Dataset record. Payloads modified in place must be replaced via
+    Dataset.update_dataframe to be persisted. Other than this bookkeeping, the caller's entity
+    is not modified; in particular, its changes are not marked persisted, as the write may yet
+    be rolled back.
+
+    If pyarrow is not installed, or a payload cannot be converted to Arrow, the payload is
+    written to <dataframe oid>.blob with pickle protocol 5, its buffers out-of-band, and
+    replaced with a BlobRef.
+
+    If dedup is True, each column is stored once in <location>/.blocks, addressed by a digest of
+    its type and buffers, and the payload is written to <dataframe oid>.blocks as a manifest of
+    its columns, referenced by a BlockRef. Columns copied unchanged from one Dataset to another
+    are thereby stored once. The reference count of a block is the number of manifests listing
+    it. Blocks no longer referenced are removed by collect(). Writers hold a shared lock on
+    <location>/.blocks/.lock from the time they look up a block until the manifest referencing
+    it is written, and collect() holds it exclusively, so a block being reused is never
+    collected.
+
+    Args:
+        location (str): Directory in which the payloads are stored.
+        codec (Codec): Codec for the payload files. Arrow IPC files support lz4 and zstd
+            compression. Payloads are written uncompressed for other codecs.
+        versioned (bool): If True, each payload written is given a unique file name, e.g.
+            <dataframe oid>.<version>.arrow, rather than replacing the prior file, so the prior
+            payloads remain intact until purged. Used by stores in which entity writes may be
+            rolled back. Default is False.
+        dedup (bool): Whether to store columns as content addressed blocks shared across
+            payloads. Requires pyarrow. Default is False.
+    """
+
+    __ipc_codecs = ["lz4", "zstd"]
+
+    def __init__(
+        self, location: str, codec: Codec = None, versioned: bool = False, dedup: bool = False
+    ) -> None:
+        self._location = location
+        self._codec = codec
+        self._versioned = versioned
+        self._dedup = dedup
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        self._options = self._set_write_options()
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if payloads are stored in columnar format."""
+        return pa is not None
+
+    @property
+    def dedup(self) -> bool:
+        """Returns True if columns are stored as content addressed blocks."""
+        return self._dedup and self.enabled
+
+    def detach(self, entity: Entity, purge: bool = True) -> Entity:
+        """Writes the entity's DataFrame payloads to disk and returns a copy that references them.
+
+        Args:
+            entity (Entity): The entity to be persisted in the object store.
+            purge (bool): Whether to remove payload files no longer referenced by the entity.
+                If False, the caller purges them once the entity has been persisted. Default
+                is True.
+        """
+        if not self._has_payload(entity):
+            if purge:
+                self.remove(entity.oid)
+            return entity
+
+        directory = self._get_directory(entity.oid)
+        os.makedirs(directory, exist_ok=True)
+
+        if isinstance(entity, DataFrame):
+            clone = self._detach_dataframe(dataframe=entity, directory=directory)
+        else:
+            clone = copy.copy(entity)
+            clone._dataframes = {
+                name: self._detach_dataframe(
+                    dataframe=dataframe, directory=directory, parent=entity, parent_clone=clone
+                )
+                for name, dataframe in entity.dataframes.items()
+            }
+            if hasattr(entity, "mark_clean"):
+                # The caller's entity is marked clean by the database once the write is committed.
+                clone.mark_clean()
+        if purge:
+            self._purge(directory=directory, keep=self.get_filenames(clone))
+        return clone
+
+    def purge(self, oid: str, entity: Entity = None) -> None:
+        """Removes the payload files for the oid not referenced by the persisted entity.
+
+        Args:
+            oid (str): The entity's object id.
+            entity (Entity): The entity as persisted in the object store. If None, i.e. the
+                entity does not exist, all payloads for the oid are removed.
+        """
+        self.retain(oid, filenames=None if entity is None else self.get_filenames(entity))
+
+    def retain(self, oid: str, filenames: list) -> None:
+        """Removes the payload files for the oid other than those designated.
+
+        Args:
+            oid (str): The entity's object id.
+            filenames (list): Names of the payload files to retain. If empty or None, all payloads
+                for the oid are removed.
+        """
+        directory = self._get_directory(oid)
+        if not filenames:
+            self.remove(oid)
+        elif os.path.exists(directory):
+            self._purge(directory=directory, keep=filenames)
+
+    def get_filenames(self, entity: Entity) -> list:
+        """Returns the names of the payload files referenced by the entity."""
+        return [
+            os.path.basename(dataframe._data.filepath)
+            for dataframe in get_dataframes(entity)
+            if isinstance(dataframe._data, FrameRef)
+        ]
+
+    def remove(self, oid: str) -> None:
+        """Removes the payloads for the entity with the designated oid."""
+        directory = self._get_directory(oid)
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+            msg = f"Removed DataFrame payloads for entity oid: {oid}."
+            self._logger.debug(msg)
+
+    def drop(self) -> None:
+        """Removes all payloads."""
+        shutil.rmtree(self._location, ignore_errors=True)
+
+    def prune(self, oids: list) -> None:
+        """Removes the payloads of entities other than those designated, e.g. entities deleted
+        from the object store without their payloads being removed."""
+        if os.path.exists(self._location):
+            oids = set(oids)
+            for oid in os.listdir(self._location):
+                if oid not in oids and oid != BLOCKS:
+                    self.remove(oid)
+
+    def refcounts(self) -> Counter:
+        """Returns the number of references to each column block held by the payload manifests."""
+        refcounts = Counter()
+        for filepath in glob(os.path.join(self._location, "*", "*.blocks")):
+            try:
+                with open(filepath, "rb") as file:
+                    refcounts.update(pickle.load(file)["blocks"])
+            except FileNotFoundError:  # pragma: no cover
+                # The manifest was purged while the manifests were being read.
+                continue
+        return refcounts
+
+    def collect(self, grace: float = 0) -> dict:
+        """Removes column blocks not referenced by any payload manifest.
+
+        Collection waits for writers of blocks and manifests to finish, and writers wait for
+        collection to finish, so blocks reused by a payload being written are retained. Where
+        file locks are unavailable, i.e. on platforms without fcntl, blocks are instead protected
+        by being touched when reused, and the grace period must exceed the duration of any write.
+
+        Args:
+            grace (float): Blocks modified within this many seconds of the start of collection are
+                retained. Default is 0.
+
+        Returns a dictionary containing the number of blocks removed and the bytes reclaimed.
+        """
+        blocks, reclaimed = 0, 0
+        if not os.path.isdir(os.path.join(self._location, BLOCKS)):
+            return {"blocks": blocks, "reclaimed": reclaimed}
+        with self._locked(exclusive=True):
+            start = time.time()
+            refcounts = self.refcounts()
+            for digest, filepath in self._get_blocks().items():
+                if refcounts[digest] == 0 and os.path.getmtime(filepath) < start - grace:
+                    reclaimed += os.path.getsize(filepath)
+                    os.remove(filepath)
+                    blocks += 1
+        msg = f"Collected {blocks} unreferenced column blocks, reclaiming {reclaimed:,} bytes."
+        self._logger.debug(msg)
+        return {"blocks": blocks, "reclaimed": reclaimed}
+
+    def dedup_report(self) -> dict:
+        """Returns the bytes saved by storing identical columns once.
+
+        The report contains the number of blocks, the references to them, the bytes the
+        referenced blocks would occupy were each reference stored separately, the bytes they
+        occupy, the bytes saved, and the number of blocks awaiting collection.
+        """
+        refcounts = self.refcounts()
+        blocks = self._get_blocks()
+        sizes = {digest: os.path.getsize(filepath) for digest, filepath in blocks.items()}
+        logical = sum(sizes.get(digest, 0) * count for digest, count in refcounts.items())
+        stored = sum(sizes.get(digest, 0) for digest in refcounts)
+        return {
+            "blocks": len(blocks),
+            "references": sum(refcounts.values()),
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+            "saved_bytes": logical - stored,
+            "unreferenced": len(blocks.keys() - refcounts.keys()),
+        }
+
+    def _detach_dataframe(
+        self,
+        dataframe: DataFrame,
+        directory: str,
+        parent: Entity = None,
+        parent_clone: Entity = None,
+    ) -> DataFrame:
+        """Returns a copy of the dataframe referencing its payload on disk."""
+        clone = copy.copy(dataframe)
+        # Point back-references to the parent Dataset to its copy; otherwise, the original
+        # parent, including its payloads, would be pickled with the clone.
+        if parent is not None:
+            for k, v in clone.__dict__.items():
+                if v is parent:
+                    setattr(clone, k, parent_clone)
+
+        if isinstance(dataframe._data, FrameRef):
+            # Payloads not accessed since the entity was read are unchanged.
+            ref = dataframe._data
+            if os.path.dirname(ref.filepath) != directory:
+                extension = os.path.splitext(ref.filepath)[1]
+                filepath = self._get_filepath(dataframe, directory, extension)
+                shutil.copyfile(ref.filepath, filepath)
+                clone._data = ref.__class__(filepath)
+        elif isinstance(dataframe._data, pd.DataFrame):
+            ref = self._get_persisted(dataframe=dataframe, directory=directory, parent=parent)
+            if ref is None:
+                ref = self._write(dataframe=dataframe, directory=directory)
+                dataframe._persisted = ref
+            else:
+                msg = f"DataFrame {dataframe.oid} is unchanged. Payload at {ref.filepath} is retained."
+                self._logger.debug(msg)
+            clone._data = ref
+        return clone
+
+    def _get_persisted(
+        self, dataframe: DataFrame, directory: str, parent: Entity = None
+    ) -> FrameRef:
+        """Returns the reference to the loaded payload's file if the payload is unchanged since it
+        was read or written, otherwise None."""
+        ref = getattr(dataframe, "_persisted", None)
+        if (
+            ref is None
+            or not hasattr(parent, "is_dirty")
+            or parent.is_dirty(dataframe.name)
+            or os.path.dirname(ref.filepath) != directory
+            or not os.path.exists(ref.filepath)
+        ):
+            return None
+        return ref
+
+    def _write(self, dataframe: DataFrame, directory: str) -> FrameRef:
+        """Writes the payload in columnar format if possible, otherwise as a blob."""
+        if self.enabled:
+            extension, ref = (".blocks", BlockRef) if self.dedup else (".arrow", FrameRef)
+            filepath = self._get_filepath(dataframe, directory, extension)
+            try:
+                if self.dedup:
+                    self._write_blocks(data=dataframe._data, filepath=filepath)
+                else:
+                    self._write_arrow(data=dataframe._data, filepath=filepath)
+                return ref(filepath)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                msg = f"Unable to store DataFrame {dataframe.oid} in columnar format. The payload will be stored as a blob.\n{e}"
+                self._logger.warning(msg)
+        filepath = self._get_filepath(dataframe, directory, ".blob")
+        blob.dump(dataframe._data, filepath)
+        msg = f"Wrote DataFrame payload to {filepath}."
+        self._logger.debug(msg)
+        return BlobRef(filepath)
+
+    def _write_arrow(self, data: pd.DataFrame, filepath: str) -> None:
+        """Writes the payload to an Arrow IPC file, replacing any existing file atomically."""
+        self._write_table(table=pa.Table.from_pandas(data), filepath=filepath)
+        msg = f"Wrote DataFrame payload to {filepath}."
+        self._logger.debug(msg)
+
+    def _write_blocks(self, data: pd.DataFrame, filepath: str) -> None:
+        """Writes the columns not already stored as blocks, then the payload's manifest."""
+        table = pa.Table.from_pandas(data)
+        digests = []
+        written = 0
+        # Blocks are not collected until the manifest referencing them is written.
+        with self._locked(exclusive=False):
+            for column in table.columns:
+                digest = hash_column(column)
+                blockpath = get_block_filepath(self._location, digest)
+                if os.path.exists(blockpath):
+                    # Touched for collection without file locks. See collect().
+                    os.utime(blockpath)
+                else:
+                    os.makedirs(os.path.dirname(blockpath), exist_ok=True)
+                    self._write_table(
+                        table=pa.Table.from_arrays([column], names=["block"]), filepath=blockpath
+                    )
+                    written += 1
+                digests.append(digest)
+
+            manifest = {"schema": table.schema.serialize().to_pybytes(), "blocks": digests}
+            tempfile = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(tempfile, "wb") as file:
+                pickle.dump(manifest, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tempfile, filepath)
+        msg = f"Wrote DataFrame manifest to {filepath}. Wrote {written} of {len(digests)} column blocks."
+        self._logger.debug(msg)
+
+    def _write_table(self, table: "pa.Table", filepath: str) -> None:
+        """Writes the table to an Arrow IPC file, replacing any existing file atomically."""
+        tempfile = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+        with pa.OSFile(tempfile, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=self._options) as writer:
+                writer.write_table(table)
+        os.replace(tempfile, filepath)
+
+    def _set_write_options(self) -> "pa.ipc.IpcWriteOptions":
+        """Returns Arrow IPC write options with compression corresponding to the codec."""
+        if not self.enabled or self._codec is None or self._codec.name not in self.__ipc_codecs:
+            return None
+        if not pa.Codec.is_available(self._codec.name):  # pragma: no cover
+            msg = f"Arrow was built without {self._codec.name} support. DataFrame payloads will not be compressed."
+            self._logger.warning(msg)
+            return None
+        compression = (
+            pa.Codec(self._codec.name, compression_level=self._codec.level)
+            if self._codec.name == "zstd"
+            else self._codec.name
+        )
+        return pa.ipc.IpcWriteOptions(compression=compression)
+
+    def _purge(self, directory: str, keep: list) -> None:
+        """Removes payload files for DataFrames no longer in the entity."""
+        for filename in os.listdir(directory):
+            if filename not in keep:
+                os.remove(os.path.join(directory, filename))
+
+    def _has_payload(self, entity: Entity) -> bool:
+        return any(
+            isinstance(dataframe._data, (pd.DataFrame, FrameRef))
+            for dataframe in get_dataframes(entity)
+        )
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> None:
+        """Holds a shared or exclusive lock on the block lock file, which serializes collection
+        with the writers of blocks and manifests."""
+        lockpath = os.path.join(self._location, BLOCKS, ".lock")
+        os.makedirs(os.path.dirname(lockpath), exist_ok=True)
+        with open(lockpath, "a") as lockfile:
+            if fcntl is not None:
+                fcntl.flock(lockfile, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+    def _get_blocks(self) -> dict:
+        """Returns the filepaths of the column blocks, keyed by digest."""
+        return {
+            os.path.splitext(os.path.basename(filepath))[0]: filepath
+            for filepath in glob(os.path.join(self._location, BLOCKS, "*", "*.arrow"))
+        }
+
+    def _get_directory(self, oid: str) -> str:
+        return os.path.join(self._location, oid)
+
+    def _get_filepath(self, dataframe: DataFrame, directory: str, extension: str) -> str:
+        if self._versioned:
+            return os.path.join(directory, f"{dataframe.oid}.{uuid.uuid4().hex[:12]}{extension}")
+        return os.path.join(directory, f"{dataframe.oid}{extension}")
+
+
+# ------------------------------------------------------------------------------------------------ #
+def hash_column(column: "pa.ChunkedArray") -> str:
+    """Returns a digest of the column's type and contents.
+
+    Flat arrays are hashed by their buffers in place, without copying. Validity bitmaps of
+    arrays without nulls are disregarded, as they may or may not be allocated. Nested arrays are
+    hashed by their IPC serialization, which accounts for the offsets of their children.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(str(column.type).encode())
+    for chunk in column.chunks:
+        if pa.types.is_nested(chunk.type):
+            buffers = [pa.record_batch([chunk], names=["block"]).serialize()]
+        elif pa.types.is_dictionary(chunk.type):
+            buffers = _get_buffers(chunk.indices) + _get_buffers(chunk.dictionary)
+            digest.update(struct.pack("<qq", chunk.indices.offset, chunk.dictionary.offset))
+        else:
+            buffers = _get_buffers(chunk)
+        digest.update(struct.pack("<qqq", len(chunk), chunk.offset, chunk.null_count))
+        for buffer in buffers:
+            if buffer is None:
+                digest.update(struct.pack("<q", -1))
+            else:
+                digest.update(struct.pack("<q", buffer.size))
+                digest.update(buffer)
+    return digest.hexdigest()
+
+
+def _get_buffers(array: "pa.Array") -> list:
+    """Returns the array's buffers, omitting the validity bitmap if the array has no nulls."""
+    buffers = array.buffers()
+    if array.null_count == 0:
+        buffers[0] = None
+    return buffers
+
+
+# ------------------------------------------------------------------------------------------------ #
+def to_pandas(table: "pa.Table", writable: bool = True) -> pd.DataFrame:
+    """Converts a table read from payload files to a pandas DataFrame without doubling its memory.
+
+    Each column is converted to its own block rather than consolidated, and its Arrow memory is
+    released once converted, so the peak exceeds the size of the DataFrame by at most one column.
+    Numeric and boolean columns without nulls are converted without copying. Arrow buffers are
+    immutable, so these columns are read-only whether or not the payload is compressed. Unless
+    writable is False, they are therefore copied one at a time into writable arrays.
+
+    Args:
+        table (pa.Table): Table read from payload files.
+        writable (bool): Whether every column must be writable. Defaults to True. If False,
+            zero-copy columns are left read-only, and in-place writes to them raise.
+    """
+    frame = table.to_pandas(split_blocks=True, self_destruct=True)
+    if writable:
+        for i in range(frame.shape[1]):
+            values = frame.iloc[:, i].to_numpy(copy=False)
+            if getattr(values, "flags", None) is not None and not values.flags.writeable:
+                frame.isetitem(i, values.copy())
+    return frame
+
+
+# ------------------------------------------------------------------------------------------------ #
+def get_block_filepath(location: str, digest: str) -> str:
+    """Returns the path of the column block with the designated digest."""
+    return os.path.join(location, BLOCKS, digest[:2], f"{digest}.arrow")
+
+
+# ------------------------------------------------------------------------------------------------ #
+def get_dataframes(entity: Entity) -> list:
+    """Returns the DataFrames held by the entity."""
+    if isinstance(entity, DataFrame):
+        return [entity]
+    elif getattr(entity, "is_composite", False) and hasattr(entity, "dataframes"):
+        return list(entity.dataframes.values())
+    return []
+
+
+# ------------------------------------------------------------------------------------------------ #
+def payload_size(entity: Entity, loaded_only: bool = True) -> int:
+    """Returns the memory usage in bytes of the entity's DataFrame payloads.
+
+    Args:
+        entity (Entity): The entity to be sized.
+        loaded_only (bool): If True, payloads deferred until access are excluded. Default is True.
+    """
+    return int(
+        sum(
+            dataframe.size or 0
+            for dataframe in get_dataframes(entity)
+            if isinstance(dataframe._data, pd.DataFrame) or not loaded_only
+        )
+    )
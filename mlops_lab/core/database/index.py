@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/index.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 06:02:44 pm                                              #
+# Modified   : Saturday October 17th 2026 06:02:44 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Secondary Index for the Object Database."""
+import os
+import uuid
+import pickle
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from mlops_lab.core.entity.base import Entity
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        OBJECT INDEX                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ObjectIndex:
+    """Secondary index of the entities in an object store.
+
+    Maps entity type and name to oid, and the values of the indexed attributes, e.g. a Dataset's
+    stage and datasource_oid, to the oids of the entities holding them. The entity type is the
+    lower case class name, as in the entity's oid.
+
+    The index is held in <location>.idx. Updates are applied in memory and buffered until the
+    index is flushed, when they are merged under an exclusive lock on <location>.idx.lock into
+    the index on disk, which is replaced atomically. The index is reloaded when changed by
+    another process, with the buffered updates applied over it, so processes sharing the object
+    store share the index once flushed. The index is derived from the entities, and may be
+    rebuilt from object storage at any time, e.g. if updates were lost before being flushed.
+
+    Args:
+        location (str): The path of the object store, without extension.
+        attributes (tuple): Names of the entity attributes indexed. Entities lacking an attribute,
+            or holding None, are not indexed on it. Default is ('stage', 'datasource_oid').
+    """
+
+    __attributes = ("stage", "datasource_oid")
+
+    def __init__(self, location: str, attributes: tuple = None) -> None:
+        self._filepath = location + ".idx"
+        self._attributes = tuple(attributes or self.__attributes)
+        self._entries = {}
+        self._names = {}
+        self._values = {}
+        self._buffer = {}
+        self._stamp = None
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        self._build()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+
+    @property
+    def attributes(self) -> tuple:
+        return self._attributes
+
+    @property
+    def exists(self) -> bool:
+        """Returns True if the index has been built."""
+        return os.path.exists(self._filepath)
+
+    def lookup(self, entity: str, name: str) -> Union[str, None]:
+        """Returns the oid of the entity of the designated type and name, or None."""
+        with self._lock:
+            self._load()
+            return self._names.get((entity, name))
+
+    def find(self, entity: str = None, **attributes) -> list:
+        """Returns the oids of the entities of the designated type, if any, holding all of the
+        designated attribute values."""
+        self._check(attributes)
+        with self._lock:
+            self._load()
+            if not attributes:
+                oids = set(self._entries.keys())
+            else:
+                oids = set.intersection(
+                    *[set(self._values[k].get(v, ())) for k, v in attributes.items()]
+                )
+            if entity is not None:
+                oids = {oid for oid in oids if self._entries[oid][0] == entity}
+            return sorted(oids)
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of updates buffered until the index is flushed."""
+        with self._lock:
+            return len(self._buffer)
+
+    def apply(self, items) -> None:
+        """Indexes the (oid, entity) pairs written to object storage. Entities paired with None
+        were deleted. The updates are buffered until the index is flushed."""
+        items = [(oid, None if entity is None else self.entry(entity)) for oid, entity in items]
+        with self._lock:
+            self._load()
+            for oid, entry in items:
+                self._buffer[oid] = entry
+                self._put(oid, entry)
+
+    def flush(self) -> None:
+        """Merges the buffered updates into the index on disk."""
+        with self._lock:
+            if not self._buffer:
+                return
+            count = len(self._buffer)
+            with self._locked():
+                self._load()
+                self._write()
+                self._buffer = {}
+        msg = f"Flushed {count} updates to the object index at {self._filepath}."
+        self._logger.debug(msg)
+
+    def rebuild(self, entities: list) -> None:
+        """Replaces the index with one built from the designated entities."""
+        with self._locked():
+            self._entries = {entity.oid: self.entry(entity) for entity in entities}
+            self._buffer = {}
+            self._build()
+            self._write()
+        msg = f"Rebuilt the object index at {self._filepath} with {len(entities)} entities."
+        self._logger.debug(msg)
+
+    def retain(self, oids: list) -> None:
+        """Removes the entries of entities other than those designated."""
+        oids = set(oids)
+        with self._locked():
+            self._load()
+            if self._buffer or not set(self._entries.keys()) <= oids:
+                self._entries = {k: v for k, v in self._entries.items() if k in oids}
+                self._buffer = {}
+                self._build()
+                self._write()
+
+    def drop(self) -> None:
+        """Removes the index."""
+        with self._lock:
+            for filepath in (self._filepath, self._filepath + ".lock"):
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+            self._entries, self._buffer, self._stamp = {}, {}, None
+            self._build()
+
+    def entry(self, entity: Entity) -> tuple:
+        """Returns the entity's type, name, and indexed attribute values."""
+        values = {}
+        for attribute in self._attributes:
+            value = getattr(entity, attribute, None)
+            if value is not None:
+                values[attribute] = value
+        return (entity.__class__.__name__.lower(), entity.name, values)
+
+    def matches(self, entity: Entity, kind: str = None, **attributes) -> bool:
+        """Returns True if the entity is of the designated type and holds the attribute values."""
+        entity_kind, _, values = self.entry(entity)
+        return (kind is None or entity_kind == kind) and all(
+            attribute in values and values[attribute] == value
+            for attribute, value in attributes.items()
+        )
+
+    def _check(self, attributes: dict) -> None:
+        unindexed = [attribute for attribute in attributes if attribute not in self._attributes]
+        if unindexed:
+            msg = f"Attributes {unindexed} are not indexed. Indexed: {list(self._attributes)}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+    def _load(self) -> None:
+        """Reads the index if changed since last read, and applies the buffered updates."""
+        try:
+            stat = os.stat(self._filepath)
+        except FileNotFoundError:
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if stamp != self._stamp:
+            with open(self._filepath, "rb") as file:
+                self._entries = pickle.load(file)
+            self._stamp = stamp
+            self._build()
+            for oid, entry in self._buffer.items():
+                self._put(oid, entry)
+
+    def _write(self) -> None:
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        tempfile = f"{self._filepath}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tempfile, "wb") as file:
+            pickle.dump(self._entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tempfile, self._filepath)
+        stat = os.stat(self._filepath)
+        self._stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _put(self, oid: str, entry: Union[tuple, None]) -> None:
+        """Replaces the entity's entry, and its name and attribute mappings. Removes them if the
+        entry is None."""
+        previous = self._entries.pop(oid, None)
+        if previous is not None:
+            kind, name, values = previous
+            if self._names.get((kind, name)) == oid:
+                del self._names[(kind, name)]
+            for attribute, value in values.items():
+                if attribute in self._values:
+                    self._values[attribute][value].discard(oid)
+        if entry is not None:
+            self._entries[oid] = entry
+            kind, name, values = entry
+            self._names[(kind, name)] = oid
+            for attribute, value in values.items():
+                if attribute in self._values:
+                    self._values[attribute][value].add(oid)
+
+    def _build(self) -> None:
+        """Builds the name and attribute maps from the entries."""
+        self._names = {}
+        self._values = {attribute: defaultdict(set) for attribute in self._attributes}
+        for oid, (kind, name, values) in self._entries.items():
+            self._names[(kind, name)] = oid
+            for attribute, value in values.items():
+                if attribute in self._values:
+                    self._values[attribute][value].add(oid)
+
+    @contextmanager
+    def _locked(self) -> None:
+        """Holds the thread lock and an exclusive lock on the index lock file."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+            with open(self._filepath + ".lock", "a") as lockfile:
+                if fcntl is not None:
+                    fcntl.flock(lockfile, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lockfile, fcntl.LOCK_UN)
@@ -18,16 +18,43 @@
 # ================================================================================================ #
 """Object persistence module"""
 import os
+import sys
+import zlib
+import shutil
+import pickle
+import threading
+from time import perf_counter
 from abc import abstractmethod
+from collections import defaultdict
 import dotenv
 import shelve
 from typing import Union
 from glob import glob
 import logging
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 from mlops_lab.core.database.base import Connection, AbstractDatabase
+from mlops_lab.core.database.frame import FrameStore, payload_size
+from mlops_lab.core.database.cache import ReadCache
+from mlops_lab.core.database.index import ObjectIndex
+from mlops_lab.core.database.codec import Codec, get_codec
+from mlops_lab.core.database.snapshot import Generations, Snapshot, Versions
 from mlops_lab.core.entity.base import Entity
 
+# Files comprising a shelve, by suffix, for each of the dbm implementations.
+DBM_SUFFIXES = ["", ".db", ".dat", ".dir", ".bak", ".pag"]
+# Separates the oid from the generation in the keys of entity versions.
+SEPARATOR = "\x00"
+TOMBSTONES = [
+    pickle.dumps(None, protocol=protocol) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+]
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                          CURSOR                                                  #
@@ -35,34 +62,74 @@ from mlops_lab.core.entity.base import Entity
 class Cursor:
     """Abstract base class for object database cursors.
 
+    Cursors operate in one of two lifecycle modes. When the cursor has been explicitly opened,
+    the underlying shelve remains open across operations until the cursor is closed, and
+    changes are written through to disk on flush or close. Otherwise, each operation opens
+    and closes the shelve for the duration of the operation.
+
+    A cursor held open must be the sole user of the shelve. The dbm index is held in memory
+    and written back on flush or close, so changes written to the shelve by other cursors, in
+    this process or another, are neither seen by the open cursor nor preserved once it writes
+    back its index.
+
     Args:
         location (str): The path of the shelve database file.
+        codec (Codec): Codec with which entities are compressed before being written to the
+            shelve. If None, entities are pickled by the shelve uncompressed. Entities are
+            decompressed on read with the codec that compressed them.
     """
 
-    def __init__(self, location) -> None:
+    def __init__(self, location, codec: Codec = None) -> None:
         self._location = location
+        self._codec = codec
         self._cursor = None
+        self._is_open = False
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
-        self.open()
+
+    @property
+    def is_open(self) -> bool:
+        """Returns True if the underlying shelve is held open."""
+        return self._is_open
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def codec(self) -> Codec:
+        return self._codec
 
     def open(self) -> None:
-        os.makedirs(os.path.dirname(self._location), exist_ok=True)
-        self._cursor = shelve.open(self._location)
-        msg = f"Object storage opened at {self._location}"
-        self._logger.debug(msg)
+        """Opens the underlying shelve, if not already open."""
+        if not self._is_open:
+            os.makedirs(os.path.dirname(self._location), exist_ok=True)
+            self._cursor = shelve.open(self._location)
+            self._is_open = True
+            msg = f"Object storage opened at {self._location}"
+            self._logger.debug(msg)
 
     def close(self) -> None:
-        self._cursor.close()
-        msg = f"Object storage at {self._location} is closed."
-        self._logger.debug(msg)
+        """Closes the underlying shelve, writing changes to disk."""
+        if self._is_open:
+            self._cursor.close()
+            self._is_open = False
+            msg = f"Object storage at {self._location} is closed."
+            self._logger.debug(msg)
+
+    def flush(self) -> None:
+        """Writes changes to disk without closing the underlying shelve."""
+        if self._is_open:
+            self._cursor.sync()
+            msg = f"Object storage at {self._location} is flushed."
+            self._logger.debug(msg)
 
     def drop(self) -> None:
         """Delete the cursor, i.e. the shelve database."""
+        self.close()
         pattern = self._location + ".*"
         self._remove(pattern)
-        self._is_open = False
         msg = f"Pattern: {pattern}."
         self._logger.debug(msg)
         msg = f"Dropped object store at {self._location}."
@@ -70,39 +137,36 @@ class Cursor:
 
     def select(self, oid: str) -> Union[Entity, None]:
         """Select an existing entity by oid from object storage"""
-        self.open()
-        try:
-            result = self._cursor[oid]
-        except KeyError:
-            result = []
-        self.close()
+        with self._session() as cursor:
+            try:
+                result = self._load(cursor[oid])
+            except KeyError:
+                result = []
         return result
 
     def insert(self, entity: Entity) -> None:
         """Inserts an entity into the underlying object data store."""
-        self.open()
-        if entity.oid not in self._cursor.keys():
-            self._cursor[entity.oid] = entity
-            msg = f"Inserted entity oid: {entity.oid}."
-            self._logger.info(msg)
-        else:
-            msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
-            self._logger.error(msg)
-            raise FileExistsError(msg)
-        self.close()
+        with self._session() as cursor:
+            if entity.oid not in cursor:
+                cursor[entity.oid] = self._dump(entity)
+                msg = f"Inserted entity oid: {entity.oid}."
+                self._logger.info(msg)
+            else:
+                msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
 
     def update(self, entity: Entity) -> None:
         """Update an existing entity in object storage or cache."""
-        self.open()
-        if entity.oid in self._cursor.keys():
-            self._cursor[entity.oid] = entity
-            msg = f"Updated entity oid: {entity.oid}."
-            self._logger.info(msg)
-        else:
-            msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
-            self._logger.error(msg)
-            raise FileNotFoundError(msg)
-        self.close()
+        with self._session() as cursor:
+            if entity.oid in cursor:
+                cursor[entity.oid] = self._dump(entity)
+                msg = f"Updated entity oid: {entity.oid}."
+                self._logger.info(msg)
+            else:
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
 
     @abstractmethod
     def delete(self, oid: str) -> None:
@@ -110,14 +174,36 @@ class Cursor:
 
     def exists(self, oid: str) -> None:
         """Checks existence of an object in the storage"""
-        self.open()
-        exists = oid in self._cursor.keys()
+        with self._session() as cursor:
+            exists = oid in cursor
         answer = "exists" if exists else "does not exist."
         msg = f"Checked existence of {oid}. Entity {answer}."
         self._logger.debug(msg)
-        self.close()
         return exists
 
+    def _dump(self, entity: Entity) -> Union[Entity, bytes]:
+        """Prepares an entity for storage."""
+        return entity if self._codec is None else self._codec.encode(entity)
+
+    def _load(self, entity: Union[Entity, bytes]) -> Entity:
+        """Restores an entity read from storage."""
+        return Codec.decode(entity)
+
+    @contextmanager
+    def _session(self) -> shelve.Shelf:
+        """Provides the shelve for the duration of an operation.
+
+        If the cursor is held open, the open shelve is used and left open. Otherwise, the shelve
+        is opened for the operation and closed once the operation completes.
+        """
+        transient = not self._is_open
+        self.open()
+        try:
+            yield self._cursor
+        finally:
+            if transient:
+                self.close()
+
     def _remove(self, pattern) -> None:
         """Removes files that match the glob pattern."""
         file_list = glob(pattern, recursive=True)
@@ -136,56 +222,131 @@ class Cursor:
 #                                          CACHE CURSOR                                            #
 # ------------------------------------------------------------------------------------------------ #
 class CacheCursor(Cursor):
-    """Class for object cache.
+    """Transaction write buffer.
+
+    Entities inserted, updated, or deleted during a transaction are staged in memory, with
+    deletions recorded as tombstones, i.e. None, until the transaction is committed or rolled
+    back. Entities are staged by reference, so changes made to a staged entity before the
+    transaction is committed are saved with it. If a spill threshold is designated, staged
+    entities are moved to a shelve on disk once their estimated size exceeds the threshold,
+    bounding the memory held by very large transactions.
 
     Args:
         location (str): The path to the database file.
+        spill_threshold (int): Size in bytes of staged entities above which they are spilled to
+            disk. Default is None, in which case staged entities are held in memory.
 
     """
 
-    def __init__(self, location) -> None:
+    def __init__(self, location, spill_threshold: int = None) -> None:
         super().__init__(location=location)
         self._location = self._set_cache_location()
+        self._spill_threshold = spill_threshold
+        self._entries = {}
+        self._sizes = {}
+        self._spilled = set()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._spilled)
+
+    def __contains__(self, oid: str) -> bool:
+        """Returns True if an entity or tombstone is staged for the oid."""
+        return oid in self._entries or oid in self._spilled
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size in bytes of the entities staged in memory."""
+        return self._nbytes
+
+    @property
+    def spill_threshold(self) -> int:
+        return self._spill_threshold
 
     @property
     def cache(self) -> dict:
-        self.open()
-        cache = {}
-        for oid, entity in self._cursor.items():
-            cache[oid] = entity
-        return cache
+        return dict(self.items())
 
-    def reset(self) -> None:
-        self.open()
-        for oid in self._cursor.keys():
-            del self._cursor[oid]
-        self.close()
-        msg = "Cache is reset."
-        self._logger.debug(msg)
+    def items(self):
+        """Iterates over the staged (oid, entity) pairs. Deleted entities are returned as None."""
+        yield from self._entries.items()
+        if self._spilled:
+            with self._session() as cursor:
+                for oid in self._spilled:
+                    yield oid, cursor[oid]
 
-    def delete(self, oid: str) -> None:
-        """Deletes a key/value pair from object storage"""
-        self.open()
+    def select(self, oid: str) -> Union[Entity, None]:
+        """Returns the staged entity, None if deleted, or an empty list if nothing is staged."""
+        if oid in self._entries:
+            return self._entries[oid]
+        elif oid in self._spilled:
+            with self._session() as cursor:
+                return cursor[oid]
+        return []
 
-        self._cursor[oid] = None
-        msg = f"Marked entity oid = {oid} for deletion."
+    def insert(self, entity: Entity) -> None:
+        """Stages an entity for insertion."""
+        if self.exists(entity.oid):
+            msg = f"Unable to insert entity oid: {entity.oid}. Entity already exists."
+            self._logger.error(msg)
+            raise FileExistsError(msg)
+        self._stage(entity.oid, entity)
+        msg = f"Staged entity oid: {entity.oid} for insertion."
         self._logger.info(msg)
 
-        self.close()
+    def update(self, entity: Entity) -> None:
+        """Stages an entity for update."""
+        self._stage(entity.oid, entity)
+        msg = f"Staged entity oid: {entity.oid} for update."
+        self._logger.info(msg)
 
-    def exists(self, oid: str) -> None:
-        """Checks existence of an object in the storage"""
-        self.open()
-        if oid in self._cursor.keys():
-            exists = not self._cursor[oid] is None
-        else:
-            exists = False
+    def delete(self, oid: str) -> None:
+        """Stages a tombstone for the entity."""
+        self._stage(oid, None)
+        msg = f"Marked entity oid = {oid} for deletion."
+        self._logger.info(msg)
+
+    def exists(self, oid: str) -> bool:
+        """Returns True if an entity, rather than a tombstone, is staged for the oid."""
+        exists = oid in self._spilled or self._entries.get(oid) is not None
         answer = "exists" if exists else "does not exist."
         msg = f"Checked existence of {oid}. Entity {answer}."
         self._logger.debug(msg)
-        self.close()
         return exists
 
+    def reset(self) -> None:
+        """Discards all staged entities and tombstones."""
+        self._entries = {}
+        self._sizes = {}
+        self._nbytes = 0
+        if self._spilled:
+            self._spilled = set()
+            self.drop()
+        msg = "Cache is reset."
+        self._logger.debug(msg)
+
+    def _stage(self, oid: str, entity: Union[Entity, None]) -> None:
+        self._spilled.discard(oid)
+        self._entries[oid] = entity
+        size = 0 if entity is None else sys.getsizeof(entity) + payload_size(entity)
+        self._nbytes += size - self._sizes.get(oid, 0)
+        self._sizes[oid] = size
+        if self._spill_threshold is not None and self._nbytes > self._spill_threshold:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Moves the entities staged in memory to disk. Tombstones remain in memory."""
+        with self._session() as cursor:
+            for oid, entity in self._entries.items():
+                if entity is not None:
+                    cursor[oid] = entity
+                    self._spilled.add(oid)
+        self._entries = {oid: None for oid, entity in self._entries.items() if entity is None}
+        self._sizes = {oid: 0 for oid in self._entries}
+        msg = f"Spilled {len(self._spilled)} staged entities ({self._nbytes} bytes) to {self._location}."
+        self._logger.debug(msg)
+        self._nbytes = 0
+
     def _set_cache_location(self) -> str:
         return os.path.join(
             os.path.dirname(self._location), "cache", os.path.basename(self._location)
@@ -198,42 +359,713 @@ class CacheCursor(Cursor):
 class StorageCursor(Cursor):
     """Class for object storage cursors.
 
+    DataFrame payloads are stored in columnar format in a FrameStore next to the shelve. Entities
+    are returned with their payloads deferred until the data are accessed.
+
+    Entities are versioned. Each commit is assigned a generation, and each entity is stored under
+    a key suffixed with the generation, while the entity's oid maps to its Versions. Readers
+    resolve an oid to its newest version as of the published generation, or as of the generation
+    pinned by a Snapshot, so a reader never sees a commit in part. Entities stored before
+    versioning are read as of generation zero.
+
+    While the shelve is held open, the inserts, updates and deletes made since the cursor was
+    last flushed form one commit, which is written to disk and published on flush, save, close,
+    or when a snapshot is taken, and is visible in the interim through this cursor only.
+    Otherwise, each operation is a commit. The versions superseded by the commits, and their
+    DataFrame payloads, are reclaimed every reclaim_interval commits, and on compaction, once no
+    snapshot needs them. Superseded values remain in the shelve until compaction.
+
     Args:
         location (str): The path to the database file.
+        codec (Codec): Codec with which entities and DataFrame payloads are compressed.
+        frames (FrameStore): The store for DataFrame payloads. If None, payloads are stored in
+            a FrameStore in the 'frames' directory next to the shelve.
+        dedup (bool): Whether identical DataFrame columns are stored once. Ignored if frames
+            is designated. Default is False.
+        generations (Generations): The generation counter. If None, the counter is held next
+            to the shelve.
+        reclaim_interval (int): Number of commits between reclamations of superseded versions.
+            Default is 100.
 
     """
 
-    def __init__(self, location) -> None:
-        super().__init__(location=location)
+    def __init__(
+        self,
+        location,
+        codec: Codec = None,
+        frames: FrameStore = None,
+        dedup: bool = False,
+        generations: Generations = None,
+        reclaim_interval: int = 100,
+    ) -> None:
+        super().__init__(location=location, codec=codec)
+        self._frames = frames or FrameStore(
+            location=self._set_frame_location(), codec=codec, versioned=True, dedup=dedup
+        )
+        self._generations = generations or Generations(location)
+        self._reclaim_interval = reclaim_interval
+        self._held = False
+        self._batch = None
+        self._written = set()
+        self._commits = 0
+        self._nesting = 0
+        self._lock = threading.RLock()
+
+    @property
+    def frames(self) -> FrameStore:
+        return self._frames
+
+    @property
+    def generations(self) -> Generations:
+        return self._generations
+
+    def snapshot(self) -> Snapshot:
+        """Returns a snapshot of the object store as of the published generation, once the writes
+        made through the cursor are published."""
+        with self._lock:
+            self._publish()
+        return Snapshot(storage=self, generations=self._generations)
+
+    def close(self) -> None:
+        """Publishes the writes made through the cursor, and closes the underlying shelve."""
+        with self._lock:
+            try:
+                self._publish()
+            finally:
+                super().close()
+
+    def flush(self) -> None:
+        """Writes changes to disk, and publishes the writes made through the cursor, without
+        closing the underlying shelve."""
+        with self._lock:
+            if self._batch is None:
+                super().flush()
+            self._publish()
 
     def save(self, cache_cursor: CacheCursor) -> None:
-        """Commits cache to object storage."""
-        self.open()
-        cache = cache_cursor.cache
-        for oid, entity in cache.items():
-            if entity is not None:
-                self._cursor[oid] = entity
-                msg = f"Saved entity {entity.oid} to object storage."
-                self._logger.debug(msg)
-            else:
-                del self._cursor[oid]
+        """Writes the entities and tombstones staged in the cache to object storage in one pass."""
+        self.write(cache_cursor.items())
         cache_cursor.reset()
-        cache_cursor.close()
-        self.close()
+
+    def write(self, items) -> None:
+        """Writes (oid, entity) pairs to object storage in one commit, deleting entities paired
+        with None. The commit is published before returning."""
+        with self._session() as cursor:
+            self._commit(cursor, self._prepare_all(cursor, items))
+            self._publish()
+
+    def select(self, oid: str, generation: int = None) -> Union[Entity, list]:
+        """Selects an entity by oid, as of the designated generation, or the published generation
+        if None. Returns an empty list if the entity does not exist."""
+        with self._session() as cursor:
+            key = self._resolve(cursor, oid, self._state(), generation)
+            return [] if key is None else self._load(cursor[key])
+
+    def select_many(self, oids: list, generation: int = None) -> dict:
+        """Selects the entities with the designated oids in a single session.
+
+        Returns a dictionary of the entities that exist, keyed by oid.
+        """
+        with self._session() as cursor:
+            state = self._state()
+            keys = {oid: self._resolve(cursor, oid, state, generation) for oid in oids}
+            return {oid: self._load(cursor[key]) for oid, key in keys.items() if key is not None}
+
+    def insert(self, entity: Entity) -> None:
+        """Inserts an entity into the underlying object data store."""
+        self.insert_many([entity])
+
+    def insert_many(self, entities: list) -> None:
+        """Inserts entities in one commit. No entity is inserted if any already exists."""
+        with self._session() as cursor:
+            existing = self._exists_many(cursor, [entity.oid for entity in entities])
+            if existing:
+                msg = f"Unable to insert entity oid: {existing[0]}. Entity already exists."
+                if len(entities) > 1:
+                    msg = f"Unable to insert entities. Entities {existing} already exist."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+            self._commit(cursor, self._prepare_all(cursor, [(e.oid, e) for e in entities]))
+        msg = f"Inserted {len(entities)} entities."
+        self._logger.info(msg)
+
+    def update(self, entity: Entity) -> None:
+        """Update an existing entity in object storage."""
+        with self._session() as cursor:
+            if not self._exists_many(cursor, [entity.oid]):
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            self._commit(cursor, self._prepare_all(cursor, [(entity.oid, entity)]))
+        msg = f"Updated entity oid: {entity.oid}."
+        self._logger.info(msg)
 
     def delete(self, oid) -> None:
-        """Deletes a key/value pair from object storage"""
-        self.open()
+        """Deletes an entity from object storage."""
+        self.delete_many([oid])
+
+    def delete_many(self, oids: list) -> None:
+        """Deletes entities in one commit. No entity is deleted if any does not exist."""
+        with self._session() as cursor:
+            existing = self._exists_many(cursor, oids)
+            missing = [oid for oid in oids if oid not in existing]
+            if missing:
+                msg = f"Unable to delete entity oid: {missing[0]}. Entity does not exist."
+                if len(oids) > 1:
+                    msg = f"Unable to delete entities. Entities {missing} do not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            self._commit(cursor, self._prepare_all(cursor, [(oid, None) for oid in oids]))
+        msg = f"Deleted {len(oids)} entities from object storage."
+        self._logger.info(msg)
+
+    def exists(self, oid: str, generation: int = None) -> bool:
+        """Checks existence of an object in the storage"""
+        return bool(self.exists_many([oid], generation=generation))
+
+    def exists_many(self, oids: list, generation: int = None) -> list:
+        """Returns the oids of the entities that exist, checked in a single session."""
+        with self._session() as cursor:
+            return self._exists_many(cursor, oids, generation)
+
+    def oids(self, generation: int = None) -> list:
+        """Returns the oids of the entities that exist as of the designated generation, or the
+        published generation if None."""
+        with self._session() as cursor:
+            keys = [oid for oid in cursor.keys() if SEPARATOR not in oid]
+            return self._exists_many(cursor, keys, generation)
+
+    def drop(self) -> None:
+        """Delete the shelve database and DataFrame payloads."""
+        super().drop()
+        self._frames.drop()
+        self._generations.drop()
+
+    def compact(self, prune: bool = True) -> list:
+        """Rewrites the live entries into a fresh shelve, which then replaces the current shelve.
+
+        The dbm files only grow as values are replaced or deleted. Compaction reclaims the space
+        held by superseded values and tombstones, and by versions no longer visible to any
+        snapshot. Entity values are copied without being unpickled. The current files are moved
+        aside until the fresh shelve is in place, and restored if the swap fails.
+
+        Args:
+            prune (bool): Whether to remove DataFrame payloads of entities not in the store.
+
+        Returns the oids of the live entities.
+        """
+        reopen = self._is_open
+        self.close()
+        if not self._get_files(self._location):
+            return []
+
+        directory = os.path.join(
+            os.path.dirname(self._location), f".{os.path.basename(self._location)}.compact"
+        )
+        shutil.rmtree(directory, ignore_errors=True)
+        fresh_location = os.path.join(directory, "fresh", os.path.basename(self._location))
+        os.makedirs(os.path.dirname(fresh_location))
+
+        state = self._generations.read()
+        horizon = self._generations.horizon()
+        oids, retained = [], {}
+        with shelve.open(self._location, flag="r") as source:
+            with shelve.open(fresh_location, flag="n") as fresh:
+                for key in source.dict.keys():
+                    oid = key.decode(source.keyencoding)
+                    value = source.dict[key]
+                    if SEPARATOR in oid or value in TOMBSTONES:
+                        # Versions are copied with the entity's Versions.
+                        continue
+                    versions = source[oid]
+                    if not isinstance(versions, Versions):
+                        fresh.dict[key] = value
+                        oids.append(oid)
+                        continue
+                    versions, _ = versions.split(horizon, state["aborted"])
+                    if not versions:
+                        continue
+                    for _, version_key, _ in versions:
+                        if version_key is not None:
+                            encoded = version_key.encode(source.keyencoding)
+                            fresh.dict[encoded] = source.dict[encoded]
+                    fresh[oid] = versions
+                    retained[oid] = versions.filenames
+                    if versions.resolve(state["generation"], state["aborted"]) is not None:
+                        oids.append(oid)
+
+        self._swap(fresh_location=fresh_location, backup=os.path.join(directory, "backup"))
+        shutil.rmtree(directory, ignore_errors=True)
+        self._written, self._commits = set(), 0
+        for oid, filenames in retained.items():
+            self._frames.retain(oid, filenames)
+        if prune:
+            self._frames.prune(oids + list(retained.keys()))
+        if reopen:
+            self.open()
+        msg = f"Compacted object storage at {self._location}. {len(oids)} entities retained."
+        self._logger.debug(msg)
+        return oids
+
+    def _prepare_all(self, cursor: shelve.Shelf, items) -> list:
+        """Writes the DataFrame payloads of the entities to be committed, returning the
+        (oid, value, filenames) of each, where value is None for deletions. Deletions of
+        entities that do not exist are disregarded."""
+        records = []
+        for oid, entity in items:
+            if entity is not None:
+                clone = self._frames.detach(entity, purge=False)
+                records.append((oid, self._dump(clone), self._frames.get_filenames(clone)))
+            elif self._exists_many(cursor, [oid]):
+                records.append((oid, None, []))
+        return records
+
+    def _commit(self, cursor: shelve.Shelf, records: list) -> None:
+        """Writes the records as versions of a generation. While the shelve is held open, the
+        records join the cursor's pending commit, which is published by _publish. Otherwise, the
+        generation is published once the records are on disk."""
+        if not self._held:
+            with self._generations.commit() as generation:
+                self._put(cursor, records, generation)
+                cursor.sync()
+            self._written.update(oid for oid, _, _ in records)
+            self._count_commit(cursor)
+            return
+        if self._batch is None:
+            self._batch = self._generations.begin()
+        self._put(cursor, records, self._batch)
+        self._written.update(oid for oid, _, _ in records)
+
+    def _publish(self) -> None:
+        """Writes the pending commit to disk and publishes its generation, reclaiming superseded
+        versions if due."""
+        if self._batch is None:
+            return
+        generation, self._batch = self._batch, None
+        self._cursor.sync()
+        self._generations.publish(generation)
+        self._count_commit(self._cursor)
+
+    def _count_commit(self, cursor: shelve.Shelf) -> None:
+        """Counts a published commit, reclaiming the versions superseded by the entities written
+        since the last reclamation once reclaim_interval commits have been published."""
+        self._commits += 1
+        if self._commits >= self._reclaim_interval:
+            self._reclaim(cursor, sorted(self._written))
+            self._written, self._commits = set(), 0
+
+    def _put(self, cursor: shelve.Shelf, records: list, generation: int) -> None:
+        """Writes the records as versions tagged with the generation. If a record cannot be
+        written, the prior versions of the records are restored, so none are visible."""
+        prior = {}
         try:
-            del self._cursor[oid]
-            msg = f"Deleted object with oid = {oid} from object storage."
-            self._logger.info(msg)
+            for oid, value, filenames in records:
+                versions = self._get_versions(cursor, oid)
+                prior.setdefault(oid, Versions(versions))
+                key = None
+                if value is not None:
+                    key = f"{oid}{SEPARATOR}{generation}"
+                    cursor[key] = value
+                    msg = f"Saved entity {oid} to object storage at generation {generation}."
+                    self._logger.debug(msg)
+                versions.add(generation, key, filenames)
+                cursor[oid] = versions
+        except BaseException:
+            for oid, versions in prior.items():
+                cursor[oid] = versions
+            raise
+
+    def _reclaim(self, cursor: shelve.Shelf, oids: list) -> None:
+        """Drops versions of the entities that are no longer visible to any reader from their
+        Versions, and removes the DataFrame payloads referenced only by them. The values of the
+        versions dropped are removed on compaction, as deleting keys rewrites the index of some
+        dbm implementations."""
+        state = self._generations.read()
+        horizon = self._generations.horizon()
+        reclaimed = {}
+        for oid in oids:
+            versions = self._get_versions(cursor, oid)
+            retained, expired = versions.split(horizon, state["aborted"])
+            if expired:
+                cursor[oid] = retained
+                reclaimed[oid] = retained.filenames
+        # Payloads are removed once no version on disk references them.
+        cursor.sync()
+        for oid, filenames in reclaimed.items():
+            self._frames.retain(oid, filenames)
+        msg = f"Reclaimed superseded versions of {len(oids)} entities in {self._location}."
+        self._logger.debug(msg)
 
+    def _state(self) -> dict:
+        """Returns the state of the generations, with the generation of the cursor's pending
+        commit, if any, as the published generation, so its writes are visible to the cursor."""
+        state = self._generations.read()
+        if self._batch is not None:
+            state["generation"] = self._batch
+        return state
+
+    def _resolve(
+        self, cursor: shelve.Shelf, oid: str, state: dict, generation: int = None
+    ) -> Union[str, None]:
+        """Returns the key of the entity's version as of the generation, or None."""
+        try:
+            versions = cursor[oid]
         except KeyError:
-            msg = f"Unable to delete entity oid: {oid}. Entity does not exist."
+            return None
+        if not isinstance(versions, Versions):
+            return oid
+        generation = state["generation"] if generation is None else generation
+        return versions.resolve(generation, state["aborted"])
+
+    def _exists_many(self, cursor: shelve.Shelf, oids: list, generation: int = None) -> list:
+        state = self._state()
+        return [oid for oid in oids if self._resolve(cursor, oid, state, generation) is not None]
+
+    def _get_versions(self, cursor: shelve.Shelf, oid: str) -> Versions:
+        """Returns the entity's versions. Entities stored before versioning are converted."""
+        try:
+            versions = cursor[oid]
+        except KeyError:
+            return Versions()
+        if isinstance(versions, Versions):
+            return versions
+        key = f"{oid}{SEPARATOR}0"
+        cursor[key] = versions
+        filenames = self._frames.get_filenames(self._load(versions))
+        return Versions([(0, key, filenames)])
+
+    @contextmanager
+    def _session(self) -> shelve.Shelf:
+        """Provides the shelve for the duration of an operation while holding the cursor's thread
+        lock, so the cursor may be shared with a background writer. Records whether the shelve
+        is held open by the cursor's owner, in which case commits are batched."""
+        with self._lock:
+            if self._nesting == 0:
+                self._held = self._is_open
+            self._nesting += 1
+            try:
+                with super()._session() as cursor:
+                    yield cursor
+            finally:
+                self._nesting -= 1
+
+    def _swap(self, fresh_location: str, backup: str) -> None:
+        """Replaces the current shelve files with those of the fresh shelve."""
+        os.makedirs(backup)
+        moved = []
+        try:
+            for filepath in self._get_files(self._location):
+                os.replace(filepath, os.path.join(backup, os.path.basename(filepath)))
+                moved.append(filepath)
+            for filepath in self._get_files(fresh_location):
+                os.replace(filepath, self._location + filepath[len(fresh_location) :])
+        except OSError as e:  # pragma: no cover
+            for filepath in moved:
+                os.replace(os.path.join(backup, os.path.basename(filepath)), filepath)
+            msg = f"Unable to compact object storage at {self._location}. Restored prior files.\n{e}"
             self._logger.error(msg)
-            raise FileNotFoundError(msg)
-        self.close()
+            raise
+
+    def _get_files(self, location: str) -> list:
+        """Returns the files comprising the shelve at the location."""
+        return [location + suffix for suffix in DBM_SUFFIXES if os.path.isfile(location + suffix)]
+
+    def _set_frame_location(self) -> str:
+        return os.path.join(
+            os.path.dirname(self._location), "frames", os.path.basename(self._location)
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          SHARD CURSOR                                            #
+# ------------------------------------------------------------------------------------------------ #
+class ShardCursor(StorageCursor):
+    """Storage cursor for one shard of a sharded object store.
+
+    Each operation holds the shard's lock, i.e. a thread lock and an exclusive lock on the
+    shard's lock file, so threads and processes sharing the object store are serialized on the
+    shard, and only on the shard. The shelve is opened and closed within the lock for each
+    operation, so every operation sees the changes committed by other processes.
+
+    Args:
+        location (str): The path to the shard's database file.
+        codec (Codec): Codec with which entities and DataFrame payloads are compressed.
+        frames (FrameStore): The store for DataFrame payloads shared by all shards.
+        generations (Generations): The generation counter shared by all shards.
+    """
+
+    def __init__(
+        self,
+        location,
+        codec: Codec = None,
+        frames: FrameStore = None,
+        generations: Generations = None,
+    ) -> None:
+        super().__init__(location=location, codec=codec, frames=frames, generations=generations)
+        self._lock = threading.RLock()
+        self._lockfile = self._location + ".lock"
+        self._depth = 0
+
+    def open(self) -> None:
+        """Shards are opened for the duration of each operation."""
+
+    def compact(self, prune: bool = True) -> list:
+        """Compacts the shard while holding the shard's lock."""
+        with self._locked():
+            return super().compact(prune=prune)
+
+    @contextmanager
+    def _session(self) -> shelve.Shelf:
+        """Opens the shelve for the duration of an operation while holding the shard's lock."""
+        with self._locked():
+            self._cursor = shelve.open(self._location)
+            self._is_open = True
+            try:
+                yield self._cursor
+            finally:
+                self.close()
+
+    def _get_oids(self) -> list:
+        """Returns the oids of the entities with versions in the shard, including entities
+        deleted but retained for snapshots."""
+        with self._session() as cursor:
+            return [oid for oid in cursor.keys() if SEPARATOR not in oid]
+
+    @contextmanager
+    def _locked(self) -> None:
+        """Holds the shard's thread lock and an exclusive lock on the shard's lock file.
+
+        The lock is reentrant within the thread holding it.
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            os.makedirs(os.path.dirname(self._location), exist_ok=True)
+            with open(self._lockfile, "a") as lockfile:
+                if fcntl is not None:
+                    fcntl.flock(lockfile, fcntl.LOCK_EX)
+                self._depth = 1
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     SHARDED STORAGE CURSOR                                       #
+# ------------------------------------------------------------------------------------------------ #
+class ShardedStorageCursor:
+    """Object storage partitioned across shards by a hash of the entity oid.
+
+    Shards are independent shelves at <location>.<shard>, each with its own lock, so concurrent
+    readers and writers of entities in different shards do not block one another. The oid is
+    hashed with CRC32, which, unlike the builtin hash, is stable across processes. DataFrame
+    payloads are stored by entity in a FrameStore shared by the shards.
+
+    The shards share a generation counter, so a commit spanning several shards is published as
+    one generation, and a Snapshot sees it in whole or not at all.
+
+    Args:
+        location (str): The path to the database file. Shard files are suffixed with the shard.
+        shards (int): The number of shards.
+        codec (Codec): Codec with which entities and DataFrame payloads are compressed.
+        dedup (bool): Whether identical DataFrame columns are stored once. Default is False.
+    """
+
+    def __init__(
+        self, location: str, shards: int, codec: Codec = None, dedup: bool = False
+    ) -> None:
+        self._location = location
+        self._frames = FrameStore(
+            location=os.path.join(
+                os.path.dirname(location), "frames", os.path.basename(location)
+            ),
+            codec=codec,
+            versioned=True,
+            dedup=dedup,
+        )
+        self._generations = Generations(location)
+        self._shards = [
+            ShardCursor(
+                location=f"{location}.{shard:03d}",
+                codec=codec,
+                frames=self._frames,
+                generations=self._generations,
+            )
+            for shard in range(shards)
+        ]
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def frames(self) -> FrameStore:
+        return self._frames
+
+    @property
+    def generations(self) -> Generations:
+        return self._generations
+
+    @property
+    def shards(self) -> list:
+        return self._shards
+
+    @property
+    def is_open(self) -> bool:
+        return False
+
+    def open(self) -> None:
+        """Shards are opened for the duration of each operation."""
+
+    def close(self) -> None:
+        """Shards are closed at the end of each operation."""
+
+    def flush(self) -> None:
+        """Shards are written to disk at the end of each operation."""
+
+    def snapshot(self) -> Snapshot:
+        """Returns a snapshot of all shards as of the published generation."""
+        return Snapshot(storage=self, generations=self._generations)
+
+    def drop(self) -> None:
+        """Deletes all shards, DataFrame payloads, and the generation counter."""
+        for shard in self._shards:
+            shard.drop()
+        # Shards remaining from a store created with more shards
+        self._shards[0]._remove(self._location + ".[0-9][0-9][0-9].*")
+        self._generations.drop()
+
+    def compact(self) -> list:
+        """Compacts each shard, returning the oids of the live entities."""
+        oids = []
+        for shard in self._shards:
+            oids.extend(shard.compact(prune=False))
+        # Entities deleted, but retained for snapshots, keep their payloads.
+        self._frames.prune([oid for shard in self._shards for oid in shard._get_oids()])
+        return oids
+
+    def save(self, cache_cursor: CacheCursor) -> None:
+        """Writes the staged entities and tombstones to their shards in one commit."""
+        self.write(cache_cursor.items())
+        cache_cursor.reset()
+
+    def write(self, items) -> None:
+        """Writes (oid, entity) pairs to their shards in one commit, deleting entities paired
+        with None."""
+        items = list(items)
+        with self._sessions([oid for oid, _ in items]) as cursors:
+            self._commit(cursors, items)
+
+    def select(self, oid: str, generation: int = None) -> Union[Entity, list]:
+        return self.get_shard(oid).select(oid, generation=generation)
+
+    def insert(self, entity: Entity) -> None:
+        self.insert_many([entity])
+
+    def update(self, entity: Entity) -> None:
+        self.get_shard(entity.oid).update(entity)
+
+    def delete(self, oid: str) -> None:
+        self.delete_many([oid])
+
+    def exists(self, oid: str, generation: int = None) -> bool:
+        return self.get_shard(oid).exists(oid, generation=generation)
+
+    def select_many(self, oids: list, generation: int = None) -> dict:
+        """Selects the entities with the designated oids in one session per shard."""
+        entities = {}
+        for shard, shard_oids in self._group(oids).items():
+            entities.update(shard.select_many(shard_oids, generation=generation))
+        return {oid: entities[oid] for oid in oids if oid in entities}
+
+    def insert_many(self, entities: list) -> None:
+        """Inserts entities in one commit. No entity is inserted if any exists."""
+        with self._sessions([entity.oid for entity in entities]) as cursors:
+            existing = self._exists_many(cursors, [entity.oid for entity in entities])
+            if existing:
+                msg = f"Unable to insert entity oid: {existing[0]}. Entity already exists."
+                if len(entities) > 1:
+                    msg = f"Unable to insert entities. Entities {existing} already exist."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+            self._commit(cursors, [(entity.oid, entity) for entity in entities])
+
+    def delete_many(self, oids: list) -> None:
+        """Deletes entities in one commit. No entity is deleted if any does not exist."""
+        with self._sessions(oids) as cursors:
+            existing = self._exists_many(cursors, oids)
+            missing = [oid for oid in oids if oid not in existing]
+            if missing:
+                msg = f"Unable to delete entity oid: {missing[0]}. Entity does not exist."
+                if len(oids) > 1:
+                    msg = f"Unable to delete entities. Entities {missing} do not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            self._commit(cursors, [(oid, None) for oid in oids])
+
+    def exists_many(self, oids: list, generation: int = None) -> list:
+        """Returns the oids of the entities that exist, checked in one session per shard."""
+        existing = set()
+        for shard, shard_oids in self._group(oids).items():
+            existing.update(shard.exists_many(shard_oids, generation=generation))
+        return [oid for oid in oids if oid in existing]
+
+    def oids(self, generation: int = None) -> list:
+        """Returns the oids of the entities that exist in all shards."""
+        return [oid for shard in self._shards for oid in shard.oids(generation=generation)]
+
+    def get_shard(self, oid: str) -> ShardCursor:
+        """Returns the shard in which the entity with the designated oid is stored."""
+        return self._shards[zlib.crc32(oid.encode()) % len(self._shards)]
+
+    def _commit(self, cursors: dict, items: list) -> None:
+        """Writes the items to their shards as versions of one generation, publishes the
+        generation, and reclaims the versions superseded."""
+        records = {}
+        for shard, shard_items in self._group_items(items).items():
+            records[shard] = shard._prepare_all(cursors[shard], shard_items)
+        with self._generations.commit() as generation:
+            for shard, shard_records in records.items():
+                shard._put(cursors[shard], shard_records, generation)
+                shard.flush()
+        for shard, shard_records in records.items():
+            shard._written.update(oid for oid, _, _ in shard_records)
+            shard._count_commit(cursors[shard])
+
+    def _exists_many(self, cursors: dict, oids: list) -> list:
+        existing = set()
+        for shard, shard_oids in self._group(oids).items():
+            existing.update(shard._exists_many(cursors[shard], shard_oids))
+        return [oid for oid in oids if oid in existing]
+
+    @contextmanager
+    def _sessions(self, oids: list) -> dict:
+        """Opens the shards of the designated oids, holding their locks, in shard order so
+        concurrent commits do not deadlock. Yields the open shelves keyed by shard."""
+        shards = sorted(self._group(oids).keys(), key=self._shards.index)
+        with ExitStack() as stack:
+            yield {shard: stack.enter_context(shard._session()) for shard in shards}
+
+    def _group(self, oids: list) -> dict:
+        """Groups the oids by shard."""
+        shards = defaultdict(list)
+        for oid in oids:
+            shards[self.get_shard(oid)].append(oid)
+        return shards
+
+    def _group_items(self, items: list) -> dict:
+        """Groups the (oid, entity) pairs by shard."""
+        shards = defaultdict(list)
+        for oid, entity in items:
+            shards[self.get_shard(oid)].append((oid, entity))
+        return shards
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -243,14 +1075,43 @@ class ObjectDBConnection(Connection):
     """Creates an object datastore at the designated directory location.
 
     Args:
-        location (str): The path and filename for the data store. The base of the path is
-            the database name by convention.
+        persistent (bool): If True, the storage cursor is held open from the time the
+            connection is opened, or a transaction begins, until the connection is closed. Changes
+            are written to disk on commit, flush, or close. The connection must then be the sole
+            user of the object store, e.g. not shared by a pipeline and a notebook, as changes
+            made through other connections are lost. If False, each cursor operation opens and
+            closes the underlying shelve, so connections in any number of processes may share
+            the store. Default is False.
+        spill_threshold (int): Size in bytes of the entities staged in a transaction above which
+            they are spilled to disk. Default is None, i.e. transactions are staged in memory.
+        codec (str): Compression codec for stored entities and DataFrame payloads. One of 'none',
+            'zlib', 'lz4', or 'zstd'. Default is None, i.e. no compression.
+        level (int): Compression level. If None, the codec's default level is used.
+        shards (int): If greater than one, entities are partitioned by oid across the designated
+            number of independently locked shelves, allowing concurrent use of the object store by
+            multiple processes. Shards are opened for each operation, regardless of persistent.
+            Default is None, i.e. a single shelve.
+        dedup (bool): Whether DataFrame columns are stored as content addressed blocks, so
+            identical columns across Datasets are stored once. Default is False.
     """
 
     __cache_filename = "cache.odb"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        persistent: bool = False,
+        spill_threshold: int = None,
+        codec: str = None,
+        level: int = None,
+        shards: int = None,
+        dedup: bool = False,
+    ) -> None:
         super().__init__()
+        self._persistent = persistent
+        self._shards = shards
+        self._dedup = dedup
+        self._spill_threshold = spill_threshold
+        self._codec = None if codec is None else get_codec(name=codec, level=level)
         self._location = self._set_location()
         self._cache = None
         self._storage = None
@@ -260,6 +1121,10 @@ class ObjectDBConnection(Connection):
     def location(self) -> str:
         return self._location
 
+    @property
+    def persistent(self) -> bool:
+        return self._persistent
+
     @property
     def storage(self) -> Cursor:
         return self._storage
@@ -275,8 +1140,9 @@ class ObjectDBConnection(Connection):
 
     def open(self) -> None:
         """Opens a database connection."""
-        self._storage.open()
-        self._cache.open()
+        if self._persistent:
+            self._storage.open()
+        self._is_open = True
         self._logger.debug("connection is open.")
 
     def close(self) -> None:
@@ -284,8 +1150,14 @@ class ObjectDBConnection(Connection):
         self._cache.reset()
         self._cache.close()
         self._storage.close()
+        self._is_open = False
         self._logger.debug("is closed.")
 
+    def flush(self) -> None:
+        """Writes changes held by open cursors to disk."""
+        self._storage.flush()
+        self._cache.flush()
+
     def commit(self) -> None:
         """Commits data to the underlying database."""
         self._storage.save(self._cache)
@@ -298,6 +1170,7 @@ class ObjectDBConnection(Connection):
     def drop(self) -> None:
         self._cache.drop()
         self._storage.drop()
+        self._is_open = False
 
     def _set_location(self) -> str:
         """Obtains the database location based upon the current mode environment variable."""
@@ -308,19 +1181,65 @@ class ObjectDBConnection(Connection):
         return os.path.join(location, mode, name)
 
     def _build_cursors(self) -> None:
-        self._cache = CacheCursor(self._location)
-        self._storage = StorageCursor(self._location)
+        self._cache = CacheCursor(self._location, spill_threshold=self._spill_threshold)
+        if self._shards is not None and self._shards > 1:
+            self._storage = ShardedStorageCursor(
+                self._location, shards=self._shards, codec=self._codec, dedup=self._dedup
+            )
+        else:
+            self._storage = StorageCursor(self._location, codec=self._codec, dedup=self._dedup)
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                     OBJECT DATABASE                                              #
 # ------------------------------------------------------------------------------------------------ #
 class ObjectDB(AbstractDatabase):
-    """Manages object persistence."""
+    """Manages object persistence.
+
+    In write-behind mode, save hands the entities staged in the transaction to a background
+    writer and returns without waiting for them to be written. Saved entities are served from
+    the pending writes until written, and writes are applied in the order saved. Changes made
+    outside a transaction, compaction, and snapshots wait for the pending writes first. As with
+    staging, entities are written by reference, so changes made to a saved entity before its
+    write completes may be written with it. Call wait or flush at durability points.
 
-    def __init__(self, connection: type[Connection], *args, **kwargs) -> None:
+    If a background write fails, wait raises its error, and the entities it held remain pending,
+    i.e. they are still served from the pending writes, until the next save writes them again,
+    or rollback discards them.
+
+    Entities are indexed by type and name, and by the values of indexed attributes, e.g. a
+    Dataset's stage, in an ObjectIndex next to the object store. The index is updated once
+    changes are written to object storage, and written to disk on save, flush, and close.
+    Lookups see the changes staged in a transaction, or pending a background write, as well.
+
+    Args:
+        connection (ObjectDBConnection): Connection to the object store.
+        cache (ReadCache): Optional read-through cache of entities selected from object storage.
+            Entities are invalidated when updated or deleted.
+        write_behind (bool): Whether saves are written by a background writer. Ignored for
+            connections with native transactions, which are committed on save. Default is False.
+    """
+
+    def __init__(
+        self,
+        connection: type[Connection],
+        cache: ReadCache = None,
+        write_behind: bool = False,
+        *args,
+        **kwargs,
+    ) -> None:
         super().__init__()
         self._connection = connection
+        self._cache = cache
+        self._write_behind = bool(write_behind) and connection.cache is not None
+        self._writer = None
+        self._futures = []
+        self._pending = {}
+        self._failed = {}
+        self._tickets = 0
+        self._lock = threading.RLock()
+        self._index = ObjectIndex(connection.location)
+        self._uncommitted = []
         self._in_transaction = False
         self._is_open = False
 
@@ -332,6 +1251,30 @@ class ObjectDB(AbstractDatabase):
     def connection(self) -> Connection:
         return self._connection
 
+    @property
+    def cache(self) -> ReadCache:
+        return self._cache
+
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def index(self) -> ObjectIndex:
+        return self._index
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of entities saved but not yet written to object storage."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def _staged(self) -> bool:
+        """Returns True if changes are staged in the connection's cache until the transaction is
+        committed. Connections with native transactions have no cache."""
+        return self._in_transaction and self._connection.cache is not None
+
     def connect(self) -> None:
         """Connects to the database."""
         self._connection.open()
@@ -345,80 +1288,462 @@ class ObjectDB(AbstractDatabase):
         self._logger.info(msg)
 
     def close(self) -> None:
-        """Closes the underlying database connection."""
-        self._connection.close()
-        self._is_open = False
+        """Closes the underlying database connection once pending writes complete."""
+        try:
+            self._index.flush()
+            self.wait()
+        finally:
+            self._connection.close()
+            self._is_open = False
+            self._in_transaction = False
+
+    def save(self) -> Future:
+        """Saves changes to the database.
+
+        Returns a Future which completes once the changes are written. In write-behind mode, the
+        changes are written by the background writer, otherwise the Future is complete on return.
+        """
+        if not self._write_behind:
+            items = self._get_uncommitted()
+            self._connection.commit()
+            self._in_transaction = False
+            self._uncommitted = []
+            self._index.apply(items)
+            self._index.flush()
+            self._mark_clean(items)
+            future = Future()
+            future.set_result(None)
+            return future
+
+        items = list(self._connection.cache.items())
+        self._connection.cache.reset()
         self._in_transaction = False
+        with self._lock:
+            failed = self._get_failed(items)
+            if failed:
+                msg = f"Writing {len(failed)} entities again, as their background write failed."
+                self._logger.warning(msg)
+            items = failed + items
+            self._tickets += 1
+            ticket = self._tickets
+            for oid, entity in items:
+                self._pending[oid] = (ticket, entity)
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="odb-writer")
+            future = self._writer.submit(self._write, items)
+            self._futures.append(future)
+        future.add_done_callback(lambda future: self._release(ticket, items, future))
+        msg = f"Queued {len(items)} entities for writing to object storage."
+        self._logger.debug(msg)
+        return future
+
+    def wait(self) -> None:
+        """Blocks until the pending writes complete, raising the first error encountered by the
+        background writer, if any. The entities of failed writes remain pending."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        errors = [error for error in errors if error is not None]
+        if errors:
+            msg = f"{len(errors)} background writes to object storage failed.\n{errors[0]}"
+            self._logger.error(msg)
+            raise errors[0]
 
-    def save(self) -> None:
-        """Saves changes to the database."""
-        self._connection.commit()
-        self._in_transaction = False
+    def flush(self) -> None:
+        """Waits for pending writes, then writes changes held by open cursors, and the index, to
+        disk."""
+        self.wait()
+        self._connection.flush()
+        self._index.flush()
 
     def rollback(self) -> None:
-        """Rolls back the database to state as of last save or commit."""
+        """Rolls back the database to state as of last save or commit, discarding the entities
+        of failed background writes."""
         self._connection.rollback()
         self._in_transaction = False
+        self._uncommitted = []
+        with self._lock:
+            for oid, _ in self._get_failed([]):
+                del self._pending[oid]
+
+    def lookup(self, entity: str, name: str) -> Union[str, None]:
+        """Returns the oid of the entity of the designated type and name, or None.
+
+        Args:
+            entity (str): The entity type, i.e. the lower case class name, e.g. 'dataset'.
+            name (str): The entity's name.
+        """
+        changes = self._get_changes()
+        for oid, staged in reversed(list(changes.items())):
+            if staged is not None and self._index.matches(staged, entity) and staged.name == name:
+                return oid
+        oid = self._get_index().lookup(entity, name)
+        if oid in changes and (changes[oid] is None or changes[oid].name != name):
+            return None
+        return oid
+
+    def find(self, entity: str = None, **attributes) -> list:
+        """Returns the oids of the entities holding the designated values of indexed attributes.
+
+        Args:
+            entity (str): The entity type, e.g. 'dataset'. If None, entities of all types.
+            **attributes: Values of indexed attributes, e.g. stage='extract'.
+        """
+        oids = set(self._get_index().find(entity, **attributes))
+        for oid, staged in self._get_changes().items():
+            oids.discard(oid)
+            if staged is not None and self._index.matches(staged, entity, **attributes):
+                oids.add(oid)
+        return sorted(oids)
+
+    def select_by_name(self, entity: str, name: str) -> Union[Entity, list]:
+        """Selects the entity of the designated type and name. Returns an empty list if the
+        entity does not exist."""
+        oid = self.lookup(entity, name)
+        return [] if oid is None else self.select(oid)
+
+    def select_where(self, entity: str = None, **attributes) -> dict:
+        """Selects the entities holding the designated values of indexed attributes.
+
+        Returns a dictionary of the entities, keyed by oid.
+        """
+        return self.select_many(self.find(entity, **attributes))
+
+    def reindex(self) -> int:
+        """Rebuilds the index from the entities in object storage. Returns the number of entities
+        indexed."""
+        self.wait()
+        entities = self._connection.storage.select_many(self._connection.storage.oids())
+        self._index.rebuild(list(entities.values()))
+        msg = f"Reindexed {len(entities)} entities in the object database."
+        self._logger.info(msg)
+        return len(entities)
 
     def select(self, oid: str) -> Entity:
-        if self._in_transaction:
+        if self._staged:
             result = self._connection.cache.select(oid)
             if result == []:
-                result = self._connection.storage.select(oid)
+                result = self._read(oid)
         else:
-            result = self._connection.storage.select(oid)
+            result = self._read(oid)
         return result
 
     def insert(self, entity: Entity) -> int:
         """Inserts an object into object storage."""
-        if self._in_transaction:
-            if not self._connection.storage.exists(
-                entity.oid
-            ) and not self._connection.cache.exists(entity.oid):
-                self._connection.cache.insert(entity)
+        self._invalidate(entity.oid)
+        if self._staged:
+            if not self.exists(entity.oid):
+                self._connection.cache.update(entity)
             else:
                 msg = f"Unable to insert entity oid = {entity.oid}. Entity already exists."
                 self._logger.error(msg)
                 raise FileExistsError(msg)
         else:
+            self.wait()
             self._connection.storage.insert(entity)
+            self._track([(entity.oid, entity)])
 
     def update(self, entity) -> None:
         """Performs an update on existing data in the database."""
-        if self._in_transaction:
-            if not self._connection.cache.exists(entity.oid):
-                self._cache(entity.oid)
-            self._connection.cache.update(entity)
+        self._invalidate(entity.oid)
+        if self._staged:
+            if self.exists(entity.oid):
+                self._connection.cache.update(entity)
+            else:
+                msg = f"Unable to update entity oid: {entity.oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
         else:
+            self.wait()
             self._connection.storage.update(entity)
+            self._track([(entity.oid, entity)])
 
     def delete(self, oid: str) -> None:
         """Deletes existing data."""
-        if self._in_transaction:
-            if not self._connection.cache.exists(oid):
-                self._cache(oid)
-            self._connection.cache.delete(oid)
+        self._invalidate(oid)
+        if self._staged:
+            if self.exists(oid):
+                self._connection.cache.delete(oid)
+            else:
+                msg = f"Unable to delete entity oid: {oid}. Entity does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
         else:
+            self.wait()
             self._connection.storage.delete(oid)
+            self._track([(oid, None)])
+
+    def select_many(self, oids: list) -> dict:
+        """Selects the entities with the designated oids.
+
+        Entities staged in a transaction, pending a background write, or held in the read cache,
+        are returned without reading storage. The remaining entities are read from storage in a
+        single session.
+
+        Returns a dictionary of the entities that exist, keyed by oid, in the order designated.
+        """
+        entities = {}
+        pending = []
+        for oid in oids:
+            if self._staged and oid in self._connection.cache:
+                entity = self._connection.cache.select(oid)
+                if entity is not None:
+                    entities[oid] = entity
+                continue
+            queued, entity = self._get_pending(oid)
+            if queued:
+                if entity is not None:
+                    entities[oid] = entity
+                continue
+            entity = None if self._cache is None else self._cache.get(oid)
+            if entity is None:
+                pending.append(oid)
+            else:
+                entities[oid] = entity
+        if pending:
+            selected = self._connection.storage.select_many(pending)
+            if self._cache is not None and not self._in_transaction:
+                for entity in selected.values():
+                    self._cache.put(entity)
+            entities.update(selected)
+        return {oid: entities[oid] for oid in oids if oid in entities}
+
+    def insert_many(self, entities: list) -> None:
+        """Inserts entities into object storage in a single session."""
+        for entity in entities:
+            self._invalidate(entity.oid)
+        if self._staged:
+            existing = self._exists_many([entity.oid for entity in entities])
+            if existing:
+                msg = f"Unable to insert entities. Entities {existing} already exist."
+                self._logger.error(msg)
+                raise FileExistsError(msg)
+            for entity in entities:
+                self._connection.cache.update(entity)
+        else:
+            self.wait()
+            self._connection.storage.insert_many(entities)
+            self._track([(entity.oid, entity) for entity in entities])
+
+    def delete_many(self, oids: list) -> None:
+        """Deletes entities from object storage in a single session."""
+        for oid in oids:
+            self._invalidate(oid)
+        if self._staged:
+            existing = self._exists_many(oids)
+            missing = [oid for oid in oids if oid not in existing]
+            if missing:
+                msg = f"Unable to delete entities. Entities {missing} do not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            for oid in oids:
+                self._connection.cache.delete(oid)
+        else:
+            self.wait()
+            self._connection.storage.delete_many(oids)
+            self._track([(oid, None) for oid in oids])
 
     def drop(self) -> None:
         """Drop database."""
-        self._connection.drop()
+        try:
+            self.wait()
+        finally:
+            if self._cache is not None:
+                self._cache.clear()
+            self._connection.drop()
+            self._index.drop()
+            self._uncommitted = []
 
     def exists(self, oid: str) -> bool:
         """Returns True if the data specified by the parameters exists. Returns False otherwise."""
-        if self._in_transaction:
+        if self._staged and oid in self._connection.cache:
             return self._connection.cache.exists(oid)
-        else:
-            return self._connection.storage.exists(oid)
+        pending, entity = self._get_pending(oid)
+        if pending:
+            return entity is not None
+        return self._connection.storage.exists(oid)
 
     def database_exists(self) -> bool:
         pattern = self._connection.location + ".*"
         return len(glob(pattern)) > 0
 
-    def _cache(self, oid: str) -> None:
-        """Copies an entity from storage to cache"""
-        entity = self._connection.storage.select(oid)
-        self._connection.cache.insert(entity)
-        msg = f"Copied entity {oid} from storage to cache."
-        self._logger.debug(msg)
+    def compact(self, grace: float = 0) -> dict:
+        """Rewrites the object store without the space held by superseded and deleted entities.
+
+        DataFrame column blocks no longer referenced by any payload are removed, other than
+        those in use by concurrent writers.
+
+        Args:
+            grace (float): Unreferenced blocks modified within this many seconds are retained.
+                Only required on platforms without file locks. See FrameStore.collect.
+
+        Returns a dictionary containing the number of live entities, the number of column blocks
+        collected, the size of the object store in bytes before and after compaction, the bytes
+        reclaimed, and the duration in seconds.
+        """
+        if self._in_transaction:
+            msg = "Unable to compact the object database while a transaction is in progress."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+        self.wait()
+        start = perf_counter()
+        size_before = self._disk_usage()
+        oids = self._connection.storage.compact()
+        self._index.retain(oids)
+        collected = self._connection.storage.frames.collect(grace=grace)
+        size_after = self._disk_usage()
+        report = {
+            "entities": len(oids),
+            "blocks_collected": collected["blocks"],
+            "size_before": size_before,
+            "size_after": size_after,
+            "reclaimed": size_before - size_after,
+            "duration": round(perf_counter() - start, 3),
+        }
+        msg = f"Compacted object database at {self._connection.location}. Reclaimed {report['reclaimed']:,} bytes in {report['duration']} seconds."
+        self._logger.info(msg)
+        return report
+
+    def snapshot(self) -> Snapshot:
+        """Returns a snapshot of object storage as of the last commit.
+
+        Reads through the snapshot see the entities as committed when the snapshot was taken,
+        regardless of commits made since, and bypass the read cache. Changes staged in a
+        transaction are not visible. Pending writes are completed first. Release the snapshot,
+        or use it as a context manager, once read, so the versions it holds can be reclaimed.
+        """
+        self.wait()
+        return self._connection.storage.snapshot()
+
+    def dedup_report(self) -> dict:
+        """Returns the number of DataFrame column blocks and references to them, and the bytes
+        saved by storing identical columns once."""
+        return self._connection.storage.frames.dedup_report()
+
+    def _disk_usage(self) -> int:
+        """Returns the size in bytes of the object store files and DataFrame payloads."""
+        filepaths = [
+            filepath
+            for filepath in glob(self._connection.location + ".*")
+            if os.path.isfile(filepath)
+        ]
+        for root, _, filenames in os.walk(self._connection.storage.frames.location):
+            filepaths.extend(os.path.join(root, filename) for filename in filenames)
+        return sum(os.path.getsize(filepath) for filepath in filepaths)
+
+    def _read(self, oid: str) -> Entity:
+        """Selects an entity from the pending writes or object storage, reading through the cache
+        if configured."""
+        pending, entity = self._get_pending(oid)
+        if pending:
+            return [] if entity is None else entity
+        if self._cache is None:
+            return self._connection.storage.select(oid)
+        entity = self._cache.get(oid)
+        if entity is None:
+            entity = self._connection.storage.select(oid)
+            # Entities read within a native transaction may not be committed.
+            if entity != [] and not self._in_transaction:
+                self._cache.put(entity)
+        return entity
+
+    def _exists_many(self, oids: list) -> list:
+        """Returns the oids that exist, consulting the transaction's staged changes and the
+        pending writes first."""
+        cache = self._connection.cache
+        existing, unstaged = set(), []
+        for oid in oids:
+            pending, entity = (True, cache.select(oid)) if oid in cache else self._get_pending(oid)
+            if not pending:
+                unstaged.append(oid)
+            elif entity is not None:
+                existing.add(oid)
+        if unstaged:
+            existing.update(self._connection.storage.exists_many(unstaged))
+        return [oid for oid in oids if oid in existing]
+
+    def _get_pending(self, oid: str) -> tuple:
+        """Returns True and the entity, or None if deleted, if a write of the entity is pending.
+        Otherwise, returns False and None."""
+        with self._lock:
+            if oid in self._pending:
+                return True, self._pending[oid][1]
+        return False, None
+
+    def _write(self, items: list) -> None:
+        """Writes the items to object storage and indexes them. Runs on the background writer."""
+        self._connection.storage.write(items)
+        self._index.apply(items)
+        self._index.flush()
+        self._mark_clean(items)
+
+    def _track(self, items: list) -> None:
+        """Indexes the (oid, entity) pairs written to object storage, and marks the entities
+        clean, or, within a native transaction, once the transaction is committed."""
+        if self._in_transaction:
+            self._uncommitted.extend(items)
+        else:
+            self._index.apply(items)
+            self._mark_clean(items)
+
+    def _mark_clean(self, items: list) -> None:
+        """Records that the changed DataFrames of the entities written have been persisted. Not
+        done on write, as a write rolled back leaves the changes to be persisted again."""
+        for _, entity in items:
+            if entity is not None and hasattr(entity, "mark_clean"):
+                entity.mark_clean()
+
+    def _get_uncommitted(self) -> list:
+        """Returns the (oid, entity) pairs written in the transaction, staged or otherwise."""
+        items = list(self._uncommitted)
+        if self._staged:
+            items.extend(self._connection.cache.items())
+        return items
+
+    def _get_changes(self) -> dict:
+        """Returns the entities pending a background write, or written in the transaction, keyed
+        by oid, in the order written. Deleted entities are None."""
+        with self._lock:
+            changes = {oid: entity for oid, (_, entity) in self._pending.items()}
+        for oid, entity in self._get_uncommitted():
+            changes.pop(oid, None)
+            changes[oid] = entity
+        return changes
+
+    def _get_index(self) -> ObjectIndex:
+        """Returns the index, building it from object storage if it does not exist."""
+        if not self._index.exists:
+            self.reindex()
+        return self._index
+
+    def _release(self, ticket: int, items: list, future: Future) -> None:
+        """Removes the written entities from the pending writes, unless saved again since. If the
+        write failed, the entities remain pending until saved again or rolled back."""
+        with self._lock:
+            if future.exception() is not None:
+                self._failed[ticket] = future
+                msg = f"Background write of {len(items)} entities failed. The entities remain pending.\n{future.exception()}"  # noqa 501
+                self._logger.error(msg)
+                return
+            for oid, _ in items:
+                if oid in self._pending and self._pending[oid][0] == ticket:
+                    del self._pending[oid]
+
+    def _get_failed(self, items: list) -> list:
+        """Returns the (oid, entity) pairs of failed background writes not superseded by the
+        items, and clears the failed writes, whose errors are no longer raised by wait."""
+        staged = {oid for oid, _ in items}
+        failed = [
+            (oid, entity)
+            for oid, (ticket, entity) in self._pending.items()
+            if ticket in self._failed and oid not in staged
+        ]
+        for future in self._failed.values():
+            if future in self._futures:
+                self._futures.remove(future)
+        self._failed = {}
+        return failed
+
+    def _invalidate(self, oid: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(oid)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/pool.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 07:12:36 pm                                              #
+# Modified   : Saturday October 17th 2026 07:12:36 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Relational Database Connection Pool."""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import dotenv
+import pymysql
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      CONNECTION POOL                                             #
+# ------------------------------------------------------------------------------------------------ #
+class ConnectionPool:
+    """Thread-safe pool of connections to a MySQL server or database.
+
+    Connections are borrowed and returned rather than opened and closed, so the TCP handshake
+    and authentication are paid once per pooled connection rather than once per operation.
+    Credentials are read from the environment, i.e. <prefix>_HOST, <prefix>_USER, and
+    <prefix>_PASSWORD, once when the pool is created.
+
+    A connection is checked with a ping when borrowed, and replaced if the server no longer
+    responds. Idle connections are reused most recently returned first, and those idle for longer than the idle timeout are closed, down to the minimum
+    size. Transactions left open on a returned connection are rolled back, so each borrower
+    starts from a clean session.
+
+    Args:
+        connector (pymysql.connect): Callable returning a new connection.
+        prefix (str): Prefix of the environment variables holding the credentials. Default
+            is 'DATABASE'. Use 'DBMS' for server-level connections.
+        min_size (int): Connections retained when idle, regardless of the idle timeout.
+            Connections are opened on demand.
+        max_size (int): Maximum number of connections open, idle or borrowed, at once.
+        idle_timeout (float): Seconds after which an idle connection above the minimum size is
+            closed. None to retain idle connections indefinitely.
+        timeout (float): Seconds to wait for a connection when all are borrowed, after which
+            TimeoutError is raised. None to wait indefinitely.
+        **kwargs: Connection arguments passed to the connector, e.g. database and autocommit.
+    """
+
+    def __init__(
+        self,
+        connector: pymysql.connect = pymysql.connect,
+        prefix: str = "DATABASE",
+        min_size: int = 1,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        timeout: float = 30.0,
+        **kwargs,
+    ) -> None:
+        if not 0 <= min_size <= max_size or max_size < 1:
+            msg = f"Invalid pool size. Expected 0 <= min_size <= max_size and max_size >= 1, got min_size={min_size}, max_size={max_size}."  # noqa 501
+            raise ValueError(msg)
+        self._connector = connector
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._kwargs = kwargs
+        self._kwargs.update(self._get_credentials(prefix))
+        self._autocommit = kwargs.get("autocommit", False)
+        self._name = kwargs.get("database") or prefix
+
+        self._idle = deque()
+        self._borrowed = set()
+        self._opening = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        self._stats = {
+            "created": 0,
+            "borrowed": 0,
+            "returned": 0,
+            "discarded": 0,
+            "expired": 0,
+            "failed_checks": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "wait_time": 0.0,
+        }
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of connections open, whether idle or borrowed."""
+        with self._condition:
+            return self._size()
+
+    @property
+    def min_size(self) -> int:
+        return self._min_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def autocommit(self) -> bool:
+        return self._autocommit
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> dict:
+        """Returns the pool's metrics.
+
+        Counts of connections created, borrowed, returned, discarded as broken or on return to
+        a closed pool, expired when idle, and failing the health check, of borrows that waited
+        and timed out, and the total seconds spent waiting, together with the number of
+        connections in use and idle.
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats["in_use"] = len(self._borrowed)
+            stats["idle"] = len(self._idle)
+            stats["size"] = self._size()
+            return stats
+
+    def borrow(self, timeout: float = None) -> pymysql.connections.Connection:
+        """Returns a healthy connection from the pool, opening one if none are idle and the pool
+        is below its maximum size, otherwise waiting for one to be returned.
+
+        Args:
+            timeout (float): Seconds to wait. Defaults to the pool's timeout.
+
+        Raises:
+            TimeoutError if no connection becomes available within the timeout.
+            RuntimeError if the pool has been closed.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        waited = False
+        expired = []
+        with self._condition:
+            while True:
+                self._check()
+                expired.extend(self._expire())
+                if self._idle or self._size() < self._max_size:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    self._stats["wait_time"] += time.monotonic() - started
+                    msg = f"Timed out after {timeout} seconds waiting for a connection to {self._name}. All {self._max_size} connections are in use."  # noqa 501
+                    self._logger.error(msg)
+                    raise TimeoutError(msg)
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                self._condition.wait(remaining)
+            if waited:
+                self._stats["wait_time"] += time.monotonic() - started
+            connection = self._idle.pop()[0] if self._idle else None
+            # Holds the slot while the connection is checked or opened outside the lock.
+            self._opening += 1
+
+        for stale in expired:
+            self._close(stale)
+        try:
+            if connection is not None and not self._ping(connection):
+                with self._condition:
+                    self._stats["failed_checks"] += 1
+                    self._stats["discarded"] += 1
+                self._close(connection)
+                connection = None
+            if connection is None:
+                connection = self._open()
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._opening -= 1
+            self._borrowed.add(id(connection))
+            self._stats["borrowed"] += 1
+        return connection
+
+    def release(self, connection: pymysql.connections.Connection) -> None:
+        """Returns a borrowed connection to the pool.
+
+        An open transaction is rolled back. Connections that are broken, or returned to a closed
+        pool, are closed.
+        """
+        healthy = self._reset(connection)
+        with self._condition:
+            if id(connection) not in self._borrowed:
+                msg = f"Connection {id(connection)} was not borrowed from the pool for {self._name}."  # noqa 501
+                self._logger.error(msg)
+                raise ValueError(msg)
+            self._borrowed.discard(id(connection))
+            self._stats["returned"] += 1
+            if healthy and not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                connection = None
+            else:
+                self._stats["discarded"] += 1
+            self._condition.notify()
+        if connection is not None:
+            self._close(connection)
+
+    def discard(self, connection: pymysql.connections.Connection) -> None:
+        """Closes a borrowed connection rather than returning it to the pool."""
+        with self._condition:
+            self._borrowed.discard(id(connection))
+            self._stats["discarded"] += 1
+            self._condition.notify()
+        self._close(connection)
+
+    @contextmanager
+    def connection(self, timeout: float = None) -> pymysql.connections.Connection:
+        """Borrows a connection for the duration of the context."""
+        connection = self.borrow(timeout=timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Closes the idle connections and the pool. Borrowed connections are closed when
+        returned."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._condition.notify_all()
+        for connection in idle:
+            self._close(connection)
+        msg = f"Connection pool for {self._name} is closed."
+        self._logger.debug(msg)
+
+    # -------------------------------------------------------------------------------------------- #
+    def _size(self) -> int:
+        return len(self._idle) + len(self._borrowed) + self._opening
+
+    def _open(self) -> pymysql.connections.Connection:
+        connection = self._connector(**self._kwargs)
+        with self._condition:
+            self._stats["created"] += 1
+        msg = f"Opened pooled connection {id(connection)} to {self._name}."
+        self._logger.debug(msg)
+        return connection
+
+    def _expire(self) -> list:
+        """Removes connections idle beyond the idle timeout, retaining the minimum size, and
+        returns them to be closed. Called holding the lock; idle connections are ordered oldest
+        first."""
+        expired = []
+        if self._idle_timeout is None:
+            return expired
+        now = time.monotonic()
+        while (
+            self._idle
+            and self._size() > self._min_size
+            and now - self._idle[0][1] > self._idle_timeout
+        ):
+            expired.append(self._idle.popleft()[0])
+            self._stats["expired"] += 1
+        return expired
+
+    def _ping(self, connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception as err:
+            msg = f"Pooled connection {id(connection)} to {self._name} failed its health check: {err}"  # noqa 501
+            self._logger.warning(msg)
+            return False
+
+    def _reset(self, connection) -> bool:
+        """Rolls back any open transaction. Returns False if the connection is broken."""
+        if not getattr(connection, "open", True):
+            return False
+        # Autocommit connections may hold a transaction opened with begin(), e.g. by bulk loads.
+        try:
+            connection.rollback()
+            return True
+        except Exception as err:
+            msg = f"Rollback of returned connection {id(connection)} to {self._name} failed: {err}"  # noqa 501
+            self._logger.warning(msg)
+            return False
+
+    def _close(self, connection) -> None:
+        try:
+            connection.close()
+        except Exception:  # pragma: no cover
+            pass
+
+    def _check(self) -> None:
+        if self._closed:
+            msg = f"Connection pool for {self._name} is closed."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+
+    def _get_credentials(self, prefix: str) -> dict:
+        dotenv.load_dotenv()
+        return {
+            "host": os.getenv(f"{prefix}_HOST"),
+            "user": os.getenv(f"{prefix}_USER"),
+            "password": os.getenv(f"{prefix}_PASSWORD"),
+        }
@@ -18,12 +18,19 @@
 # ================================================================================================ #
 """Relational Databases Module."""
 import os
+import sqlite3
+from glob import glob
+from typing import Iterator
 import pymysql
+from pymysql.constants import CLIENT
 import dotenv
 import mysql.connector
 from mysql.connector import errorcode
 
 from .base import Connection, AbstractDatabase
+from .dialect import DialectCursor, SQLiteDialect
+from .pool import ConnectionPool
+from .stream import RowStream
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -33,15 +40,22 @@ class MySQLConnection(Connection):
     """MySQL Database."""
 
     def __init__(
-        self, connector: pymysql.connect, autocommit: bool = False, autoclose: bool = False
+        self,
+        connector: pymysql.connect,
+        autocommit: bool = False,
+        autoclose: bool = False,
+        pool: ConnectionPool = None,
     ) -> None:
         super().__init__(
-            connector=connector, autocommit=autocommit, autoclose=autoclose
+            connector=connector, autocommit=autocommit, autoclose=autoclose, pool=pool
         )  # pragma: no cover
         self._database = "MySQL"
 
     def open(self) -> None:
-        """Opens a database connection."""
+        """Opens a database connection, or borrows one if pooled."""
+        if self._pool is not None:
+            self._borrow()
+            return
 
         dotenv.load_dotenv()
         host = os.getenv("DBMS_HOST")
@@ -80,14 +94,20 @@ class DatabaseConnection(Connection):
         database: str,
         autocommit: bool = False,
         autoclose: bool = False,
+        pool: ConnectionPool = None,
     ) -> None:
-        super().__init__(connector=connector, autocommit=autocommit, autoclose=autoclose)
+        super().__init__(
+            connector=connector, autocommit=autocommit, autoclose=autoclose, pool=pool
+        )
         self._database = database
         msg = f"Database connection on {self._database} is instantiated at {id(self._database)}."
         self._logger.debug(msg)
 
     def open(self) -> None:
-        """Opens a database connection."""
+        """Opens a database connection, or borrows one if pooled."""
+        if self._pool is not None:
+            self._borrow()
+            return
 
         dotenv.load_dotenv()
         host = os.getenv("DATABASE_HOST")
@@ -102,6 +122,7 @@ class DatabaseConnection(Connection):
                 database=self._database,
                 autocommit=self._autocommit,
                 local_infile=True,
+                client_flag=CLIENT.FOUND_ROWS,
             )
             self._is_open = True
             self._logger.debug(
@@ -121,6 +142,136 @@ class DatabaseConnection(Connection):
                 raise mysql.connector.Error()
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                      SQLITE CONNECTION                                           #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteConnection(Connection):
+    """Connection to a relational database embedded in a SQLite file, for single node deployments.
+
+    The MySQL statements of the data access layer are translated by the SQLiteDialect, so the
+    Database, DAOs and DBAs run unchanged on either backend. Each database is held in
+    <location>/<database>.sqlite3, opened in write-ahead logging mode, so readers do not block
+    the writer. A connection without a database is the equivalent of a server-level connection,
+    on which databases are created, dropped, and checked for existence.
+
+    Args:
+        location (str): Directory containing the database files.
+        database (str): Name of the database. None for a server-level connection.
+        autocommit (bool): Whether each statement is committed as executed. Default is False.
+        autoclose (bool): Whether the connection is closed after each statement outside a
+            transaction. Default is False.
+        timeout (float): Seconds to wait for a lock held by another connection. Default is 30.
+    """
+
+    def __init__(
+        self,
+        location: str,
+        database: str = None,
+        autocommit: bool = False,
+        autoclose: bool = False,
+        timeout: float = 30.0,
+    ) -> None:
+        super().__init__(connector=sqlite3.connect, autocommit=autocommit, autoclose=autoclose)
+        self._location = location
+        self._database = database
+        self._timeout = timeout
+        self._dialect = SQLiteDialect()
+        self._inode = None
+        msg = f"SQLite connection on {self._database} is instantiated at {self._location}."
+        self._logger.debug(msg)
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    @property
+    def filepath(self) -> str:
+        """Returns the path of the database file, or None for a server-level connection."""
+        return None if self._database is None else self._get_filepath(self._database)
+
+    @property
+    def cursor(self) -> DialectCursor:
+        """Returns a cursor executing MySQL statements on the connection."""
+        return DialectCursor(cursor=self._session.cursor(), connection=self, dialect=self._dialect)
+
+    @property
+    def unbuffered_cursor(self) -> DialectCursor:
+        """SQLite cursors step through the rows of a result as they are fetched."""
+        return self.cursor
+
+    def open(self) -> None:
+        """Opens the database file, creating it if it does not exist. A connection to a file
+        since dropped, or dropped and recreated, is reopened."""
+        if self._connection is not None and self._get_inode() != self._inode:
+            self.close()
+        if self._connection is None:
+            filepath = self.filepath or ":memory:"
+            if self.filepath is not None:
+                os.makedirs(self._location, exist_ok=True)
+            self._connection = self._connector(
+                filepath,
+                timeout=self._timeout,
+                isolation_level=None if self._autocommit else "DEFERRED",
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                check_same_thread=False,
+            )
+            if self.filepath is not None:
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._inode = self._get_inode()
+        self._is_open = True
+        self._logger.debug(f"{self.__class__.__name__}.{self._database} is connected.")
+
+    def begin(self) -> None:
+        """Starts a transaction on the connection."""
+        if not self._session.in_transaction:
+            self._session.execute("BEGIN")
+        self._in_transaction = True
+        self._logger.debug(f"{self.__class__.__name__}  transaction started on {self._database}.")
+
+    def close(self) -> None:
+        """Closes the connection. Changes not committed are rolled back."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._is_open = False
+        self._in_transaction = False
+        self._logger.debug(f"{self.__class__.__name__}  {self._database} is closed.")
+
+    def create_database(self, name: str) -> int:
+        """Creates the database file if it does not exist. Returns the number created."""
+        if self.database_exists(name):
+            return 0
+        os.makedirs(self._location, exist_ok=True)
+        connection = self._connector(self._get_filepath(name))
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.close()
+        msg = f"Created SQLite database {name} at {self._location}."
+        self._logger.debug(msg)
+        return 1
+
+    def drop_database(self, name: str) -> int:
+        """Deletes the database file and its journals. Returns the number of databases dropped."""
+        if name == self._database:
+            self.close()
+        exists = int(self.database_exists(name))
+        for filepath in glob(self._get_filepath(name) + "*"):
+            os.remove(filepath)
+        return exists
+
+    def database_exists(self, name: str) -> bool:
+        return os.path.exists(self._get_filepath(name))
+
+    def _get_filepath(self, name: str) -> str:
+        return os.path.join(self._location, f"{name}.sqlite3")
+
+    def _get_inode(self) -> int:
+        try:
+            return None if self.filepath is None else os.stat(self.filepath).st_ino
+        except FileNotFoundError:
+            return None
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                        DATABASE                                                  #
 # ------------------------------------------------------------------------------------------------ #
@@ -133,6 +284,7 @@ class Database(AbstractDatabase):
         self._is_open = self._connection.is_open
         self._database = self._connection.database
         self._in_transaction = False
+        self._increment = None
 
     @property
     def database(self) -> str:
@@ -198,6 +350,16 @@ class Database(AbstractDatabase):
         cursor = self.query(sql, args)
         cursor.close()
 
+    def load_stream(self, sql: str, stream: RowStream, args: tuple = None) -> int:
+        """Loads the rows of a stream with a LOAD DATA statement reading the stream's filepath.
+        Returns the number of rows loaded, which is fewer than the rows streamed if rows
+        colliding with existing rows on a unique key were skipped."""
+        with stream:
+            cursor = self.query(sql, args)
+            rowcount = cursor.rowcount
+            cursor.close()
+        return rowcount
+
     def create(self, sql: str, args: tuple = None) -> None:
         """Executes create DDL statements for databases and tables."""
         cursor = self.query(sql, args)
@@ -210,6 +372,19 @@ class Database(AbstractDatabase):
         cursor.close()
         return id
 
+    def insert_many(self, sql: str, args: tuple = None) -> list:
+        """Inserts multiple rows in a single statement and returns their ids, in order.
+
+        MySQL assigns the rows of a multi-row INSERT, whose row count is known in advance,
+        consecutive auto-increment values under every innodb_autoinc_lock_mode, so the ids are
+        derived from the id of the first row and the auto_increment_increment of the session.
+        """
+        cursor = self.query(sql, args)
+        first, rowcount = cursor.lastrowid, cursor.rowcount
+        cursor.close()
+        increment = self._get_increment()
+        return [first + i * increment for i in range(rowcount)]
+
     def select(self, sql: str, args: tuple = None) -> tuple:
         """Performs a select query returning a single instance or row."""
         row = None
@@ -226,24 +401,64 @@ class Database(AbstractDatabase):
         cursor.close()
         return rows
 
-    def update(self, sql: str, args: tuple = None) -> None:
-        """Performs an update on existing data in the database."""
+    def select_stream(self, sql: str, args: tuple = None, batch_size: int = 1000) -> Iterator:
+        """Performs a select query, yielding rows as they are read from the server.
+
+        Rows are fetched batch_size at a time through an unbuffered cursor, so memory is bounded
+        by the batch size rather than the size of the result. The connection cannot execute
+        other queries until the rows have been read or the generator is closed.
+        """
+        self._open_session()
+        cursor = self._connection.unbuffered_cursor
+        try:
+            cursor.execute(sql, args)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+            self._close_session()
+
+    def update(self, sql: str, args: tuple = None) -> int:
+        """Performs an update on existing data in the database and returns the number of rows
+        matched. Connections report matched rather than changed rows, so zero means that no row
+        met the condition."""
         cursor = self.query(sql, args)
         rowcount = cursor.rowcount
         cursor.close()
         return rowcount
 
     def count(self, sql: str, args: tuple = None) -> int:
-        """Counts the rows returned from a query."""
+        """Counts the rows returned from a query.
+
+        The rows are counted by the server, and only the count is returned to the client. A
+        query that is itself a count, i.e. SELECT COUNT(*) ..., is executed as is, and its count
+        returned.
+        """
+        statement = sql.strip().rstrip(";")
+        if not statement.upper().startswith("SELECT COUNT("):
+            statement = f"SELECT COUNT(*) FROM ({statement}) AS result"
+        cursor = self.query(statement + ";", args)
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return int(count)
+
+    def delete(self, sql: str, args: tuple = None) -> int:
+        """Deletes existing data and returns the number of rows deleted."""
         cursor = self.query(sql, args)
-        rows = cursor.fetchall()
+        rowcount = cursor.rowcount
         cursor.close()
-        return len(rows)
+        return rowcount
 
-    def delete(self, sql: str, args: tuple = None) -> None:
-        """Deletes existing data."""
+    def upsert(self, sql: str, args: tuple = None) -> int:
+        """Inserts a row, or updates the row it collides with on a unique key, and returns the id
+        of the row inserted or updated."""
         cursor = self.query(sql, args)
+        id = cursor.lastrowid
         cursor.close()
+        return id
 
     def drop(self, sql: str, args: tuple = None) -> None:
         """Drop a database or table."""
@@ -261,6 +476,31 @@ class Database(AbstractDatabase):
         except IndexError:  # pragma: no cover
             return False
 
+    def explain(self, sql: str, args: tuple = None) -> list:
+        """Returns the query plan for a statement, as a list of dictionaries, one per table
+        accessed, keyed by the EXPLAIN column names, e.g. type, key, and rows."""
+        cursor = self.query(f"EXPLAIN {sql.strip()}", args)
+        columns = [column[0] for column in cursor.description]
+        plan = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor.close()
+        return plan
+
+    def exists_many(self, sql: str, args: tuple = None) -> list:
+        """Returns the keys, i.e. the first column of the rows returned from a query selecting the
+        keys that exist of those designated."""
+        cursor = self.query(sql, args)
+        keys = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        return keys
+
+    def _get_increment(self) -> int:
+        """Returns the step between auto-increment values, read once from the server."""
+        if self._increment is None:
+            cursor = self.query("SELECT @@SESSION.auto_increment_increment;")
+            self._increment = int(cursor.fetchone()[0])
+            cursor.close()
+        return self._increment
+
     def _open_session(self) -> None:  # pragma: no cover
         """Opens a database connection if not already open."""
         if not self._is_open:
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/snapshot.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 04:21:08 pm                                              #
+# Modified   : Saturday October 17th 2026 04:21:08 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Multiversion Concurrency Control for the Object Store
+
+Each commit to the object store is assigned a generation number. Entities are stored as chains
+of versions tagged with the generation that wrote them, and a commit becomes visible once its
+generation is published. A reader pins the published generation and resolves each entity to
+its newest version at or before the pinned generation, so its view is unaffected by commits
+made while it reads. Versions are reclaimed once superseded at the generation of the oldest
+pinned reader.
+"""
+import os
+import json
+import uuid
+import logging
+import threading
+from glob import glob
+from contextlib import contextmanager
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from mlops_lab.core.entity.base import Entity
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          VERSIONS                                                #
+# ------------------------------------------------------------------------------------------------ #
+class Versions(list):
+    """Versions of an entity, newest first.
+
+    Each version is a (generation, key, filenames) tuple, where key is the key under which the
+    entity is stored, or None if the entity was deleted in the generation, and filenames are
+    the names of the DataFrame payload files referenced by the entity.
+    """
+
+    def resolve(self, generation: int, aborted: list = ()) -> Union[str, None]:
+        """Returns the key of the newest version at or before the generation, or None if the
+        entity did not exist, or had been deleted, as of the generation."""
+        for version, key, _ in self:
+            if version <= generation and version not in aborted:
+                return key
+        return None
+
+    def add(self, generation: int, key: Union[str, None], filenames: list) -> None:
+        """Adds the newest version, replacing any version written in the same generation."""
+        if self and self[0][0] == generation:
+            self[0] = (generation, key, filenames)
+        else:
+            self.insert(0, (generation, key, filenames))
+
+    def split(self, horizon: int, aborted: list = ()) -> tuple:
+        """Splits the versions into those to be retained and those which have expired.
+
+        Versions after the horizon, i.e. the generation of the oldest reader, are retained, as is
+        the newest version at or before it. Older versions, versions written by aborted commits,
+        and deletions not preceded by a retained version, have expired.
+        """
+        retained, expired = [], []
+        visible = False
+        for version in self:
+            if version[0] in aborted or (version[0] <= horizon and visible):
+                expired.append(version)
+            else:
+                visible = visible or version[0] <= horizon
+                retained.append(version)
+        while retained and retained[-1][1] is None:
+            expired.append(retained.pop())
+        return Versions(retained), expired
+
+    @property
+    def filenames(self) -> set:
+        """Returns the names of the payload files referenced by the versions."""
+        return {filename for _, _, filenames in self for filename in filenames}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         GENERATIONS                                              #
+# ------------------------------------------------------------------------------------------------ #
+class Generations:
+    """Generation counter and reader registry for an object store.
+
+    The state of the counter is held in <location>.gen, which is replaced atomically, so readers
+    never lock it, and is cached in memory until the file changes. Commits are serialized by a
+    thread lock and an exclusive lock on <location>.gen.lock. A commit may instead span several
+    operations, i.e. its generation is allocated by begin and published by publish once its
+    versions are written. Readers register the generation they pin in a pin file,
+    <location>.pin.<pid>.<id>, visible to writers in all processes. Pin files of processes that
+    are no longer running are removed.
+
+    A commit interrupted before its generation is published, e.g. by an exception or a crash,
+    is recorded as aborted, and its versions are disregarded by readers and reclaimed.
+
+    Args:
+        location (str): The path of the object store, without extension.
+    """
+
+    def __init__(self, location: str) -> None:
+        self._location = location
+        self._filepath = location + ".gen"
+        self._state = None
+        self._stamp = None
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def current(self) -> int:
+        """Returns the published generation."""
+        return self.read()["generation"]
+
+    def read(self) -> dict:
+        """Returns the published generation, the generation being committed, if any, and the
+        aborted generations. The file is read only if changed since last read."""
+        with self._lock:
+            try:
+                stat = os.stat(self._filepath)
+                stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                if stamp != self._stamp:
+                    with open(self._filepath, "r") as file:
+                        self._state = json.load(file)
+                    self._stamp = stamp
+            except FileNotFoundError:
+                return {"generation": 0, "pending": None, "aborted": []}
+            return {**self._state, "aborted": list(self._state["aborted"])}
+
+    @contextmanager
+    def commit(self) -> int:
+        """Allocates the next generation for a commit and publishes it once the commit completes.
+
+        Yields the generation with which the commit's versions are to be tagged. If the commit
+        raises, the generation is recorded as aborted and never published.
+        """
+        with self._locked():
+            generation = self._begin()
+            try:
+                yield generation
+            except BaseException:
+                self._abort(generation)
+                raise
+            self._publish(generation)
+
+    def begin(self) -> int:
+        """Allocates the next generation for a commit published later by publish, e.g. once the
+        versions written by several operations are on disk. Other commits must not be made in
+        the interim, as they abort the generation allocated."""
+        with self._locked():
+            return self._begin()
+
+    def publish(self, generation: int) -> None:
+        """Publishes the generation allocated by begin.
+
+        Raises: RuntimeError if the generation was aborted by another commit in the interim.
+        """
+        with self._locked():
+            if self.read()["pending"] != generation:
+                msg = f"Generation {generation} of {self._location} was aborted by a concurrent commit. Its versions are disregarded."  # noqa 501
+                self._logger.error(msg)
+                raise RuntimeError(msg)
+            self._publish(generation)
+
+    def pin(self) -> tuple:
+        """Pins the published generation for a reader.
+
+        The pin is written before the published generation is read again. If a commit was
+        published in the interim, the reader pins the newer generation instead, so a writer
+        reclaiming versions after publishing always sees the pins of readers of older
+        generations.
+
+        Returns the pinned generation and the pin, which is passed to unpin.
+        """
+        pin = f"{self._location}.pin.{os.getpid()}.{uuid.uuid4().hex[:12]}"
+        os.makedirs(os.path.dirname(pin) or ".", exist_ok=True)
+        generation = self.current
+        while True:
+            self._write_pin(pin, generation)
+            current = self.current
+            if current == generation:
+                return generation, pin
+            generation = current
+
+    def unpin(self, pin: str) -> None:
+        """Releases the reader's pin."""
+        try:
+            os.remove(pin)
+        except FileNotFoundError:
+            pass
+
+    def oldest(self) -> Union[int, None]:
+        """Returns the oldest pinned generation, or None if no generation is pinned."""
+        generations = []
+        for pin in glob(f"{self._location}.pin.*"):
+            pid = int(os.path.basename(pin).split(".")[-2])
+            if not self._is_running(pid):
+                self.unpin(pin)
+                continue
+            try:
+                with open(pin, "r") as file:
+                    generations.append(int(file.read()))
+            except (FileNotFoundError, ValueError):  # pragma: no cover
+                # Released, or not yet written.
+                continue
+        return min(generations) if generations else None
+
+    def horizon(self) -> int:
+        """Returns the oldest generation visible to a reader, i.e. the oldest pinned generation,
+        or the published generation if none is pinned."""
+        current = self.current
+        oldest = self.oldest()
+        return current if oldest is None else min(oldest, current)
+
+    def drop(self) -> None:
+        """Removes the generation counter, its lock file, and the pins."""
+        for filepath in glob(self._filepath + "*") + glob(f"{self._location}.pin.*"):
+            os.remove(filepath)
+
+    def _begin(self) -> int:
+        state = self.read()
+        if state["pending"] is not None:
+            # The previous commit did not complete.
+            state["aborted"].append(state["pending"])
+        generation = max([state["generation"], *state["aborted"]]) + 1
+        state["pending"] = generation
+        self._write(state)
+        return generation
+
+    def _publish(self, generation: int) -> None:
+        state = self.read()
+        state["generation"] = generation
+        state["pending"] = None
+        self._write(state)
+        msg = f"Published generation {generation} of {self._location}."
+        self._logger.debug(msg)
+
+    def _abort(self, generation: int) -> None:
+        state = self.read()
+        state["pending"] = None
+        state["aborted"].append(generation)
+        self._write(state)
+        msg = f"Commit of generation {generation} to {self._location} aborted."
+        self._logger.warning(msg)
+
+    def _write(self, state: dict) -> None:
+        tempfile = f"{self._filepath}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tempfile, "w") as file:
+            json.dump(state, file)
+        os.replace(tempfile, self._filepath)
+        stat = os.stat(self._filepath)
+        with self._lock:
+            self._state = {**state, "aborted": list(state["aborted"])}
+            self._stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _write_pin(self, pin: str, generation: int) -> None:
+        with open(pin, "w") as file:
+            file.write(str(generation))
+
+    def _is_running(self, pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:  # pragma: no cover
+            pass
+        return True
+
+    @contextmanager
+    def _locked(self) -> None:
+        """Holds the thread lock and an exclusive lock on the commit lock file."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+            with open(self._filepath + ".lock", "a") as lockfile:
+                if fcntl is not None:
+                    fcntl.flock(lockfile, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          SNAPSHOT                                                #
+# ------------------------------------------------------------------------------------------------ #
+class Snapshot:
+    """Read-only view of the object store as of a pinned generation.
+
+    Commits made while the snapshot is held are not visible through it, and the versions it
+    resolves to are not reclaimed until it is released. Use as a context manager, or release
+    the snapshot explicitly once read.
+
+    Args:
+        storage (StorageCursor): Storage from which versions are read.
+        generations (Generations): The store's generation counter.
+    """
+
+    def __init__(self, storage, generations: Generations) -> None:
+        self._storage = storage
+        self._generations = generations
+        self._generation, self._pin = generations.pin()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def is_released(self) -> bool:
+        return self._pin is None
+
+    def select(self, oid: str) -> Union[Entity, list]:
+        """Returns the entity as of the snapshot, or an empty list if it did not exist."""
+        self._check()
+        return self._storage.select(oid, generation=self._generation)
+
+    def select_many(self, oids: list) -> dict:
+        """Returns the entities that existed as of the snapshot, keyed by oid."""
+        self._check()
+        return self._storage.select_many(oids, generation=self._generation)
+
+    def exists(self, oid: str) -> bool:
+        """Returns True if the entity existed as of the snapshot."""
+        self._check()
+        return self._storage.exists(oid, generation=self._generation)
+
+    def release(self) -> None:
+        """Releases the pinned generation, allowing the versions it holds to be reclaimed."""
+        if self._pin is not None:
+            self._generations.unpin(self._pin)
+            self._pin = None
+
+    def _check(self) -> None:
+        if self._pin is None:
+            msg = f"Snapshot of generation {self._generation} has been released."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /mlops_lab/core/database/stream.py                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 10:31:07 pm                                              #
+# Modified   : Saturday October 17th 2026 10:31:07 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Row Stream for Bulk Loads."""
+import io
+import os
+import errno
+import shutil
+import logging
+import tempfile
+import threading
+from datetime import date, datetime
+from typing import Iterable
+
+NULL = b"\\N"
+ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+# ------------------------------------------------------------------------------------------------ #
+def encode(value) -> bytes:
+    """Encodes a value as a field in the MySQL text format read by LOAD DATA. None, NaN, NaT and
+    NA are NULL."""
+    if value is None:
+        return NULL
+    try:
+        if value != value:
+            return NULL
+    except TypeError:
+        return NULL
+    if isinstance(value, bool):
+        return b"1" if value else b"0"
+    if isinstance(value, datetime):
+        return value.isoformat(" ").encode()
+    if isinstance(value, date):
+        return value.isoformat().encode()
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    return str(value).translate(ESCAPES).encode("utf-8")
+
+
+# ------------------------------------------------------------------------------------------------ #
+def encode_row(row: tuple) -> bytes:
+    """Encodes a row as a tab separated, newline terminated line in the MySQL text format."""
+    return b"\t".join([encode(value) for value in row]) + b"\n"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         ROW STREAM                                               #
+# ------------------------------------------------------------------------------------------------ #
+class RowStream:
+    """Rows streamed to LOAD DATA LOCAL INFILE from memory.
+
+    The rows are encoded in the MySQL text format into an in-memory buffer, which is written to a
+    named pipe at the stream's filepath, from which the client reads the file sent to the server.
+    Rows are encoded as the pipe is read, so neither the rows nor the file are materialized. On
+    platforms without named pipes, the buffer is written to a temporary file at the filepath.
+
+    The stream is used as a context manager around the execution of the LOAD DATA statement, and
+    the pipe and its directory are removed on exit.
+
+    Args:
+        rows (Iterable): Tuples of values, in the column order of the statement.
+        buffer_size (int): Bytes encoded before the buffer is written to the pipe. Default is
+            1 MiB.
+    """
+
+    def __init__(self, rows: Iterable, buffer_size: int = 1048576) -> None:
+        self._rows = rows
+        self._buffer_size = buffer_size
+        self._directory = tempfile.mkdtemp(prefix="mlops_lab_")
+        self._filepath = os.path.join(self._directory, "rows.tsv")
+        self._pipe = hasattr(os, "mkfifo")
+        self._count = 0
+        self._bytes = 0
+        self._error = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __enter__(self) -> "RowStream":
+        if self._pipe:
+            os.mkfifo(self._filepath)
+            self._thread = threading.Thread(target=self._feed, daemon=True)
+            self._thread.start()
+        else:  # pragma: no cover
+            with open(self._filepath, "wb") as file:
+                self._write(file)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        shutil.rmtree(self._directory, ignore_errors=True)
+        if self._error is not None and exc_type is None:
+            msg = f"Rows could not be streamed to {self._filepath}: {self._error}"
+            self._logger.error(msg)
+            raise RuntimeError(msg) from self._error
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def count(self) -> int:
+        """Returns the number of rows streamed."""
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bytes streamed."""
+        return self._bytes
+
+    def _feed(self) -> None:
+        """Writes the rows to the pipe once it is opened by the reader. A reader that does not
+        open the pipe, e.g. as the statement failed, is not waited for once the stream exits, and
+        a reader that closes it early ends the stream."""
+        try:
+            descriptor = self._open()
+            if descriptor is not None:
+                with os.fdopen(descriptor, "wb") as file:
+                    self._write(file)
+        except BrokenPipeError:
+            msg = f"Reader of {self._filepath} closed the stream after {self._count} rows."
+            self._logger.debug(msg)
+        except Exception as err:
+            self._error = err
+
+    def _open(self) -> int:
+        while not self._stop.is_set():
+            try:
+                descriptor = os.open(self._filepath, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as err:
+                if err.errno != errno.ENXIO:
+                    raise
+                self._stop.wait(0.001)
+                continue
+            os.set_blocking(descriptor, True)
+            return descriptor
+        return None
+
+    def _write(self, file) -> None:
+        buffer = io.BytesIO()
+        for row in self._rows:
+            buffer.write(encode_row(row))
+            self._count += 1
+            if buffer.tell() >= self._buffer_size:
+                self._flush(buffer, file)
+        self._flush(buffer, file)
+
+    def _flush(self, buffer: io.BytesIO, file) -> None:
+        file.write(buffer.getvalue())
+        self._bytes += buffer.tell()
+        buffer.seek(0)
+        buffer.truncate()
@@ -17,7 +17,7 @@
 # Copyright  : (c) 2022 John James                                                                 #
 # ================================================================================================ #
 """DataFrame Entity Module"""
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from datetime import datetime
 import pandas as pd
 from typing import Union, Dict
@@ -31,6 +31,17 @@ from mlops_lab.core.dal.dto import DataFrameDTO, DatasetDTO
 STAGES = ["extract", "raw", "split", "interim", "final"]
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                       DATA LOADER                                                #
+# ------------------------------------------------------------------------------------------------ #
+class DataLoader(ABC):
+    """Deferred DataFrame payload which is loaded on first access to the DataFrame's data."""
+
+    @abstractmethod
+    def load(self) -> pd.DataFrame:
+        """Loads and returns the payload."""
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                    DATASET COMPONENT                                             #
 # ------------------------------------------------------------------------------------------------ #
@@ -83,6 +94,7 @@ class Dataset(DataComponent):
         self._task_oid = task_oid
 
         self._dataframes = {}
+        self._dirty = set()
         self._is_composite = True
 
         self._validate()
@@ -154,6 +166,7 @@ class Dataset(DataComponent):
     def add_dataframe(self, dataframe: DataComponent) -> None:
         dataframe.dataset = self
         self._dataframes[dataframe.name] = dataframe
+        self._dirty.add(dataframe.name)
         self._modified = datetime.now()
 
     # -------------------------------------------------------------------------------------------- #
@@ -179,13 +192,28 @@ class Dataset(DataComponent):
     def update_dataframe(self, dataframe: DataComponent) -> None:
         dataframe.dataset = self
         self._dataframes[dataframe.name] = dataframe
+        self._dirty.add(dataframe.name)
         self._modified = datetime.now()
 
     # -------------------------------------------------------------------------------------------- #
     def remove_dataframe(self, name: str) -> None:
         del self._dataframes[name]
+        self._dirty.discard(name)
         self._modified = datetime.now()
 
+    # -------------------------------------------------------------------------------------------- #
+    def is_dirty(self, name: str) -> bool:
+        """True if the DataFrame was added or replaced since the Dataset was last persisted.
+
+        Datasets persisted before changes were tracked are considered dirty throughout.
+        """
+        dirty = self.__dict__.get("_dirty")
+        return dirty is None or name in dirty
+
+    def mark_clean(self) -> None:
+        """Records that the Dataset's DataFrames have been persisted."""
+        self._dirty = set()
+
     # -------------------------------------------------------------------------------------------- #
     def as_dto(self) -> DatasetDTO:
 
@@ -243,6 +271,7 @@ class DataFrame(DataComponent):
         super().__init__(name=name, description=description)
 
         self._data = data
+        self._persisted = None
         self._is_composite = False
         self._dataset = dataset
 
@@ -269,7 +298,7 @@ class DataFrame(DataComponent):
         """
 
         if isinstance(other, DataFrame):
-            return self._data.equals(other.data)
+            return self.data.equals(other.data)
 
     def __len__(self) -> int:
         return self._nrows
@@ -282,8 +311,17 @@ class DataFrame(DataComponent):
     # -------------------------------------------------------------------------------------------- #
     @property
     def data(self) -> pd.DataFrame:
+        if isinstance(self._data, DataLoader):
+            # The loader is retained, so unchanged payloads need not be rewritten.
+            self._persisted = self._data
+            self._data = self._data.load()
         return self._data
 
+    @property
+    def is_loaded(self) -> bool:
+        """False if the payload is deferred until the data are accessed."""
+        return not isinstance(self._data, DataLoader)
+
     # -------------------------------------------------------------------------------------------- #
     @property
     def dataset(self) -> Dataset:
@@ -319,13 +357,13 @@ class DataFrame(DataComponent):
     # Data Access methods
 
     def info(self) -> None:
-        self._data.info(verbose=True, memory_usage=True, show_counts=True)
+        self.data.info(verbose=True, memory_usage=True, show_counts=True)
 
     def head(self, n: int = 5) -> pd.DataFrame:
-        return self._data.head(n)
+        return self.data.head(n)
 
     def tail(self, n: int = 5) -> pd.DataFrame:
-        return self._data.tail(n)
+        return self.data.tail(n)
 
     # ------------------------------------------------------------------------------------------------ #
     def as_dto(self) -> DataFrameDTO:
@@ -26,14 +26,21 @@ from mlops_lab.core.repo.datasource import DataSourceRepo
 from mlops_lab.core.repo.dag import DAGRepo
 from mlops_lab.core.repo.context import Context
 from mlops_lab.core.repo.uow import UnitOfWork
+from mlops_lab.core.dal.cache import DTOCache
 
 
 # ------------------------------------------------------------------------------------------------ #
 class ContextContainer(containers.DeclarativeContainer):
 
+    dto_cache_capacity = providers.Configuration()
+    dto_cache_ttl = providers.Configuration()
+
     dal = providers.Dependency()
 
-    context = providers.Factory(Context, dal=dal)
+    # Each context is given a cache of its own.
+    cache = providers.Factory(DTOCache, capacity=dto_cache_capacity, ttl=dto_cache_ttl)
+
+    context = providers.Factory(Context, dal=dal, cache=cache)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -18,23 +18,26 @@
 # ================================================================================================ #
 """Context Module."""
 import logging
+from concurrent.futures import Future
 
 from dependency_injector import containers
 
 from mlops_lab.core.dal.dao import DAO
 from mlops_lab.core.dal.oao import OAO
+from mlops_lab.core.dal.cache import DTOCache
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                       CONTEXT                                                    #
 # ------------------------------------------------------------------------------------------------ #
 class Context:
-    def __init__(self, dal: containers.DeclarativeContainer) -> None:
+    def __init__(self, dal: containers.DeclarativeContainer, cache: DTOCache = None) -> None:
 
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
         self._dal = dal
+        self._cache = cache
         self._rdb = dal.rdb()
         self._odb = dal.odb()
         self._edb = dal.edb()
@@ -56,11 +59,20 @@ class Context:
         self._rdb.rollback()
         self._odb.rollback()
 
-    def save(self) -> None:
-        """Saves the context."""
+    def save(self) -> Future:
+        """Saves the context.
+
+        Returns a Future which completes once the object database changes are written, which,
+        if the object database writes behind, may be after save returns.
+        """
         self._rdb.save()
-        self._odb.save()
+        future = self._odb.save()
         self._edb.save()
+        return future
+
+    def wait(self) -> None:
+        """Blocks until changes saved to the object database are written."""
+        self._odb.wait()
 
     def close(self) -> None:
         """Saves the context."""
@@ -81,7 +93,7 @@ class Context:
             "file": self._dal.file,
         }
 
-        return daos[name]()
+        return daos[name](cache=self._cache)
 
     def get_oao(self) -> OAO:
         return self._dal.object()
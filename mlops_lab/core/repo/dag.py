@@ -37,16 +37,18 @@ class DAGRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._dag_dao.read_all())
+        return self._dag_dao.count()
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
         dto = self._dag_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for task in entity.tasks.values():
+        tasks = list(entity.tasks.values())
+        for task in tasks:
             task.dag = entity
-            dto = self._task_dao.create(dto=task.as_dto())
+        dtos = self._task_dao.create_many([task.as_dto() for task in tasks])
+        for task, dto in zip(tasks, dtos):
             task.id = dto.id
             entity.update_task(task)
 
@@ -62,17 +64,13 @@ class DAGRepo(RepoABC):
         return result
 
     def get_by_name(self, name: str) -> Entity:
-        result = []
-        dto = self._dag_dao.read_by_name(name)
-        if dto:
-            result = self._oao.read(dto.oid)
-        return result
+        return self._oao.read_by_name(name=name, entity="dag")
 
     def get_all(self) -> dict:
         entities = {}
         dtos = self._dag_dao.read_all()
-        for dto in dtos.values():
-            entity = self._oao.read(oid=dto.oid)
+        objects = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for entity in objects.values():
             if hasattr(entity, "id"):
                 entities[entity.id] = entity
         return entities
@@ -99,6 +97,10 @@ class DAGRepo(RepoABC):
         """Returns True if entity with id exists in the repository."""
         return self._dag_dao.exists(id)
 
+    def exists_many(self, ids: list) -> list:
+        """Returns the ids of those designated that exist in the repository."""
+        return self._dag_dao.exists_many(ids)
+
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         dtos = self._dag_dao.read_all()
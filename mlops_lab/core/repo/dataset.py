@@ -37,7 +37,7 @@ class DatasetRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._dataset_dao.read_all())
+        return self._dataset_dao.count()
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
@@ -45,9 +45,11 @@ class DatasetRepo(RepoABC):
         dto = self._dataset_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for name, dataframe in entity.dataframes.items():
+        dataframes = list(entity.dataframes.values())
+        for dataframe in dataframes:
             dataframe.parent = entity
-            dto = self._dataframe_dao.create(dto=dataframe.as_dto())
+        dtos = self._dataframe_dao.create_many([dataframe.as_dto() for dataframe in dataframes])
+        for dataframe, dto in zip(dataframes, dtos):
             dataframe.id = dto.id
             entity.update_dataframe(dataframe)
 
@@ -63,28 +65,38 @@ class DatasetRepo(RepoABC):
         return result
 
     def get_by_name(self, name: str) -> Entity:
-        result = []
-        dto = self._dataset_dao.read_by_name(name)
-        if dto:
-            result = self._oao.read(dto.oid)
-        return result
+        return self._oao.read_by_name(name=name, entity="dataset")
 
     def get_all(self) -> dict:
         entities = {}
         dtos = self._dataset_dao.read_all()
-        for dto in dtos.values():
-            entity = self._oao.read(oid=dto.oid)
+        objects = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for entity in objects.values():
             if hasattr(entity, "id"):
                 entities[entity.id] = entity
         return entities
 
+    def get_by_stage(self, stage: str) -> dict:
+        """Returns the Datasets of the designated stage, keyed by id."""
+        objects = self._oao.read_where(entity="dataset", stage=stage)
+        return {entity.id: entity for entity in objects.values()}
+
+    def get_by_datasource(self, datasource_oid: str) -> dict:
+        """Returns the Datasets extracted from the designated data source, keyed by id."""
+        objects = self._oao.read_where(entity="dataset", datasource_oid=datasource_oid)
+        return {entity.id: entity for entity in objects.values()}
+
     def update(self, entity: Entity) -> None:
-        """Updates an entity in the database."""
-        for dataframe in entity.dataframes.values():
-            self._dataframe_dao.update(dataframe.as_dto())
+        """Updates an entity in the database.
+
+        Only DataFrames added or replaced since the Dataset was last persisted are rewritten.
+        """
+        for name, dataframe in entity.dataframes.items():
+            if entity.is_dirty(name):
+                self._dataframe_dao.update(dataframe.as_dto())
 
         self._dataset_dao.update(dto=entity.as_dto())  # Update Dataset metadata
-        self._oao.update(entity)  # Persist dataset in object storage
+        self._oao.update(entity)  # Persist changed DataFrames and the Dataset record
 
     def remove(self, id: str) -> None:
         """Removes an entity (and its children) from repository."""
@@ -100,6 +112,10 @@ class DatasetRepo(RepoABC):
         """Returns True if entity with id exists in the repository."""
         return self._dataset_dao.exists(id)
 
+    def exists_many(self, ids: list) -> list:
+        """Returns the ids of those designated that exist in the repository."""
+        return self._dataset_dao.exists_many(ids)
+
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         dtos = self._dataset_dao.read_all()
@@ -37,7 +37,7 @@ class DataSourceRepo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self._datasource_dao.read_all())
+        return self._datasource_dao.count()
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
@@ -45,9 +45,11 @@ class DataSourceRepo(RepoABC):
         dto = self._datasource_dao.create(entity.as_dto())
         entity.id = dto.id
 
-        for datasource_url in entity.urls.values():
+        urls = list(entity.urls.values())
+        for datasource_url in urls:
             datasource_url.parent = entity
-            dto = self._datasource_url_dao.create(dto=datasource_url.as_dto())
+        dtos = self._datasource_url_dao.create_many([url.as_dto() for url in urls])
+        for datasource_url, dto in zip(urls, dtos):
             datasource_url.id = dto.id
             entity.update_url(datasource_url)
 
@@ -63,17 +65,13 @@ class DataSourceRepo(RepoABC):
         return result
 
     def get_by_name(self, name: str) -> Entity:
-        result = []
-        dto = self._datasource_dao.read_by_name(name)
-        if dto:
-            result = self._oao.read(dto.oid)
-        return result
+        return self._oao.read_by_name(name=name, entity="datasource")
 
     def get_all(self) -> dict:
         entities = {}
         dtos = self._datasource_dao.read_all()
-        for dto in dtos.values():
-            entity = self._oao.read(oid=dto.oid)
+        objects = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for entity in objects.values():
             if hasattr(entity, "id"):
                 entities[entity.id] = entity
         return entities
@@ -100,6 +98,10 @@ class DataSourceRepo(RepoABC):
         """Returns True if entity with id exists in the repository."""
         return self._datasource_dao.exists(id)
 
+    def exists_many(self, ids: list) -> list:
+        """Returns the ids of those designated that exist in the repository."""
+        return self._datasource_dao.exists_many(ids)
+
     def print(self) -> None:
         """Prints the repository contents as a DataSourceURL."""
         dtos = self._datasource_dao.read_all()
@@ -38,7 +38,7 @@ class Repo(RepoABC):
         self._oao = self._context.get_oao()
 
     def __len__(self) -> int:
-        return len(self.get_all())
+        return self._dao.count()
 
     def add(self, entity: Entity) -> Entity:
         """Adds an entity to the repository and returns the Entity with the id added."""
@@ -59,15 +59,14 @@ class Repo(RepoABC):
     def get_all(self) -> dict:
         entities = {}
         dtos = self._dao.read_all()
-        for dto in dtos.values():
-            entity = self._oao.read(oid=dto.oid)
+        objects = self._oao.read_many([dto.oid for dto in dtos.values()])
+        for entity in objects.values():
             if hasattr(entity, "id"):
                 entities[entity.id] = entity
         return entities
 
     def get_by_name(self, name: str) -> Entity:
-        dto = self._dao.read_by_name(name)
-        return self._oao.read(dto.oid)
+        return self._oao.read_by_name(name=name, entity=self._entity)
 
     def update(self, entity: Entity) -> None:
         """Updates an entity in the database."""
@@ -84,6 +83,10 @@ class Repo(RepoABC):
         """Returns True if entity with id exists in the repository."""
         return self._dao.exists(id)
 
+    def exists_many(self, ids: list) -> list:
+        """Returns the ids of those designated that exist in the repository."""
+        return self._dao.exists_many(ids)
+
     def print(self) -> None:
         """Prints the repository contents as a DataFrame."""
         df = pd.DataFrame()
@@ -119,5 +119,9 @@ class UnitOfWork(UnitOfWorkABC):
         self._context.rollback()
         self._in_transaction = False
 
+    def wait(self) -> None:
+        """Blocks until saved changes are durable."""
+        self._context.wait()
+
     def close(self) -> None:
         self._context.close()
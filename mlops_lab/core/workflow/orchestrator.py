@@ -73,6 +73,8 @@ class Orchestrator(ABC):
         self._logger.info(msg)
 
     def on_end(self) -> None:
+        # Changes saved by the DAG's tasks are durable before the DAG is recorded as ended.
+        self._uow.wait()
         self._dag.on_end()
         msg = f"DAG {self._dag.name} has ended."
         self._logger.info(msg)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /scripts/benchmarks/odb_codec.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 12:58:21 pm                                              #
+# Modified   : Saturday October 17th 2026 12:58:21 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Object Database Compression Codec Benchmark
+
+Reports the compression ratio and the write and read throughput of the object database for each
+available codec, persisting a Dataset built from the ratings test fixture.
+
+Usage:
+    python -m scripts.benchmarks.odb_codec [--dataframes 5] [--repeat 3]
+"""
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+from mlops_lab.core.database.codec import CODECS
+from mlops_lab.core.database.object import ObjectDBConnection, ObjectDB
+from mlops_lab.core.entity.dataset import Dataset, DataFrame
+from mlops_lab.core.service.io import IOService
+
+RATINGS_FILEPATH = "tests/data/movielens25m/raw/ratings.pkl"
+CODECS_LEVELS = [
+    ("none", None),
+    ("zlib", 1),
+    ("zlib", 6),
+    ("lz4", None),
+    ("zstd", 1),
+    ("zstd", 3),
+    ("zstd", 9),
+]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_dataset(n: int) -> Dataset:
+    ratings = IOService.read(RATINGS_FILEPATH)
+    dataset = Dataset(
+        name="benchmark_dataset",
+        description="Codec Benchmark Dataset",
+        datasource="movielens25m",
+        stage="extract",
+        task_oid=0,
+    )
+    for i in range(n):
+        dataframe = DataFrame(
+            name=f"benchmark_dataframe_{i}",
+            description=f"Codec Benchmark DataFrame {i}",
+            data=ratings,
+            dataset=dataset,
+        )
+        dataset.add_dataframe(dataframe=dataframe)
+    return dataset
+
+
+# ------------------------------------------------------------------------------------------------ #
+def disk_usage(directory: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, filename))
+        for root, _, filenames in os.walk(directory)
+        for filename in filenames
+    )
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(dataset: Dataset, codec: str, level: int, repeat: int) -> dict:
+    """Writes and reads the dataset, returning the bytes on disk and throughput in MB/sec."""
+    directory = tempfile.mkdtemp()
+    os.environ["ODB_LOCATION"] = directory
+    db = ObjectDB(connection=ObjectDBConnection(persistent=True, codec=codec, level=level))
+    db.connect()
+    nbytes = sum(dataframe.size for dataframe in dataset.dataframes.values())
+    write, read = 0, 0
+
+    for _ in range(repeat):
+        db.drop()
+        db.connect()
+        start = perf_counter()
+        db.insert(dataset)
+        db.flush()
+        write += perf_counter() - start
+
+        start = perf_counter()
+        result = db.select(dataset.oid)
+        for dataframe in result.dataframes.values():
+            dataframe.data
+        read += perf_counter() - start
+
+    results = {
+        "disk": disk_usage(directory),
+        "write": repeat * nbytes / write / 1e6,
+        "read": repeat * nbytes / read / 1e6,
+    }
+    db.close()
+    db.drop()
+    return results
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description="Object database compression codec benchmark.")
+    parser.add_argument("--dataframes", type=int, default=5, help="DataFrames in the Dataset.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per codec.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("MODE", "test")
+    os.environ.setdefault("ODB_NAME", "odb.db")
+    dataset = build_dataset(args.dataframes)
+
+    results = {}
+    for codec, level in CODECS_LEVELS:
+        if CODECS[codec].available():
+            results[(codec, level)] = run(dataset, codec=codec, level=level, repeat=args.repeat)
+
+    baseline = results[("none", None)]["disk"]
+    print(f"\nObject database codecs for {args.dataframes} ratings DataFrames")
+    print(100 * "=")
+    print(f"{'Codec':<12}{'Level':>8}{'Disk (MB)':>16}{'Ratio':>12}{'Write MB/sec':>20}{'Read MB/sec':>20}")
+    print(100 * "-")
+    for (codec, level), result in results.items():
+        print(
+            f"{codec:<12}{str(level or '-'):>8}{result['disk'] / 1e6:>16,.1f}"
+            f"{baseline / result['disk']:>12.2f}{result['write']:>20,.1f}{result['read']:>20,.1f}"
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /scripts/benchmarks/odb_cursor.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:12:40 am                                              #
+# Modified   : Saturday October 17th 2026 09:12:40 am                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Object Database Cursor Lifecycle Benchmark
+
+Compares object database throughput with per-operation cursors, i.e. the shelve is opened and
+closed for every select, insert, update and exists, against persistent cursors held open for the
+life of the connection.
+
+Usage:
+    python -m scripts.benchmarks.odb_cursor [--n 10000]
+"""
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+from mlops_lab.core.database.object import ObjectDBConnection, ObjectDB
+from mlops_lab.core.entity.file import File
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_entities(n: int) -> list:
+    return [
+        File(
+            name=f"benchmark_file_{i}",
+            description=f"Benchmark File {i}",
+            datasource_oid="movielens25m",
+            stage="extract",
+            uri=None,
+            task_oid=i,
+        )
+        for i in range(n)
+    ]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def rate(n: int, seconds: float) -> str:
+    return f"{round(n / seconds):>10,} ops/sec"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(entities: list, persistent: bool) -> dict:
+    """Runs the insert, exists, select, update and transactional insert workloads."""
+    os.environ["ODB_LOCATION"] = tempfile.mkdtemp()
+    db = ObjectDB(connection=ObjectDBConnection(persistent=persistent))
+    db.connect()
+    results = {}
+    n = len(entities)
+
+    start = perf_counter()
+    for entity in entities:
+        db.insert(entity)
+    db.flush()
+    results["insert"] = rate(n, perf_counter() - start)
+
+    start = perf_counter()
+    for entity in entities:
+        db.exists(entity.oid)
+    results["exists"] = rate(n, perf_counter() - start)
+
+    start = perf_counter()
+    for entity in entities:
+        db.select(entity.oid)
+    results["select"] = rate(n, perf_counter() - start)
+
+    start = perf_counter()
+    for entity in entities:
+        db.update(entity)
+    db.flush()
+    results["update"] = rate(n, perf_counter() - start)
+
+    db.drop()
+    db.begin()
+    start = perf_counter()
+    for entity in entities:
+        db.insert(entity)
+    db.save()
+    results["transactional insert"] = rate(n, perf_counter() - start)
+
+    db.close()
+    db.drop()
+    return results
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description="Object database cursor lifecycle benchmark.")
+    parser.add_argument("--n", type=int, default=10000, help="Number of entities.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("MODE", "test")
+    os.environ.setdefault("ODB_NAME", "odb.db")
+    entities = build_entities(args.n)
+
+    before = run(entities, persistent=False)
+    after = run(entities, persistent=True)
+
+    print(f"\nObject database throughput for {args.n:,} entities")
+    print(100 * "=")
+    print(f"{'Operation':<24}{'Per-Operation Cursors':>30}{'Persistent Cursors':>30}")
+    print(100 * "-")
+    for operation in before.keys():
+        print(f"{operation:<24}{before[operation]:>30}{after[operation]:>30}")
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Enter Project Name in Workspace Settings                                            #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.6                                                                              #
+# Filename   : /scripts/benchmarks/rdb_backend.py                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : Enter URL in Workspace Settings                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday October 17th 2026 09:58:12 pm                                              #
+# Modified   : Saturday October 17th 2026 09:58:12 pm                                              #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Relational Database Backend Benchmark
+
+Reports the latency of the metadata operations of the data access layer, i.e. create, read, read
+by name, exists, update, and delete of DAG rows, and the throughput of multi-row inserts and
+streaming reads, on the embedded SQLite backend and, if --mysql is designated, on the MySQL
+server configured in the environment.
+
+Usage:
+    python -m scripts.benchmarks.rdb_backend [--n 10000] [--mysql]
+"""
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+import pymysql
+
+from mlops_lab.core.dal.dao import DAGDAO
+from mlops_lab.core.dal.dba import DBA
+from mlops_lab.core.dal.dto import DAGDTO
+from mlops_lab.core.dal.sql.dag import DAGDDL, DAGDML
+from mlops_lab.core.database.relational import Database, DatabaseConnection, SQLiteConnection
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_dtos(n: int) -> list:
+    return [
+        DAGDTO(
+            id=None,
+            oid=f"benchmark_dag_{i}",
+            name=f"benchmark_dag_{i}",
+            description=f"Benchmark DAG {i}",
+            state="created",
+            created=None,
+            modified=None,
+        )
+        for i in range(n)
+    ]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def latency(n: int, seconds: float) -> str:
+    return f"{seconds / n * 1e6:>10,.1f} us/op"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def rate(n: int, seconds: float) -> str:
+    return f"{round(n / seconds):>10,} rows/sec"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run(database: Database, dtos: list) -> dict:
+    """Runs the single-row, multi-row and streaming workloads against a database."""
+    dba = DBA(ddl=DAGDDL, database=database)
+    dba.reset()
+    dao = DAGDAO(dml=DAGDML, database=database)
+    results = {}
+    n = len(dtos)
+
+    start = perf_counter()
+    dtos = [dao.create(dto) for dto in dtos]
+    database.save()
+    results["create"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.read(dto.id)
+    results["read"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.read_by_name(dto.name)
+    results["read by name"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.exists(dto.id)
+    results["exists"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.update(dto)
+    database.save()
+    results["update"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    for dto in dtos:
+        dao.delete(dto.id)
+    database.save()
+    results["delete"] = latency(n, perf_counter() - start)
+
+    start = perf_counter()
+    dao.create_many(dtos)
+    database.save()
+    results["create many"] = rate(n, perf_counter() - start)
+
+    start = perf_counter()
+    count = sum(1 for _ in dao.iter_all())
+    results["iter all"] = rate(count, perf_counter() - start)
+
+    dba.drop()
+    database.close()
+    return results
+
+
+# ------------------------------------------------------------------------------------------------ #
+def main():
+    parser = argparse.ArgumentParser(description="Relational database backend benchmark.")
+    parser.add_argument("--n", type=int, default=10000, help="Number of DAG rows.")
+    parser.add_argument(
+        "--mysql",
+        action="store_true",
+        help="Include the MySQL server. Resets the dag table of the test events database.",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("MODE", "test")
+
+    backends = {
+        "SQLite": Database(
+            connection=SQLiteConnection(location=tempfile.mkdtemp(), database="benchmark")
+        )
+    }
+    if args.mysql:
+        backends["MySQL"] = Database(
+            connection=DatabaseConnection(
+                connector=pymysql.connect, database="mlops_lab_test_events"
+            )
+        )
+    results = {name: run(database, build_dtos(args.n)) for name, database in backends.items()}
+
+    print(f"\nRelational database performance for {args.n:,} DAG rows")
+    print(100 * "=")
+    print(f"{'Operation':<24}" + "".join(f"{name:>30}" for name in results.keys()))
+    print(100 * "-")
+    for operation in results["SQLite"].keys():
+        print(
+            f"{operation:<24}"
+            + "".join(f"{result[operation]:>30}" for result in results.values())
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    main()
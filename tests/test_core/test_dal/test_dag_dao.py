@@ -19,9 +19,12 @@
 import inspect
 from datetime import datetime
 import pytest
+import pandas as pd
+import pymysql
 import logging
 
 from mlops_lab.core.dal.dao import DAGDTO
+from mlops_lab.core.dal.cache import DTOCache
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -443,3 +446,298 @@ class TestDAGDAO:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_create_many_dags(self, clean_container, dags, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        edb = clean_container.dal().edb()
+        dao = clean_container.dal().dag()
+
+        dtos = dao.create_many([dag.as_dto() for dag in dags], batch_size=2)
+        assert len(dtos) == len(dags)
+        ids = [dto.id for dto in dtos]
+        assert all(isinstance(id, int) for id in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+        for dto in dtos:
+            assert dao.read(dto.id).name == dto.name
+
+        edb.save()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_upsert_dag(self, clean_container, dags, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        edb = clean_container.dal().edb()
+        dao = clean_container.dal().dag()
+
+        dto = dao.upsert(dags[0].as_dto())
+        assert isinstance(dto.id, int)
+        id = dto.id
+
+        # A row of the same name is updated in place.
+        dto = dags[0].as_dto()
+        dto.description = "Upserted"
+        dto = dao.upsert(dto)
+        assert dto.id == id
+        assert dao.read(id).description == "Upserted"
+
+        dao.delete(id)
+        with pytest.raises(FileNotFoundError):
+            dao.delete(id)
+        with pytest.raises(FileNotFoundError):
+            dao.update(dto)
+
+        edb.save()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_iter_all_dags(self, loaded_container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = loaded_container.dal().dag()
+        dtos = dao.read_all()
+
+        keyset = list(dao.iter_all(batch_size=2))
+        assert [dto.id for dto in keyset] == sorted(dtos.keys())
+
+        streamed = list(dao.iter_all(batch_size=2, keyset=False))
+        assert sorted(dto.id for dto in streamed) == sorted(dtos.keys())
+        assert all(dto == dtos[dto.id] for dto in streamed)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_count_exists_many(self, loaded_container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dao = loaded_container.dal().dag()
+        dtos = dao.read_all()
+        assert dao.count() == len(dtos)
+
+        dto = next(iter(dtos.values()))
+        assert dao.count(name=dto.name) == 1
+        assert dao.count(name="no such dag") == 0
+        with pytest.raises(ValueError):
+            dao.count(**{"name; DROP TABLE dag": 1})
+
+        ids = list(dtos.keys())
+        assert dao.exists_many(ids + [99999]) == ids
+        assert dao.exists_many([]) == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dto_cache(self, loaded_container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = DTOCache(capacity=100, ttl=60)
+        dao = loaded_container.dal().dag(cache=cache)
+        id = next(iter(dao.read_all().keys()))
+
+        dto = dao.read(id)
+        assert cache.stats["misses"] == 1
+        assert dao.read(id) == dto
+        assert dao.read_by_name(dto.name) == dto
+        assert cache.stats["hits"] == 2
+
+        # Writes invalidate the cached DTO.
+        dto.description = "Cached"
+        dao.update(dto)
+        assert dao.read(id).description == "Cached"
+        assert cache.stats["invalidations"] == 1
+
+        dao.delete(id)
+        assert dao.read(id) == []
+        assert dao.read_by_name(dto.name) == []
+
+        # DTOs read within a transaction are not cached, as they may not be committed.
+        edb = loaded_container.dal().edb()
+        id = next(iter(dao.read_all().keys()))
+        cache.clear()
+        edb.begin()
+        dao.read(id)
+        assert len(cache) == 0
+        edb.rollback()
+        dao.read(id)
+        assert len(cache) == 1
+
+        # Dropping the table clears the cache, as the ids are reused.
+        loaded_container.dba().dag().reset()
+        assert len(cache) == 0
+        assert dao.read(id) == []
+        logger.info(cache.stats)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_bulk_load_dags(self, clean_container, dags, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        edb = clean_container.dal().edb()
+        dao = clean_container.dal().dag()
+
+        report = dao.bulk_load([dag.as_dto() for dag in dags])
+        assert report["method"] == "insert"
+        assert report["rows"] == len(dags)
+
+        data = pd.DataFrame(
+            {
+                "oid": [f"bulk_dag_{i}" for i in range(10)],
+                "name": [f"bulk_dag_{i}" for i in range(10)],
+                "description": ["Tab\tNewline\nBackslash\\"] + [None] * 9,
+                "state": ["created"] * 10,
+            }
+        )
+        report = dao.bulk_load(data, threshold=0)
+        assert report["method"] == "load"
+        assert report["rows"] == 10
+        assert report["rows_per_sec"] > 0
+        assert dao.read_by_name("bulk_dag_0").description == "Tab\tNewline\nBackslash\\"
+        assert dao.read_by_name("bulk_dag_1").description is None
+        assert dao.count() == len(dags) + 10
+
+        # Loads colliding with existing rows on name fail, by either method, and load no row.
+        with pytest.raises(pymysql.err.IntegrityError):
+            dao.bulk_load(data, threshold=0)
+        with pytest.raises(pymysql.err.IntegrityError):
+            dao.bulk_load(data)
+        assert dao.count() == len(dags) + 10
+
+        with pytest.raises(ValueError):
+            dao.bulk_load(data.drop(columns=["state"]))
+
+        edb.save()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -16,11 +16,19 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+import os
 import inspect
 from datetime import datetime
 import pytest
+import pandas as pd
 import logging
-from mlops_lab.core.database.object import ObjectDBConnection
+from mlops_lab.core.database.object import ObjectDBConnection, ObjectDB
+from mlops_lab.core.database.embedded import SQLiteObjectDBConnection
+from mlops_lab.core.database.index import ObjectIndex
+from mlops_lab.core.database.codec import Codec
+from mlops_lab.core.database import blob
+from mlops_lab.core.database.frame import BlobRef
+from mlops_lab.core.entity.dataset import DataFrame, Dataset
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -627,3 +635,934 @@ class TestODB:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dataframe_payloads(self, container, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        db.insert(dataset)
+        frames = db.connection.storage.frames
+        if frames.enabled:
+            for dataframe in dataset.dataframes.values():
+                filepath = os.path.join(frames.location, dataset.oid, f"{dataframe.oid}.arrow")
+                assert os.path.exists(filepath)
+            # The caller's entity retains its payloads.
+            for dataframe in dataset.dataframes.values():
+                assert isinstance(dataframe.data, pd.DataFrame)
+
+        ds2 = db.select(dataset.oid)
+        assert ds2 == dataset
+        for name, dataframe in dataset.dataframes.items():
+            assert ds2.get_dataframe(name) == dataframe
+
+        db.delete(dataset.oid)
+        assert not os.path.exists(os.path.join(frames.location, dataset.oid))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lazy_dataset(self, container, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        db.insert(dataset)
+        if db.connection.storage.frames.enabled:
+            ds2 = db.select(dataset.oid)
+            for dataframe in ds2.dataframes.values():
+                assert not dataframe.is_loaded
+
+            names = list(dataset.dataframes.keys())
+            dataframe = ds2.get_dataframe(names[0])
+            assert dataframe.nrows == dataset.get_dataframe(names[0]).nrows
+            assert not dataframe.is_loaded
+            assert dataframe == dataset.get_dataframe(names[0])
+            assert dataframe.is_loaded
+            for name in names[1:]:
+                assert not ds2.get_dataframe(name).is_loaded
+
+            # Updating a Dataset with deferred payloads retains the payloads.
+            db.update(ds2)
+            ds3 = db.select(dataset.oid)
+            for name, dataframe in dataset.dataframes.items():
+                assert ds3.get_dataframe(name) == dataframe
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_transaction_spill(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=ObjectDBConnection(persistent=True, spill_threshold=1))
+        db.drop()
+        db.begin()
+        for file in files:
+            db.insert(file)
+            assert db.exists(file.oid)
+        # Staged entities exceeding the threshold are held on disk until the commit.
+        assert len(db.connection.cache) == len(files)
+        assert db.connection.cache.nbytes == 0
+        for file in files:
+            assert db.select(file.oid) == file
+        db.save()
+        assert len(db.connection.cache) == 0
+        for file in files:
+            assert db.connection.storage.exists(file.oid)
+        db.close()
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_read_cache(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        for file in files:
+            db.insert(file)
+        hits = db.cache.hits
+        for file in files:
+            assert db.select(file.oid) == file
+            assert file.oid in db.cache
+            assert db.select(file.oid) is db.select(file.oid)
+        assert db.cache.hits == hits + 2 * len(files)
+        assert db.cache.nbytes <= db.cache.capacity
+
+        # Updates and deletes invalidate cached entities.
+        for file in files:
+            file.task_oid = 99
+            db.update(file)
+            assert file.oid not in db.cache
+            assert db.select(file.oid).task_oid == 99
+            db.delete(file.oid)
+            assert file.oid not in db.cache
+            assert db.select(file.oid) == []
+        logger.debug(db.cache.stats)
+        db.drop()
+        assert len(db.cache) == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_codec(self, files, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for codec in ["none", "zlib", "lz4", "zstd"]:
+            db = ObjectDB(connection=ObjectDBConnection(persistent=True, codec=codec))
+            db.drop()
+            db.connect()
+            for file in files:
+                db.insert(file)
+                assert db.select(file.oid) == file
+                with db.connection.storage._session() as cursor:
+                    assert Codec.is_encoded(cursor[file.oid])
+            db.insert(dataset)
+            ds2 = db.select(dataset.oid)
+            for name, dataframe in dataset.dataframes.items():
+                assert ds2.get_dataframe(name) == dataframe
+            db.close()
+
+            # Entities are decoded with the codec that encoded them.
+            db2 = ObjectDB(connection=ObjectDBConnection(persistent=False))
+            for file in files:
+                assert db2.select(file.oid) == file
+            db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_blob(self, ratings, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.blob")
+        blob.dump(ratings, filepath)
+        df = blob.load(filepath)
+        assert df.equals(ratings)
+        # Numeric columns are backed by the memory mapped file, and writes do not reach it.
+        column = df.select_dtypes("number").columns[0]
+        df.loc[0, column] = -1
+        assert blob.load(filepath).equals(ratings)
+
+        ref = BlobRef(filepath)
+        assert ref.load().equals(ratings)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sharded(self, files, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=ObjectDBConnection(persistent=True, shards=4))
+        db.drop()
+        storage = db.connection.storage
+        for file in files:
+            db.insert(file)
+            assert db.exists(file.oid)
+            assert storage.get_shard(file.oid).exists(file.oid)
+        db.insert(dataset)
+        for name, dataframe in dataset.dataframes.items():
+            assert db.select(dataset.oid).get_dataframe(name) == dataframe
+
+        db.begin()
+        for file in files:
+            db.delete(file.oid)
+        db.save()
+        for file in files:
+            assert not db.exists(file.oid)
+
+        db.drop()
+        for shard in storage.shards:
+            assert not os.path.exists(shard.location + ".dat")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sqlite_backend(self, files, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=SQLiteObjectDBConnection())
+        db.drop()
+        db.connect()
+        for file in files:
+            file.task_oid = 0
+            db.insert(file)
+            assert db.exists(file.oid)
+            with pytest.raises(FileExistsError):
+                db.insert(file)
+
+        # Changes in a transaction are visible within it and discarded on rollback.
+        db.begin()
+        for i, file in enumerate(files, start=1):
+            file.task_oid = i + 99
+            db.update(file)
+            assert db.select(file.oid).task_oid == i + 99
+            db.delete(file.oid)
+            assert not db.exists(file.oid)
+        db.rollback()
+        for i, file in enumerate(files, start=1):
+            assert db.select(file.oid).task_oid != i + 99
+
+        db.begin()
+        for file in files:
+            db.delete(file.oid)
+        db.save()
+        for file in files:
+            assert not db.exists(file.oid)
+
+        db.insert(dataset)
+        ds2 = db.select(dataset.oid)
+        for name, dataframe in dataset.dataframes.items():
+            assert ds2.get_dataframe(name) == dataframe
+        db.drop()
+        assert not os.path.exists(db.connection.location + ".sqlite3")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact(self, container, files, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        db.insert(dataset)
+        for file in files:
+            db.insert(file)
+        for i in range(1, 4):
+            for file in files:
+                file.task_oid = i
+                db.update(file)
+        db.delete(dataset.oid)
+
+        report = db.compact()
+        logger.debug(report)
+        assert report["entities"] == len(files)
+        assert report["reclaimed"] > 0
+        assert report["size_after"] == report["size_before"] - report["reclaimed"]
+        for file in files:
+            assert db.select(file.oid).task_oid == 3
+        assert not db.exists(dataset.oid)
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch(self, container, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        oids = [file.oid for file in files]
+        db.insert_many(files[:-1])
+        with pytest.raises(FileExistsError):
+            db.insert_many(files)
+        assert not db.exists(files[-1].oid)
+        assert list(db.select_many(oids)) == oids[:-1]
+
+        db.begin()
+        db.insert_many(files[-1:])
+        db.delete_many(oids[:1])
+        assert list(db.select_many(oids)) == oids[1:]
+        db.rollback()
+        assert list(db.select_many(oids)) == oids[:-1]
+
+        with pytest.raises(FileNotFoundError):
+            db.delete_many(oids)
+        db.delete_many(oids[:-1])
+        assert db.select_many(oids) == {}
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_incremental_update(self, container, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = container.database.odb()
+        db.drop()
+        db.insert(dataset)
+        directory = os.path.join(db.connection.storage.frames.location, dataset.oid)
+
+        def modified() -> dict:
+            return {
+                filename: os.stat(os.path.join(directory, filename)).st_mtime_ns
+                for filename in os.listdir(directory)
+            }
+
+        before = modified()
+        ds2 = db.select(dataset.oid)
+        for dataframe in ds2.dataframes.values():
+            dataframe.data
+        ds2.task_oid = 99
+        db.update(ds2)
+        assert modified() == before
+        assert db.select(dataset.oid).task_oid == 99
+
+        names = list(dataset.dataframes.keys())
+        replacement = DataFrame(
+            name=names[0], data=dataset.get_dataframe(names[1]).data, dataset=ds2
+        )
+        ds2.update_dataframe(replacement)
+        assert ds2.is_dirty(names[0])
+        db.update(ds2)
+        assert not ds2.is_dirty(names[0])
+        after = modified()
+        changed = [filename for filename in after if after[filename] != before.get(filename)]
+        assert len(changed) == 1
+        assert db.select(dataset.oid).get_dataframe(names[0]) == replacement
+
+        # Payloads no longer referenced are removed once their versions are reclaimed.
+        ds2.remove_dataframe(names[-1])
+        db.update(ds2)
+        db.compact()
+        assert len(os.listdir(directory)) == len(names) - 1
+        db.drop()
+
+        # Changes written in a transaction that is rolled back remain to be persisted.
+        db = ObjectDB(connection=SQLiteObjectDBConnection())
+        db.drop()
+        db.connect()
+        db.insert(ds2)
+        ds2.update_dataframe(replacement)
+        db.begin()
+        db.update(ds2)
+        assert ds2.is_dirty(names[0])
+        db.rollback()
+        assert ds2.is_dirty(names[0])
+        db.begin()
+        db.update(ds2)
+        db.save()
+        assert not ds2.is_dirty(names[0])
+        db.close()
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dedup(self, ratings, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=ObjectDBConnection(persistent=True, dedup=True))
+        db.drop()
+        db.connect()
+        if db.connection.storage.frames.dedup:
+            centered = ratings.assign(rating=ratings["rating"] - ratings["rating"].mean())
+            datasets = [
+                Dataset(name="dedup_raw", stage="raw", data=ratings),
+                Dataset(name="dedup_sample", stage="interim", data=ratings.copy()),
+                Dataset(name="dedup_centered", stage="interim", data=centered),
+            ]
+            for dataset in datasets:
+                db.insert(dataset)
+            report = db.dedup_report()
+            logger.debug(report)
+            ncols = len(ratings.columns)
+            assert report["references"] > report["blocks"]
+            assert report["saved_bytes"] > 0
+            for dataset in datasets:
+                ds2 = db.select(dataset.oid)
+                assert ds2.get_dataframe() == dataset.get_dataframe()
+
+            db.delete(datasets[2].oid)
+            assert db.compact()["blocks_collected"] == 1
+            db.delete(datasets[0].oid)
+            assert db.compact()["blocks_collected"] == 0
+            db.delete(datasets[1].oid)
+            assert db.compact()["blocks_collected"] >= ncols
+            assert db.dedup_report()["blocks"] == 0
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_snapshot(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        connections = [
+            ObjectDBConnection(persistent=True),
+            ObjectDBConnection(shards=4),
+            SQLiteObjectDBConnection(),
+        ]
+        for connection in connections:
+            db = ObjectDB(connection=connection)
+            db.drop()
+            db.connect()
+            for file in files:
+                file.task_oid = 0
+            db.insert_many(files)
+
+            # Commits made after the snapshot is taken are not visible through it.
+            snapshot = db.snapshot()
+            for file in files[:-1]:
+                file.task_oid = 99
+                db.update(file)
+            db.delete(files[-1].oid)
+            for file in files[:-1]:
+                assert db.select(file.oid).task_oid == 99
+                assert snapshot.select(file.oid).task_oid == 0
+            assert not db.exists(files[-1].oid)
+            assert snapshot.exists(files[-1].oid)
+            assert len(snapshot.select_many([file.oid for file in files])) == len(files)
+            snapshot.release()
+            with pytest.raises(RuntimeError):
+                snapshot.select(files[0].oid)
+
+            # Versions held only by released snapshots are reclaimed on compaction.
+            with db.snapshot() as snapshot:
+                assert not snapshot.exists(files[-1].oid)
+                assert snapshot.select(files[0].oid).task_oid == 99
+            assert db.compact()["entities"] == len(files) - 1
+            db.close()
+            db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_write_behind(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=ObjectDBConnection(persistent=True), write_behind=True)
+        db.drop()
+        db.connect()
+        assert db.write_behind
+        db.begin()
+        for file in files:
+            db.insert(file)
+        future = db.save()
+
+        # Saved entities are served from the pending writes until written.
+        for file in files:
+            assert db.exists(file.oid)
+            assert db.select(file.oid).oid == file.oid
+        db.begin()
+        db.delete(files[0].oid)
+        db.save()
+        assert not db.exists(files[0].oid)
+        db.wait()
+        assert future.done()
+        assert db.pending == 0
+        assert len(db.select_many([file.oid for file in files])) == len(files) - 1
+
+        # Entities of a failed write remain pending until saved again, or rolled back.
+        write = db.connection.storage.write
+        db.connection.storage.write = lambda items: 1 / 0
+        db.begin()
+        db.delete(files[1].oid)
+        db.save()
+        with pytest.raises(ZeroDivisionError):
+            db.wait()
+        assert db.pending == 1
+        assert not db.exists(files[1].oid)
+        db.connection.storage.write = write
+        db.begin()
+        db.save()
+        db.wait()
+        assert db.pending == 0
+        assert not db.exists(files[1].oid)
+        db.connection.storage.write = lambda items: 1 / 0
+        db.begin()
+        db.delete(files[2].oid)
+        db.save()
+        with pytest.raises(ZeroDivisionError):
+            db.wait()
+        db.rollback()
+        db.connection.storage.write = write
+        assert db.pending == 0
+        assert db.exists(files[2].oid)
+
+        # Connections with native transactions are committed on save.
+        db.close()
+        db.drop()
+        db = ObjectDB(connection=SQLiteObjectDBConnection(), write_behind=True)
+        assert not db.write_behind
+        db.drop()
+        db.connect()
+        db.begin()
+        db.insert(files[0])
+        assert db.save().done()
+        assert db.exists(files[0].oid)
+        db.close()
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_index(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(connection=ObjectDBConnection(persistent=True))
+        db.drop()
+        db.connect()
+        db.insert_many(files)
+        for file in files:
+            assert db.lookup(entity="file", name=file.name) == file.oid
+            assert db.select_by_name(entity="file", name=file.name).oid == file.oid
+        assert db.lookup(entity="dataset", name=files[0].name) is None
+        assert db.find(entity="file", stage="extract") == sorted(file.oid for file in files)
+        assert db.find(datasource_oid=1) == sorted(f.oid for f in files if f.datasource_oid == 1)
+        with pytest.raises(ValueError):
+            db.find(uri="tests")
+
+        # Updates are buffered until flushed, then seen by other processes.
+        files[1].stage = "load"
+        db.update(files[1])
+        assert db.index.pending == 1
+        assert db.find(stage="load") == [files[1].oid]
+        assert ObjectIndex(db.connection.location).find(stage="load") == []
+        db.flush()
+        assert db.index.pending == 0
+        assert ObjectIndex(db.connection.location).find(stage="load") == [files[1].oid]
+        files[1].stage = "extract"
+        db.update(files[1])
+
+        # Staged changes are visible to lookups and discarded on rollback.
+        db.begin()
+        db.delete(files[0].oid)
+        assert db.lookup(entity="file", name=files[0].name) is None
+        assert files[0].oid not in db.find(stage="extract")
+        db.rollback()
+        assert db.lookup(entity="file", name=files[0].name) == files[0].oid
+
+        db.begin()
+        db.delete(files[0].oid)
+        db.save()
+        assert files[0].oid not in db.select_where(entity="file", stage="extract")
+
+        # The index is rebuilt from object storage if missing.
+        db.index.drop()
+        assert len(db.find(entity="file")) == len(files) - 1
+        assert db.reindex() == len(files) - 1
+        db.close()
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cursor_lifecycle(self, files, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Persistent connections hold the shelve open, and reuse it, until closed.
+        connection = ObjectDBConnection(persistent=True)
+        db = ObjectDB(connection=connection)
+        db.drop()
+        db.connect()
+        db.connect()
+        assert connection.is_open
+        assert connection.storage.is_open
+        with connection.storage._session() as cursor:
+            with connection.storage._session() as inner:
+                assert inner is cursor
+        assert connection.storage.is_open
+        db.insert(files[0])
+        db.update(files[0])
+
+        # Changes are committed in one generation once flushed, and seen by other connections.
+        generation = connection.storage.generations.current
+        assert not ObjectDB(connection=ObjectDBConnection(persistent=False)).exists(files[0].oid)
+        db.flush()
+        assert connection.storage.generations.current == generation + 1
+        assert connection.storage.is_open
+        assert ObjectDB(connection=ObjectDBConnection(persistent=False)).exists(files[0].oid)
+        db.insert(files[1])
+        db.close()
+        db.close()
+        assert not connection.is_open
+        assert not connection.storage.is_open
+        reader = ObjectDB(connection=ObjectDBConnection(persistent=False))
+        assert reader.exists(files[1].oid)
+
+        # Otherwise, the shelve is opened and closed for each operation, so connections that
+        # share the object store see one another's changes, and none are lost.
+        writers = [ObjectDB(connection=ObjectDBConnection(persistent=False)) for _ in range(2)]
+        for writer in writers:
+            writer.connect()
+            assert not writer.connection.storage.is_open
+        writers[0].insert(files[2])
+        assert writers[1].exists(files[2].oid)
+        writers[1].insert(files[3])
+        writers[0].insert(files[4])
+        for writer in writers:
+            writer.close()
+        assert all(reader.exists(file.oid) for file in files)
+        db.drop()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
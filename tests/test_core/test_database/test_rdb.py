@@ -22,7 +22,13 @@ import pytest
 import logging
 import pymysql
 
+from mlops_lab.core.dal.dao import DAGDAO
+from mlops_lab.core.dal.dba import DBA
+from mlops_lab.core.dal.sql.dag import DAGDDL, DAGDML
 from mlops_lab.core.dal.sql.file import FileDML
+from mlops_lab.core.dal.sql.rdb import DatabaseDDL
+from mlops_lab.core.database.pool import ConnectionPool
+from mlops_lab.core.database.relational import Database, SQLiteConnection
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -186,6 +192,75 @@ class TestConnection:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_pool(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pool = container.connection.rdb_pool()
+        created = pool.stats()["created"]
+        in_use = pool.stats()["in_use"]
+
+        # Connections are borrowed from, and returned to, the pool.
+        for _ in range(5):
+            cnx = container.connection.rdb_connection()
+            assert cnx.pool is pool
+            cnx.open()
+            assert cnx.is_open
+            assert pool.stats()["in_use"] == in_use + 1
+            # A connection opened again keeps the connection it holds.
+            cnx.open()
+            assert pool.stats()["in_use"] == in_use + 1
+            cnx.close()
+            assert not cnx.is_open
+
+        stats = pool.stats()
+        assert stats["created"] - created <= 1
+        assert stats["in_use"] == in_use
+        assert stats["idle"] >= 1
+
+        # Returned connections cannot be used by the former borrower.
+        with pytest.raises(pymysql.err.InterfaceError):
+            cnx.rollback()
+
+        with pool.connection() as connection:
+            connection.ping(reconnect=False)
+            assert pool.stats()["in_use"] == in_use + 1
+        assert pool.stats()["in_use"] == in_use
+
+        # Borrowers wait for a connection, and time out if none is returned.
+        small = ConnectionPool(connector=pymysql.connect, prefix="DBMS", max_size=1, timeout=0.1)
+        connection = small.borrow()
+        with pytest.raises(TimeoutError):
+            small.borrow()
+        assert small.stats()["timeouts"] == 1
+        small.release(connection)
+        assert small.borrow() is connection
+        small.release(connection)
+        small.close()
+        logger.info(pool.stats())
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
 
 @pytest.mark.rdb
 class TestRDB:  # pragma: no cover
@@ -655,3 +730,105 @@ class TestRDB:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_indexes(self, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for name in ("task", "event"):
+            dba = getattr(container.dba, name)()
+            dba.reset()
+            report = dba.explain()
+            assert len(report) > 0
+            for plan in report:
+                logger.info(plan)
+                assert plan["indexed"], plan["sql"]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sqlite(self, tmp_path, dags, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dbms = Database(connection=SQLiteConnection(location=str(tmp_path)))
+        edb = Database(
+            connection=SQLiteConnection(
+                location=str(tmp_path), database="mlops_lab_test_events", autocommit=True
+            )
+        )
+        database = DBA(ddl=DatabaseDDL, database=dbms)
+        database.reset()
+        assert database.exists()
+
+        dba = DBA(ddl=DAGDDL, database=edb)
+        dba.reset()
+        assert dba.exists()
+        for plan in dba.explain():
+            assert plan["indexed"], plan["sql"]
+
+        dao = DAGDAO(dml=DAGDML, database=edb)
+        dtos = dao.create_many([dag.as_dto() for dag in dags])
+        assert [dto.id for dto in dtos] == list(range(1, len(dags) + 1))
+        assert dao.count() == len(dags)
+        assert dao.exists_many([dtos[0].id, 999]) == [dtos[0].id]
+
+        dto = dao.read(dtos[0].id)
+        assert dto.name == dtos[0].name
+        assert isinstance(dto.created, datetime)
+
+        dto.description = "Upserted"
+        assert dao.upsert(dto).id == dtos[0].id
+        assert dao.read_by_name(dto.name).description == "Upserted"
+        assert [dto.id for dto in dao.iter_all(batch_size=2)] == [dto.id for dto in dtos]
+
+        dao.delete(dtos[0].id)
+        with pytest.raises(FileNotFoundError):
+            dao.delete(dtos[0].id)
+
+        dba.drop()
+        database.drop()
+        assert not database.exists()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)